@@ -0,0 +1,376 @@
+"""
+VectorSim batch - Solves files of vector problems without a display, streaming one JSON solution per line
+
+Only NumPy and the engine are imported, so workers without Tk or matplotlib can run it and the first problem is solved
+right after NumPy loads.
+
+Problems are JSON lines such as {"case": "two_missing_magnitudes", "given": [[1, 2]], "angles": [30, 120],
+"expected": [4, 5]}, or CSV rows with a header naming given_x, given_y, expected_x, expected_y, angle, angle1,
+angle2, magnitude, magnitude1, magnitude2, resultant_magnitude and, when --case is not set, case. An optional id is
+copied to the solution.
+
+Problems may carry units (see units.py): unit is the unit of the answer and of every magnitude, <field>_unit such as
+given_unit or expected_unit overrides it for one field, and angle_unit applies to input and output angles. Each
+chunk is converted with one vectorized pass per field.
+
+Usage: python -m batch problems.jsonl [--case resultant] [--chunk-size 4096] [--timing]
+"""
+import time
+
+START = time.perf_counter()
+
+import argparse
+import csv
+import json
+import sys
+from collections.abc import Callable, Iterable, Iterator
+
+import numpy as np
+
+import engine
+import units
+
+IMPORTED = time.perf_counter()
+
+REQUIRED: dict[str, tuple[str, ...]] = {
+    "resultant": (),
+    "one_missing_vector": ("expected",),
+    "one_missing_direction": ("magnitude", "resultant_magnitude"),
+    "two_missing_magnitudes": ("angles", "expected"),
+    "two_missing_directions": ("magnitudes", "expected"),
+    "missing_magnitude_and_direction": ("angle", "magnitude", "expected")
+}
+
+SHAPES: dict[str, tuple[int, ...]] = {
+    "expected": (2,),
+    "angles": (2,),
+    "magnitudes": (2,),
+    "angle": (),
+    "magnitude": (),
+    "resultant_magnitude": ()
+}
+
+MAGNITUDE_FIELDS = ("given", "expected", "magnitudes", "magnitude", "resultant_magnitude")
+ANGLE_FIELDS = ("angles", "angle")
+
+CSV_PAIRS: dict[str, tuple[str, str]] = {
+    "given": ("given_x", "given_y"),
+    "expected": ("expected_x", "expected_y"),
+    "angles": ("angle1", "angle2"),
+    "magnitudes": ("magnitude1", "magnitude2")
+}
+
+
+def read_jsonl(lines: Iterable[str], case: str | None) -> Iterator[dict]:
+
+    for number, line in enumerate(lines, 1):
+
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as error:
+            yield {"line": number, "error": f"Invalid JSON: {error}"}
+            continue
+
+        if not isinstance(record, dict):
+            yield {"line": number, "error": "Problem must be a JSON object"}
+            continue
+
+        if case is not None:
+            record.setdefault("case", case)
+        yield record
+
+
+def read_csv(lines: Iterable[str], case: str | None) -> Iterator[dict]:
+    """
+    Turns CSV rows into problems, pairing the _x/_y and 1/2 columns into vectors. The given columns hold the sum of
+    the given vectors.
+    """
+    for row in csv.DictReader(lines):
+
+        record: dict = {key: value for key, value in row.items() if key and value not in (None, "")}
+
+        for key, (first, second) in CSV_PAIRS.items():
+            if first in record and second in record:
+                pair = [record.pop(first), record.pop(second)]
+                record[key] = [pair] if key == "given" else pair
+
+        if case is not None:
+            record.setdefault("case", case)
+        yield record
+
+
+def check(record: dict) -> str | None:
+    """
+    Returns why a problem cannot be solved, or None. Numbers are only checked one problem at a time by check_numbers
+    after a whole case failed to convert.
+    """
+    if "error" in record:
+        return record["error"]
+    if not isinstance(record.get("case"), str) or record["case"] not in REQUIRED:
+        return f"Unknown case \"{record.get('case')}\", expected one of {', '.join(REQUIRED)}"
+
+    missing = [key for key in REQUIRED[record["case"]] if key not in record]
+    if missing:
+        return f"Missing {', '.join(missing)}"
+
+    return check_units(record)
+
+
+def check_units(record: dict) -> str | None:
+    """
+    Returns why the units of a problem are unknown or cannot be converted to its answer unit, or None.
+    """
+    field_units = [record[f"{field}_unit"] for field in MAGNITUDE_FIELDS if f"{field}_unit" in record]
+
+    if field_units and "unit" not in record:
+        return "Field units need a unit for the answer"
+
+    for unit in ([record["unit"]] if "unit" in record else []) + field_units:
+        if not isinstance(unit, str) or unit not in units.QUANTITY_OF:
+            return f"Unknown unit \"{unit}\", expected one of {', '.join(units.QUANTITY_OF)}"
+        if units.QUANTITY_OF[unit] != units.QUANTITY_OF[record["unit"]]:
+            return f"Cannot convert {unit} to {record['unit']}"
+
+    angle_unit = record.get("angle_unit", "deg")
+    if not isinstance(angle_unit, str) or angle_unit not in units.ANGLE_UNITS:
+        return f"Unknown angle unit \"{angle_unit}\", expected one of {', '.join(units.ANGLE_UNITS)}"
+
+    return None
+
+
+def has_units(records: list[dict], key: str) -> bool:
+    return any(key in record for record in records)
+
+
+def magnitude_scale(records: list[dict], field: str) -> np.ndarray | None:
+    """
+    Factor of every problem from the unit of a magnitude field to the unit of its answer, or None if no problem of
+    the chunk has units.
+    """
+    if not has_units(records, "unit"):
+        return None
+
+    answer = units.factors([record.get("unit") for record in records])
+    given = units.factors([record.get(f"{field}_unit", record.get("unit")) for record in records])
+    return np.where(np.isnan(answer), 1., given / answer)
+
+
+def angle_units(records: list[dict]) -> list[str | None] | None:
+    return [record.get("angle_unit") for record in records] if has_units(records, "angle_unit") else None
+
+
+def output_angles(records: list[dict], degrees: np.ndarray) -> np.ndarray:
+    """
+    Converts solved angles in degrees to the angle unit of every problem.
+    """
+    names = angle_units(records)
+    return degrees if names is None else units.from_degrees(degrees, names)
+
+
+def check_numbers(record: dict) -> str | None:
+
+    try:
+        given_sums([record])
+        for key in REQUIRED[record["case"]]:
+            column([record], key)
+    except (TypeError, ValueError) as error:
+        return f"Invalid numbers: {error}"
+
+    return None
+
+
+def given_sums(records: list[dict]) -> np.ndarray:
+    """
+    Sums the ragged given vectors of every problem at once into a (M, 1, 2) array, which the engine solvers accept in
+    place of every vector.
+    """
+    given = [np.asarray(record.get("given", []), dtype=float).reshape(-1, 2) for record in records]
+    counts = [len(vectors) for vectors in given]
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    vectors = np.concatenate(given)
+
+    scale = magnitude_scale(records, "given")
+    if scale is not None:
+        vectors = vectors * np.repeat(scale, counts)[:, None]
+
+    x, y, _, _ = engine.batch_resultant(vectors, offsets)
+    return np.stack([x, y], axis=-1)[:, None, :]
+
+
+def column(records: list[dict], key: str) -> np.ndarray:
+    """
+    Stacks one input of every problem, raising ValueError unless each has the shape listed in SHAPES.
+    """
+    values = np.array([record[key] for record in records], dtype=float)
+
+    if values.shape[1:] != SHAPES[key]:
+        raise ValueError(f"{key} must have shape {SHAPES[key]}")
+
+    if key in MAGNITUDE_FIELDS:
+        scale = magnitude_scale(records, key)
+        if scale is not None:
+            values = values * units.per_row(scale, values)
+
+    elif key in ANGLE_FIELDS and angle_units(records) is not None:
+        values = units.to_degrees(values, angle_units(records))
+
+    return values
+
+
+def polar_solution(records: list[dict], vectors: np.ndarray) -> list[dict]:
+
+    r, theta = engine.to_polar(vectors)
+    theta = output_angles(records, theta)
+    return [{"x": x, "y": y, "r": m, "theta": a} for (x, y), m, a in zip(vectors.tolist(), r.tolist(), theta.tolist())]
+
+
+def solve_resultant(records: list[dict], given: np.ndarray) -> list[dict]:
+    return polar_solution(records, engine.resultant(given))
+
+
+def solve_one_missing_vector(records: list[dict], given: np.ndarray) -> list[dict]:
+    return polar_solution(records, engine.one_missing_vector(given, column(records, "expected")))
+
+
+def solve_one_missing_direction(records: list[dict], given: np.ndarray) -> list[dict]:
+
+    angles, count = engine.one_missing_direction(given, column(records, "magnitude"), column(records, "resultant_magnitude"))
+    angles = output_angles(records, angles)
+    return [{"count": n, "angles": branches[:n]} for branches, n in zip(angles.tolist(), count.tolist())]
+
+
+def solve_two_missing_magnitudes(records: list[dict], given: np.ndarray) -> list[dict]:
+
+    magnitudes, singular = engine.two_missing_magnitudes(given, column(records, "angles"), column(records, "expected"))
+    return [{"singular": True} if parallel else {"magnitudes": pair} for pair, parallel in zip(magnitudes.tolist(), singular.tolist())]
+
+
+def solve_two_missing_directions(records: list[dict], given: np.ndarray) -> list[dict]:
+
+    angle1, angle2, count = engine.two_missing_directions(given, column(records, "magnitudes"), column(records, "expected"))
+    angle1, angle2 = output_angles(records, angle1), output_angles(records, angle2)
+    return [{"count": n, "angles": [first, second][:n]} for first, second, n in zip(angle1.tolist(), angle2.tolist(), count.tolist())]
+
+
+def solve_missing_magnitude_and_direction(records: list[dict], given: np.ndarray) -> list[dict]:
+
+    magnitudes, angles, valid = engine.missing_magnitude_and_direction(given, column(records, "angle"), column(records, "magnitude"), column(records, "expected"))
+    angles = output_angles(records, angles)
+    return [
+        {"count": sum(flags), "solutions": [[m, a] for m, a, flag in zip(branch_m, branch_a, flags) if flag]}
+        for branch_m, branch_a, flags in zip(magnitudes.tolist(), angles.tolist(), valid.tolist())
+    ]
+
+
+SOLVERS: dict[str, Callable[[list[dict], np.ndarray], list[dict]]] = {
+    "resultant": solve_resultant,
+    "one_missing_vector": solve_one_missing_vector,
+    "one_missing_direction": solve_one_missing_direction,
+    "two_missing_magnitudes": solve_two_missing_magnitudes,
+    "two_missing_directions": solve_two_missing_directions,
+    "missing_magnitude_and_direction": solve_missing_magnitude_and_direction
+}
+
+
+def solve_chunk(records: list[dict]) -> Iterator[dict]:
+    """
+    Solves a chunk of problems with one vectorized call per case and yields the solutions in input order.
+    """
+    solutions: list[dict] = [{} for _ in records]
+    cases: dict[str, list[int]] = {}
+
+    for i, record in enumerate(records):
+        error = check(record)
+        if error is None:
+            cases.setdefault(record["case"], []).append(i)
+        else:
+            solutions[i] = {"error": error}
+
+    for case, indices in cases.items():
+
+        try:
+            chunk = [records[i] for i in indices]
+            # Overflow and its NaNs are reported per problem by dumps instead of as warnings for the whole chunk.
+            with np.errstate(over="ignore", invalid="ignore"):
+                results = SOLVERS[case](chunk, given_sums(chunk))
+        except (TypeError, ValueError):
+            errors = {i: check_numbers(records[i]) for i in indices}
+            for i, error in errors.items():
+                if error is not None:
+                    solutions[i] = {"error": error}
+            indices = [i for i in indices if errors[i] is None]
+            chunk = [records[i] for i in indices]
+            with np.errstate(over="ignore", invalid="ignore"):
+                results = SOLVERS[case](chunk, given_sums(chunk)) if chunk else []
+
+        for i, solution in zip(indices, results):
+            solutions[i] = solution
+
+    for record, solution in zip(records, solutions):
+        labels = {key: record[key] for key in ("id", "line") if key in record}
+        yield {**labels, "case": record.get("case"), **solution}
+
+
+def dumps(solution: dict) -> str:
+    """
+    Writes a solution as strict JSON, or as an error line with its labels when a result overflowed to an infinity or
+    NaN, which JSON cannot hold.
+    """
+    try:
+        return json.dumps(solution, allow_nan=False)
+    except ValueError:
+        labels = {key: solution[key] for key in ("id", "line", "case") if key in solution}
+        return json.dumps({**labels, "error": "Result is not finite"})
+
+
+def chunks(records: Iterable[dict], size: int) -> Iterator[list[dict]]:
+
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(prog="python -m batch", description="Solve files of vector problems without a display.")
+    parser.add_argument("path", help="JSON lines or CSV problem file, or - for JSON lines on stdin")
+    parser.add_argument("--case", choices=list(SOLVERS), help="case of problems that do not name one")
+    parser.add_argument("--chunk-size", type=int, default=4096, help="problems solved per vectorized call")
+    parser.add_argument("--timing", action="store_true", help="report startup and solve times on stderr")
+    args = parser.parse_args()
+
+    if args.chunk_size < 1:
+        parser.error("chunk size must be positive")
+
+    file = sys.stdin if args.path == "-" else open(args.path, newline="")
+    reader = read_csv if args.path.lower().endswith(".csv") else read_jsonl
+    solve_start = time.perf_counter()
+    count = 0
+
+    with file:
+        for chunk in chunks(reader(file, args.case), args.chunk_size):
+            sys.stdout.write("".join(dumps(solution) + "\n" for solution in solve_chunk(chunk)))
+            count += len(chunk)
+
+    sys.stdout.flush()
+
+    if args.timing:
+        elapsed = time.perf_counter() - solve_start
+        gui = sorted(name for name in ("tkinter", "matplotlib", "hdpitkinter") if name in sys.modules)
+        print(f"startup {(IMPORTED - START) * 1e3:.1f} ms (imports), {(solve_start - START) * 1e3:.1f} ms to first problem", file=sys.stderr)
+        print(f"solved {count:,} problems in {elapsed * 1e3:.1f} ms ({count / max(elapsed, 1e-12):,.0f} problems/s)", file=sys.stderr)
+        print(f"GUI modules loaded: {', '.join(gui) or 'none'}", file=sys.stderr)
+
+    return
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,466 @@
+"""
+VectorSim benchmarks - Throughput of the engine solvers and of the window code paths, with peak memory and import times
+
+The window paths run the real case window methods on a headless Agg canvas, with plain stand-ins for the Tk
+variables and widgets, so they cover the NumPy and matplotlib work of a click but not Tk's own layout.
+
+Results can be saved as JSON and compared with an earlier run:
+
+Usage: python benchmark.py [window_paths] [solvers] [simulation] [imports] ... [--sizes 1000 100000] [--json new.json] [--compare old.json]
+"""
+import argparse
+import json
+import math
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+import numpy as np
+
+import engine
+import parallel
+
+# Peak memory costs one more traced run of every path, which --no-memory skips.
+TRACE_MEMORY = True
+
+IMPORTED_MODULES = ("engine", "vector_store", "batch", "main", "matplotlib.figure")
+
+
+def best_time(function: Callable[[], object], repeat: int = 3) -> float:
+    """
+    Returns the best wall time in seconds out of a few runs of the function.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def peak_memory(function: Callable[[], object]) -> int:
+    """
+    Returns the peak bytes allocated by Python and NumPy during one run of the function.
+    """
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(path: str, function: Callable[[], object], repeat: int = 3) -> dict[str, float]:
+    """
+    Best wall time of a path, and its peak memory under a _peak key unless memory tracing is off.
+    """
+    results = {path: best_time(function, repeat)}
+    if TRACE_MEMORY:
+        results[f"{path}_peak"] = peak_memory(function)
+    return results
+
+
+def bench_two_missing_magnitudes(size: int) -> dict[str, float]:
+    """
+    Case 5 - Legacy inv-and-dot loop vs stacked np.linalg.solve vs the engine's Cramer's rule.
+    """
+    rng = np.random.default_rng(0)
+    angles = rng.uniform(0, 360, (size, 2))
+    expected = rng.normal(size=(size, 2))
+    given = np.zeros((size, 0, 2))
+
+    def legacy(count: int) -> None:
+        for angle_array, expected_sum in zip(angles[:count], expected[:count]):
+            angle_rad_array = np.radians(angle_array)
+            matrix = np.array([np.cos(angle_rad_array), np.sin(angle_rad_array)])
+            np.dot(np.linalg.inv(matrix), expected_sum)
+
+    def stacked_solve() -> None:
+        angles_rad = np.radians(angles)
+        matrix = np.stack([np.cos(angles_rad), np.sin(angles_rad)], axis=-2)
+        np.linalg.solve(matrix, expected[..., None])
+
+    def cramer() -> None:
+        engine.two_missing_magnitudes(given, angles, expected)
+
+    results = {
+        **measure("stacked_solve", stacked_solve),
+        **measure("cramer", cramer)
+    }
+    # The legacy loop takes minutes past a hundred thousand problems, so it is timed on a sample and scaled.
+    sample = min(size, 20_000)
+    results["legacy_inv_dot"] = best_time(lambda: legacy(sample), repeat=1) * size / sample
+    return results
+
+
+def bench_running_resultant(size: int) -> dict[str, float]:
+    """
+    Window add/remove session - Re-summing vector_dict after every change vs the plain and compensated running resultant.
+
+    Also reports how far each running resultant drifted from the exact sum of the vectors left at the end.
+    """
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(size, 2)) * 10 ** rng.uniform(-3, 9, (size, 1))
+    removed = rng.permutation(size)[:size * 9 // 10]
+    exact = np.array([math.fsum(column) for column in np.delete(vectors, removed, axis=0).T])
+
+    def full_resum() -> None:
+        vector_dict: dict[int, np.ndarray] = {}
+        for i, vector in enumerate(vectors):
+            vector_dict[i] = vector
+            sum(vector_dict.values())
+        for i in removed:
+            vector_dict.pop(i)
+            sum(vector_dict.values()) if len(vector_dict) else np.array([0., 0.])
+
+    def running(compensated: bool) -> np.ndarray:
+        running_sum = engine.RunningSum(compensated=compensated)
+        for vector in vectors:
+            running_sum.add(vector)
+            running_sum.value
+        for i in removed:
+            running_sum.remove(vectors[i])
+            running_sum.value
+        return running_sum.value
+
+    results = {
+        "running": best_time(lambda: running(False)),
+        "compensated": best_time(lambda: running(True)),
+        "running_error": float(np.abs(running(False) - exact).max()),
+        "compensated_error": float(np.abs(running(True) - exact).max())
+    }
+    # Re-summing is quadratic over the session, so it is only timed while it finishes in reasonable time.
+    if size <= 2_000:
+        results["full_resum"] = best_time(full_resum, repeat=1)
+    return results
+
+
+def bench_parallel_scaling(size: int) -> dict[str, float]:
+    """
+    Case 6 - Process pool scaling of two_missing_directions from 1 worker up to every available core.
+
+    Each timing includes copying the inputs into shared memory and the outputs back, but not starting the pool.
+    """
+    rng = np.random.default_rng(0)
+    given = rng.normal(size=(size, 3, 2))
+    magnitudes = rng.uniform(1, 3, (size, 2))
+    expected = rng.normal(size=(size, 2))
+
+    cores = parallel.cpu_count()
+    counts = sorted({*(2 ** i for i in range(cores.bit_length()) if 2 ** i <= cores), cores})
+    return {
+        f"workers_{workers}": best_time(lambda: engine.two_missing_directions(given, magnitudes, expected, workers=workers))
+        for workers in counts
+    }
+
+
+class HeadlessVar:
+    """
+    Stand-in for tk.StringVar and tk.IntVar.
+    """
+    def __init__(self, value: object = "") -> None:
+
+        self.value = value
+        return
+
+    def get(self) -> object:
+        return self.value
+
+    def set(self, value: object) -> None:
+
+        self.value = value
+        return
+
+
+class HeadlessWidget:
+    """
+    Stand-in for every Tk widget the window paths touch, which accepts and ignores any call.
+    """
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        return lambda *args, **kwargs: None
+
+    def selection(self) -> set[str]:
+        return set()
+
+
+def headless_window(window_class: type, given: np.ndarray) -> tuple[object, Callable[[], None]]:
+    """
+    Builds a case window without Tk holding the given vectors, and returns it with a function that runs the redraws
+    it requested, as the next Tk idle cycle would.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    import main
+    from solve_cache import SolveCache
+    from vector_store import VectorStore
+
+    window = window_class.__new__(window_class)
+    idle: list[Callable[[], None]] = []
+
+    def after_idle(callback: Callable[[], None]) -> str:
+        idle.append(callback)
+        return "idle"
+
+    def run_idle() -> None:
+        while idle:
+            idle.pop(0)()
+        return
+
+    window.after_idle = after_idle
+    window.after = lambda delay, callback: "after"
+    window.after_cancel = lambda after_id: None
+    window.vector_str_vars = {"name": HeadlessVar(), "req1": HeadlessVar(), "req2": HeadlessVar()}
+    window.coordinate = HeadlessVar(0)
+    window.vector_stores = {"given": VectorStore(), "missing": VectorStore(), "Other Angle": VectorStore()}
+    window.vector_colors = {}
+    window.unit_vars = {"quantity": HeadlessVar("displacement"), "magnitude": HeadlessVar("m"), "angle": HeadlessVar("deg")}
+    window.unit_boxes = []
+    window.solve_cache = SolveCache()
+    window.solution_key = None
+    window.resultant_vct = np.array([0., 0.])
+    window.resultant_str_vars = {key: HeadlessVar("0.0000") for key in ("x", "y", "r", "theta")}
+    window.result_str_vars = {key: HeadlessVar("0.000000") for key in ("x", "y", "r", "theta")}
+    window.name_entry = window.req1_entry = window.req2_entry = window.no_solution_label = HeadlessWidget()
+    window.table = HeadlessWidget()
+    window.auto_update = HeadlessVar(0)
+    window.requirements_vars = {"v1_name": HeadlessVar("v1"), "v2_name": HeadlessVar("v2")}
+    window.angle_array = np.array([30., 120.])
+    window.magnitude_array = np.array([2., 3.])
+    window.expected_resultant = np.array([1., 2.])
+    window.view = HeadlessVar(0)
+    window.tip_to_tail = HeadlessVar(False)
+    window.simulation_mode = HeadlessVar("velocity")
+    window.simulate_button = window.frame_stats_label = HeadlessWidget()
+
+    window.fig = Figure()
+    window.canvas = FigureCanvasAgg(window.fig)
+    main.BaseWindow.setup_plane(window)
+
+    window.vector_stores["given"].extend(range(len(given)), given)
+    window.update_vectors()
+    window.get_resultant()
+    window.rescale_graph()
+    run_idle()
+    return window, run_idle
+
+
+def bench_window_paths(size: int) -> dict[str, float]:
+    """
+    Per-click window paths with the given number of vectors listed, each followed by the redraw it requests.
+    """
+    from main import TwoMissingDirections, TwoMissingMagnitudes
+
+    rng = np.random.default_rng(0)
+    given = rng.normal(size=(size, 2)) * 10
+    directions, run_directions_idle = headless_window(TwoMissingDirections, given)
+    magnitudes, run_magnitudes_idle = headless_window(TwoMissingMagnitudes, given)
+    added = iter(range(size, 1 << 62))
+
+    def get_resultant() -> None:
+        directions.get_resultant()
+
+    def rescale_graph() -> None:
+        directions.rescale_graph()
+        run_directions_idle()
+
+    def add_vector() -> None:
+        directions.vector_str_vars["name"].set(f"added{next(added)}")
+        directions.vector_str_vars["req1"].set("1.5")
+        directions.vector_str_vars["req2"].set("-2.5")
+        directions.add_vector()
+        run_directions_idle()
+
+    def find_missing_magnitudes() -> None:
+        magnitudes.find_missing_magnitudes()
+        magnitudes.get_resultant()
+        magnitudes.rescale_graph()
+        run_magnitudes_idle()
+
+    def find_missing_directions() -> None:
+        directions.find_missing_directions()
+        directions.get_resultant()
+        directions.rescale_graph()
+        run_directions_idle()
+
+    return {
+        **measure("get_resultant", get_resultant),
+        **measure("rescale_graph", rescale_graph),
+        **measure("add_vector", add_vector),
+        **measure("find_missing_magnitudes", find_missing_magnitudes),
+        **measure("find_missing_directions", find_missing_directions)
+    }
+
+
+def bench_solvers(size: int) -> dict[str, float]:
+    """
+    Every engine case on the given number of stacked problems with 3 given vectors each.
+    """
+    rng = np.random.default_rng(0)
+    given = rng.normal(size=(size, 3, 2))
+    expected = rng.normal(size=(size, 2))
+    angles = rng.uniform(0, 360, (size, 2))
+    magnitudes = rng.uniform(1, 3, (size, 2))
+
+    return {
+        **measure("resultant", lambda: engine.resultant(given)),
+        **measure("one_missing_vector", lambda: engine.one_missing_vector(given, expected)),
+        **measure("one_missing_direction", lambda: engine.one_missing_direction(given, magnitudes[:, 0], magnitudes[:, 1])),
+        **measure("two_missing_magnitudes", lambda: engine.two_missing_magnitudes(given, angles, expected)),
+        **measure("two_missing_directions", lambda: engine.two_missing_directions(given, magnitudes, expected)),
+        **measure("missing_magnitude_and_direction", lambda: engine.missing_magnitude_and_direction(given, angles[:, 0], magnitudes[:, 0], expected))
+    }
+
+
+def bench_simulation(size: int) -> dict[str, float]:
+    """
+    Frame work of the simulation with one body per given vector, each frame stepping a 60 fps frame interval and
+    blitting the bodies as the window's frame loop does, including the full redraws when the bodies outgrow the view.
+    """
+    from main import SIMULATION_FPS, ResultantWindow
+
+    rng = np.random.default_rng(0)
+    results = {}
+
+    for mode in ("velocity", "force"):
+        window, run_idle = headless_window(ResultantWindow, rng.normal(size=(size, 2)))
+        window.simulation_mode.set(mode)
+        window.start_simulation()
+        run_idle()
+
+        for _ in range(4 * SIMULATION_FPS):
+            window.simulation_clock -= 1 / SIMULATION_FPS
+            window.step_simulation()
+
+        stats = window.frame_stats.summary()
+        results[f"{mode}_frame_p50"] = stats["p50"]
+        results[f"{mode}_frame_p99"] = stats["p99"]
+
+    return results
+
+
+def bench_imports(size: int) -> dict[str, float]:
+    """
+    Time to import each module in a fresh interpreter, best of size runs.
+    """
+    code = "import importlib, sys, time; start = time.perf_counter(); importlib.import_module(sys.argv[1]); print(time.perf_counter() - start)"
+    return {
+        f"import_{module}": min(float(subprocess.run([sys.executable, "-c", code, module], capture_output=True, text=True, check=True).stdout) for _ in range(max(size, 1)))
+        for module in IMPORTED_MODULES
+    }
+
+
+BENCHMARKS: dict[str, Callable[[int], dict[str, float]]] = {
+    "window_paths": bench_window_paths,
+    "solvers": bench_solvers,
+    "simulation": bench_simulation,
+    "imports": bench_imports,
+    "two_missing_magnitudes": bench_two_missing_magnitudes,
+    "running_resultant": bench_running_resultant,
+    "parallel_scaling": bench_parallel_scaling
+}
+
+DEFAULT_SIZES: dict[str, list[int]] = {
+    "window_paths": [10, 1_000, 10_000, 100_000],
+    "solvers": [1_000, 10_000, 100_000, 1_000_000, 10_000_000],
+    "simulation": [1_000, 5_000, 20_000],
+    "imports": [3],
+    "two_missing_magnitudes": [1_000, 100_000, 1_000_000],
+    "running_resultant": [1_000, 100_000, 1_000_000],
+    "parallel_scaling": [1_000_000]
+}
+
+
+def unit(path: str) -> str:
+
+    if path.endswith("_error"):
+        return "abs_error"
+    if path.endswith("_peak"):
+        return "bytes"
+    return "s"
+
+
+def describe(result: dict) -> str:
+    """
+    One printed line of a result, with a throughput for timings of sized benchmarks.
+    """
+    label = f"{result['benchmark']:<24}{result['size']:>12,}  {result['path']:<34}"
+
+    if result["unit"] == "abs_error":
+        return f"{label}{result['value']:>12.3e} abs error"
+    if result["unit"] == "bytes":
+        return f"{label}{result['value'] / 2 ** 20:>12.3f} MiB peak"
+    if result["benchmark"] == "imports":
+        return f"{label}{result['value'] * 1e3:>12.3f} ms"
+    if result["benchmark"] == "simulation":
+        return f"{label}{result['value'] * 1e3:>12.3f} ms{1 / result['value']:>16,.0f} fps max"
+    return f"{label}{result['value'] * 1e3:>12.3f} ms{result['size'] / result['value']:>16,.0f} items/s"
+
+
+def compare(results: list[dict], path: str) -> None:
+    """
+    Prints the ratio of every result to the same result of an earlier run, above 1 meaning slower or larger now.
+    """
+    with open(path) as file:
+        earlier = {(old["benchmark"], old["size"], old["path"]): old["value"] for old in json.load(file)["results"]}
+
+    print(f"\nCompared with {path}:")
+    for result in results:
+        old = earlier.get((result["benchmark"], result["size"], result["path"]))
+        if old and result["unit"] != "abs_error":
+            print(f"{describe(result)}  {result['value'] / old:>8.2f}x")
+
+    return
+
+
+def main() -> None:
+
+    global TRACE_MEMORY
+
+    parser = argparse.ArgumentParser(description="Benchmark the VectorSim engine solvers and window paths.")
+    parser.add_argument("benchmarks", nargs="*", metavar="benchmark", help=f"any of {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument("--sizes", nargs="+", type=int, help="problem or vector counts (default: per benchmark)")
+    parser.add_argument("--json", metavar="PATH", help="save the results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="compare with the JSON results of an earlier run")
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced runs that measure peak memory")
+    args = parser.parse_args()
+
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark \"{name}\"")
+
+    TRACE_MEMORY = not args.no_memory
+    results = []
+
+    for name in args.benchmarks or BENCHMARKS:
+        for size in args.sizes or DEFAULT_SIZES[name]:
+            for path, value in BENCHMARKS[name](size).items():
+                results.append({"benchmark": name, "size": size, "path": path, "value": value, "unit": unit(path)})
+                print(describe(results[-1]), flush=True)
+
+    if args.json:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip()
+        run = {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": commit or None,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.platform(),
+            "cores": parallel.cpu_count(),
+            "results": results
+        }
+        with open(args.json, "w") as file:
+            json.dump(run, file, indent=2)
+
+    if args.compare:
+        compare(results, args.compare)
+
+    return
+
+
+if __name__ == "__main__":
+    main()
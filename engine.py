@@ -0,0 +1,260 @@
+"""
+VectorSim engine - Headless NumPy solvers for every vector addition case
+
+Every solver accepts stacked problems: given vectors of shape (M, N, 2) and expected resultants of shape (M, 2).
+The leading batch axis is optional, so a single problem can be passed as (N, 2) and (2,).
+Angles are in degrees, matching the values entered in the case windows.
+Stacked problems can be split across processes with workers=N, or workers=None for every core (see parallel.py).
+"""
+import numpy as np
+
+
+def from_polar(magnitude: np.ndarray | float, angle: np.ndarray | float) -> np.ndarray:
+    """
+    Converts magnitudes and angles in degrees to X and Y components stacked on the last axis.
+    """
+    angle_rad = np.radians(angle)
+    return np.stack([magnitude * np.cos(angle_rad), magnitude * np.sin(angle_rad)], axis=-1)
+
+
+def to_polar(vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Converts vectors of shape (..., 2) to their magnitudes and angles in degrees.
+    """
+    vectors = np.asarray(vectors, dtype=float)
+    magnitude = np.hypot(vectors[..., 0], vectors[..., 1])
+    angle = np.rad2deg(np.arctan2(vectors[..., 1], vectors[..., 0]))
+    return magnitude, angle
+
+
+def resultant(given: np.ndarray, workers: int | None = 1) -> np.ndarray:
+    """
+    Case 1 - Sums the given vectors of shape (M, N, 2) into resultants of shape (M, 2).
+    """
+    if workers != 1:
+        import parallel
+        return parallel.solve(resultant, given, workers=workers)
+
+    return np.sum(np.asarray(given, dtype=float), axis=-2)
+
+
+class RunningSum:
+    """
+    Running resultant updated in O(1) whenever a vector is added or removed.
+
+    With compensated=True the low-order bits lost by every addition are carried in a separate compensation term
+    (Neumaier summation), so long add/remove sessions do not drift away from the true sum.
+    """
+    def __init__(self, compensated: bool = False) -> None:
+
+        self.compensated = compensated
+        self.total = [0., 0.]
+        self.compensation = [0., 0.]
+        return
+
+    def _accumulate(self, x: float, y: float) -> None:
+
+        for axis, value in enumerate((x, y)):
+
+            total = self.total[axis] + value
+
+            if self.compensated:
+                if abs(self.total[axis]) >= abs(value):
+                    self.compensation[axis] += (self.total[axis] - total) + value
+                else:
+                    self.compensation[axis] += (value - total) + self.total[axis]
+
+            self.total[axis] = total
+
+        return
+
+    def add(self, vector: np.ndarray) -> None:
+        """
+        Adds a vector of shape (2,) to the running resultant.
+        """
+        self._accumulate(float(vector[0]), float(vector[1]))
+        return
+
+    def remove(self, vector: np.ndarray) -> None:
+        """
+        Subtracts a vector of shape (2,) that was previously added from the running resultant.
+        """
+        self._accumulate(-float(vector[0]), -float(vector[1]))
+        return
+
+    def reset(self) -> None:
+        """
+        Resets the running resultant back to exactly zero.
+        """
+        self.total = [0., 0.]
+        self.compensation = [0., 0.]
+        return
+
+    @property
+    def value(self) -> np.ndarray:
+        """
+        Current resultant of shape (2,).
+        """
+        return np.array([self.total[0] + self.compensation[0], self.total[1] + self.compensation[1]])
+
+
+def batch_resultant(vectors: np.ndarray, offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Case 1 - Sums ragged problems stored back to back in a flat (total_vectors, 2) array.
+
+    Problem i owns the rows vectors[offsets[i]:offsets[i + 1]], so offsets has M + 1 entries starting at 0.
+    Returns the X, Y, R and \u03B8 columns of the M resultants.
+    """
+    vectors = np.asarray(vectors, dtype=float).reshape(-1, 2)
+    offsets = np.asarray(offsets, dtype=np.intp)
+    counts = np.diff(offsets)
+
+    if offsets.ndim != 1 or len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(vectors) or (counts < 0).any():
+        raise ValueError("Offsets must start at 0, never decrease, and end at the number of vectors!")
+
+    sums = np.zeros((len(counts), 2))
+    non_empty = counts > 0
+
+    if non_empty.any():
+        sums[non_empty] = np.add.reduceat(vectors, offsets[:-1][non_empty], axis=0)
+
+    r, theta = to_polar(sums)
+    return sums[:, 0], sums[:, 1], r, theta
+
+
+def one_missing_vector(given: np.ndarray, expected: np.ndarray, workers: int | None = 1) -> np.ndarray:
+    """
+    Case 4 - Finds the vector that completes the given vectors to the expected resultant.
+    """
+    if workers != 1:
+        import parallel
+        return parallel.solve(one_missing_vector, given, expected, workers=workers)
+
+    return np.asarray(expected, dtype=float) - resultant(given)
+
+
+def two_missing_magnitudes(given: np.ndarray, angles: np.ndarray, expected: np.ndarray, tolerance: float = 1e-12, workers: int | None = 1) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Case 5 - Finds the magnitudes of two vectors with known angles of shape (M, 2).
+
+    Solves every 2x2 system at once with Cramer's rule. Returns the magnitudes of shape (M, 2) and a singular mask of
+    shape (M,) that flags parallel or near-parallel angle pairs, whose magnitudes are filled with NaN.
+    """
+    if workers != 1:
+        import parallel
+        return parallel.solve(two_missing_magnitudes, given, angles, expected, workers=workers, tolerance=tolerance)
+
+    expected_sum = one_missing_vector(given, expected)
+    angles_rad = np.radians(np.asarray(angles, dtype=float))
+    cos, sin = np.cos(angles_rad), np.sin(angles_rad)
+    determinant = cos[..., 0] * sin[..., 1] - cos[..., 1] * sin[..., 0]
+    singular = np.abs(determinant) <= tolerance
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        magnitude1 = (expected_sum[..., 0] * sin[..., 1] - expected_sum[..., 1] * cos[..., 1]) / determinant
+        magnitude2 = (expected_sum[..., 1] * cos[..., 0] - expected_sum[..., 0] * sin[..., 0]) / determinant
+
+    magnitudes = np.where(singular[..., None], np.nan, np.stack([magnitude1, magnitude2], axis=-1))
+    return magnitudes, singular
+
+
+def _circle_intersection(target: np.ndarray, magnitude1: np.ndarray, magnitude2: np.ndarray, tolerance: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Intersects the circles of two vectors with known magnitudes whose sum must equal the target.
+
+    The number of solutions comes from the triangle inequality discriminant
+    ((m1 + m2)^2 - d^2) * (d^2 - (m1 - m2)^2), where d is the magnitude of the target.
+    Returns the angles of shape (M, 2, 2) indexed by branch then vector, and the solution count (0, 1 or 2) of shape (M,).
+    Branches past the solution count are filled with NaN.
+    """
+    target_magnitude, target_angle = to_polar(target)
+
+    discriminant = ((magnitude1 + magnitude2) ** 2 - target_magnitude ** 2) * (target_magnitude ** 2 - (magnitude1 - magnitude2) ** 2)
+    scale = np.maximum(np.abs(magnitude1) + np.abs(magnitude2), target_magnitude) ** 4
+    tangent = np.abs(discriminant) <= tolerance * scale
+    count = np.where(tangent, 1, np.where(discriminant > 0, 2, 0))
+
+    # 2 * d * m2 * cos(diff) and 2 * d * m2 * sin(diff) of the angle between the target and the second vector
+    angle_diff = np.rad2deg(np.arctan2(
+        np.sqrt(np.where(tangent, 0., np.maximum(discriminant, 0.))),
+        target_magnitude ** 2 + magnitude2 ** 2 - magnitude1 ** 2
+    ))
+
+    branches = []
+    for branch, sign in enumerate((1, -1)):
+        direction2 = from_polar(1., target_angle + sign * angle_diff)
+        angle1 = to_polar(target - magnitude2[..., None] * direction2)[1]
+        angle2 = to_polar(direction2)[1]
+        branches.append(np.where((count > branch)[..., None], np.stack([angle1, angle2], axis=-1), np.nan))
+
+    return np.stack(branches, axis=-2), count
+
+
+def one_missing_direction(given: np.ndarray, magnitude: np.ndarray, resultant_magnitude: np.ndarray, tolerance: float = 1e-12, workers: int | None = 1) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Case 3 - Finds the angle of a vector with a known magnitude of shape (M,) that brings the resultant to the
+    expected magnitude of shape (M,).
+
+    The tip of the resultant lies on a circle around the origin and on a circle around the sum of the given vectors,
+    so there are up to two candidate directions. Returns the angles of both branches of shape (M, 2) and the solution
+    count (0, 1 or 2) of shape (M,). Branches past the solution count are filled with NaN.
+    """
+    if workers != 1:
+        import parallel
+        return parallel.solve(one_missing_direction, given, magnitude, resultant_magnitude, workers=workers, tolerance=tolerance)
+
+    given_sum = resultant(given)
+    magnitude = np.asarray(magnitude, dtype=float)
+    resultant_magnitude = np.asarray(resultant_magnitude, dtype=float)
+
+    # The resultant minus the missing vector is the given sum, so the missing vector points opposite the second circle.
+    angles, count = _circle_intersection(given_sum, resultant_magnitude, magnitude, tolerance)
+    return (angles[..., 1] + 360) % 360 - 180, count
+
+
+def two_missing_directions(given: np.ndarray, magnitudes: np.ndarray, expected: np.ndarray, tolerance: float = 1e-12, workers: int | None = 1) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Case 6 - Finds the angles of two vectors with known magnitudes of shape (M, 2).
+
+    Returns both solution branches as angles of shape (M, 2) and the solution count (0, 1 or 2) of shape (M,).
+    Branches past the solution count are filled with NaN.
+    """
+    if workers != 1:
+        import parallel
+        return parallel.solve(two_missing_directions, given, magnitudes, expected, workers=workers, tolerance=tolerance)
+
+    magnitudes = np.asarray(magnitudes, dtype=float)
+    angles, count = _circle_intersection(one_missing_vector(given, expected), magnitudes[..., 0], magnitudes[..., 1], tolerance)
+    return angles[..., 0, :], angles[..., 1, :], count
+
+
+def missing_magnitude_and_direction(given: np.ndarray, angle: np.ndarray, magnitude: np.ndarray, expected: np.ndarray, tolerance: float = 1e-12, workers: int | None = 1) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Case 7 - Finds the magnitude of vector A with a known angle of shape (M,) and the angle of vector B with a known
+    magnitude of shape (M,).
+
+    With u as the unit vector of A and T as the sum both vectors must make up, |T - a u| = m gives the closed form
+    a = T.u ± sqrt(m^2 - (T x u)^2). Returns A's magnitudes and B's angles of both branches of shape (M, 2) and a
+    validity mask of shape (M, 2). Invalid branches, including the duplicate of a tangent solution and branches where A
+    would point away from its known angle with a negative magnitude, are filled with NaN.
+    """
+    if workers != 1:
+        import parallel
+        return parallel.solve(missing_magnitude_and_direction, given, angle, magnitude, expected, workers=workers, tolerance=tolerance)
+
+    expected_sum = one_missing_vector(given, expected)
+    magnitude = np.asarray(magnitude, dtype=float)
+    direction = from_polar(1., angle)
+    projection = expected_sum[..., 0] * direction[..., 0] + expected_sum[..., 1] * direction[..., 1]
+    rejection = expected_sum[..., 0] * direction[..., 1] - expected_sum[..., 1] * direction[..., 0]
+
+    discriminant = magnitude ** 2 - rejection ** 2
+    tangent = np.abs(discriminant) <= tolerance * np.maximum(magnitude ** 2, rejection ** 2)
+    root = np.sqrt(np.where(tangent, 0., np.maximum(discriminant, 0.)))
+    valid = np.stack([tangent | (discriminant > 0), ~tangent & (discriminant > 0)], axis=-1)
+
+    magnitudes_a = projection[..., None] + np.array([1., -1.]) * root[..., None]
+    valid &= magnitudes_a >= -tolerance * np.maximum(magnitude, np.abs(projection))[..., None]
+    magnitudes_a = np.where(valid, magnitudes_a, np.nan)
+    angles_b = to_polar(expected_sum[..., None, :] - magnitudes_a[..., None] * direction[..., None, :])[1]
+    return magnitudes_a, np.where(valid, angles_b, np.nan), valid
@@ -0,0 +1,112 @@
+"""
+VectorSim load generator - Drives a running solve server and reports its latency percentiles and throughput
+
+Every client keeps up to --pipeline requests in flight on its own connection, with random problems of the chosen
+cases, and the latency of each request is measured from sending it to reading its answer.
+
+Usage: python loadgen.py [--host 127.0.0.1] [--port 8765 | --unix /tmp/vectorsim.sock] [--clients 32] [--requests 20000]
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import numpy as np
+
+from server import CASES
+
+
+def make_problem(case: str, rng: np.random.Generator, index: int) -> bytes:
+    """
+    Random request line of one case with between 1 and 4 given vectors.
+    """
+    problem = {"id": index, "case": case, "given": rng.normal(size=(int(rng.integers(1, 5)), 2)).round(6).tolist()}
+
+    if case in ("one_missing_vector", "two_missing_magnitudes", "two_missing_directions"):
+        problem["expected"] = rng.normal(size=2).round(6).tolist()
+    if case == "two_missing_magnitudes":
+        problem["angles"] = rng.uniform(0, 360, 2).round(3).tolist()
+    if case == "two_missing_directions":
+        problem["magnitudes"] = rng.uniform(0.5, 3, 2).round(6).tolist()
+
+    return json.dumps(problem).encode() + b"\n"
+
+
+async def client(connect, lines: list[bytes], pipeline: int, latencies: list[float]) -> int:
+    """
+    Sends every line over one connection with at most pipeline requests awaiting answers, and returns the number of
+    error answers.
+    """
+    reader, writer = await connect()
+    sent: asyncio.Queue[float] = asyncio.Queue()
+    window = asyncio.Semaphore(pipeline)
+    errors = 0
+
+    async def send() -> None:
+        for line in lines:
+            await window.acquire()
+            sent.put_nowait(time.perf_counter())
+            writer.write(line)
+            await writer.drain()
+
+    sending = asyncio.create_task(send())
+
+    for _ in lines:
+        answer = await reader.readline()
+        latencies.append(time.perf_counter() - await sent.get())
+        window.release()
+        errors += "error" in json.loads(answer)
+
+    await sending
+    writer.close()
+    await writer.wait_closed()
+    return errors
+
+
+async def run(args: argparse.Namespace) -> None:
+
+    if args.unix is not None:
+        connect = lambda: asyncio.open_unix_connection(args.unix)
+    else:
+        connect = lambda: asyncio.open_connection(args.host, args.port)
+
+    rng = np.random.default_rng(args.seed)
+    cases = args.case or list(CASES)
+    lines = [make_problem(cases[i % len(cases)], rng, i) for i in range(args.requests)]
+    latencies: list[float] = []
+
+    start = time.perf_counter()
+    errors = await asyncio.gather(*(client(connect, lines[i::args.clients], args.pipeline, latencies) for i in range(args.clients)))
+    elapsed = time.perf_counter() - start
+
+    p50, p90, p99, worst = np.percentile(np.array(latencies) * 1e3, [50, 90, 99, 100])
+    print(f"{len(latencies):,} requests from {args.clients} clients ({args.pipeline} in flight each) in {elapsed:.3f} s")
+    print(f"throughput  {len(latencies) / max(elapsed, 1e-12):,.0f} requests/s")
+    print(f"latency     p50 {p50:.3f} ms  p90 {p90:.3f} ms  p99 {p99:.3f} ms  max {worst:.3f} ms")
+    print(f"errors      {sum(errors):,}")
+    return
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description="Measure the latency and throughput of a VectorSim solve server.")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP address of the server")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port of the server")
+    parser.add_argument("--unix", metavar="PATH", help="connect to a Unix socket instead of TCP")
+    parser.add_argument("--clients", type=int, default=32, help="concurrent connections")
+    parser.add_argument("--pipeline", type=int, default=1, help="requests in flight per connection")
+    parser.add_argument("--requests", type=int, default=20_000, help="total requests sent")
+    parser.add_argument("--case", action="append", choices=CASES, help="case to send, repeatable (default: every case)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the problems")
+    args = parser.parse_args()
+
+    if min(args.clients, args.pipeline, args.requests) < 1:
+        parser.error("clients, pipeline and requests must be positive")
+
+    args.clients = min(args.clients, args.requests)
+    asyncio.run(run(args))
+    return
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,134 @@
 """
 VectorSim - Python Program for simulating vectors and computing for unknown variables
+
+matplotlib and its Tk backend are only imported once the first case window opens, or in the background after the
+launcher shows, so the launcher appears right away. Run with --timing to report startup times on stderr, and with
+--profile to time every callback of the case windows (see profiling.py).
 """
+import time
+
+START = time.perf_counter()
+
+import argparse
+import importlib
+import sys
+import threading
 import tkinter as tk
-import warnings
+from collections.abc import Callable
 from tkinter import ttk
+from tkinter.filedialog import askopenfilename
 from tkinter.messagebox import showerror
+from typing import TYPE_CHECKING
 
 import numpy as np
 from hdpitkinter import HdpiTk
-from matplotlib.axes import Axes
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk  # type: ignore
-from matplotlib.figure import Figure
-from matplotlib.quiver import Quiver
 
-warnings.simplefilter("error", category=RuntimeWarning)
+import engine
+import simulation
+import units
+import vector_io
+from profiling import PROFILER, ProfilerPanel, profiled
+from simulation import FrameStats, Simulation
+from solve_cache import SolveCache
+from vector_store import VectorStore
+from vector_table import VectorTable
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.collections import LineCollection, PathCollection
+    from matplotlib.lines import Line2D
+    from matplotlib.projections.polar import PolarAxes
+    from matplotlib.quiver import Quiver
+
+PLOTTING_MODULES = ("matplotlib.figure", "matplotlib.backends.backend_tkagg")
+
+# Arrows are animated so full redraws leave them out of the cached background and only they get blitted over it.
+QUIVER_STYLE = {"scale": 1, "scale_units": "xy", "angles": "xy", "width": 0.0075, "animated": True}
+
+# Colors of the categories whose vectors are not each given their own color.
+CATEGORY_COLORS = {"given": "g", "missing": "r", "Other Angle": "#cf4a49", "resultant": "black"}
+
+SIMULATION_FPS = 60
+
+
+def set_arrows(quiver: "Quiver", tails: np.ndarray, u: np.ndarray, v: np.ndarray) -> None:
+    """
+    Replaces every arrow of a Quiver in place, including how many there are.
+
+    Quiver has no public setter for its arrow count or tails, so this sets the N, XY, X and Y attributes that its
+    constructor fills in and its draw reads, which was checked against matplotlib 3.11. Everything else goes through
+    set_offsets and set_UVC.
+    """
+    quiver.N = len(tails)
+    quiver.XY = tails
+    quiver.X, quiver.Y = tails.T
+    quiver.set_offsets(tails)
+    quiver.set_UVC(u, v)
+    return
+
+
+class StartupTimer:
+    """
+    Reports the time to show the launcher and to draw the first case window on stderr.
+    """
+    def __init__(self) -> None:
+
+        self.enabled = False
+        self.window_opened: float | None = None
+        self.window_drawn = False
+        return
+
+    def report(self, event: str, since: float = START) -> None:
+
+        if self.enabled:
+            print(f"{event:<22}{(time.perf_counter() - since) * 1e3:>10.1f} ms", file=sys.stderr)
+        return
+
+    def launcher_shown(self) -> None:
+        self.report("time-to-launcher")
+        return
+
+    def open_window(self) -> None:
+
+        if self.window_opened is None:
+            self.window_opened = time.perf_counter()
+        return
+
+    def draw_window(self) -> None:
+
+        if self.window_opened is not None and not self.window_drawn:
+            self.window_drawn = True
+            self.report("time-to-first-window")
+            self.report("first window from click", self.window_opened)
+        return
+
+
+STARTUP_TIMER = StartupTimer()
+
+
+def prewarm_plotting() -> threading.Thread:
+    """
+    Imports matplotlib and its Tk backend on a daemon thread, so the first case window finds them already loaded.
+    """
+    def load() -> None:
+        for module in PLOTTING_MODULES:
+            importlib.import_module(module)
+        STARTUP_TIMER.report("plotting prewarmed")
+
+    thread = threading.Thread(target=load, name="prewarm-plotting", daemon=True)
+    thread.start()
+    return thread
 
 
 class BaseWindow(tk.Toplevel):
     """
     Base window for each case with a control panel, table, resultant, and graphing plane.
     """
-    def __init__(self, master: tk.Tk, min_width: int = 900, min_height: int = 700) -> None:
+    def __init__(self, master: tk.Tk, min_width: int = 900, min_height: int = 700, compensated_sum: bool = False) -> None:
+
+        STARTUP_TIMER.open_window()
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk  # type: ignore
+        from matplotlib.figure import Figure
 
         super().__init__(master=master)
         self.title("VectorSim")
@@ -35,8 +143,14 @@ class BaseWindow(tk.Toplevel):
             "req2": tk.StringVar(self)
         }
         self.coordinate: tk.IntVar = tk.IntVar(self, value=0)
-        self.vector_dict: dict[str, np.ndarray] = {}
-        self.quiver_dict: dict[str, Quiver] = {}
+        self.vector_stores: dict[str, VectorStore] = {
+            "given": VectorStore(compensated=compensated_sum),
+            "missing": VectorStore(),
+            "Other Angle": VectorStore()
+        }
+        self.vector_colors: dict[str, str] = {}
+        self.solve_cache = SolveCache()
+        self.solution_key: tuple | None = None
         self.resultant_vct: np.ndarray = np.array([0., 0.])
         self.resultant_str_vars: dict[str, tk.StringVar] = {
             "x": tk.StringVar(self, "0.0000"),
@@ -72,28 +186,42 @@ class BaseWindow(tk.Toplevel):
         self.add_vector_button = ttk.Button(self.vector_frame, text="Add vector")
         self.add_vector_button.grid(column=0, row=3, columnspan=4, sticky="ew", padx=10, pady=5)
         self.remove_vector_button = ttk.Button(self.vector_frame, text="Remove vector")
-        self.remove_vector_button.grid(column=0, row=4, columnspan=4, sticky="ew", padx=10, pady=5)
+        self.remove_vector_button.grid(column=0, row=4, columnspan=2, sticky="ew", padx=10, pady=5)
+        ttk.Button(self.vector_frame, text="Move up", command=lambda: self.move_vector(-1)).grid(column=2, row=4, sticky="ew", padx=(10, 5), pady=5)
+        ttk.Button(self.vector_frame, text="Move down", command=lambda: self.move_vector(1)).grid(column=3, row=4, sticky="ew", padx=(5, 10), pady=5)
         self.clear_all_button = ttk.Button(self.vector_frame, text="Clear all vectors")
-        self.clear_all_button.grid(column=0, row=5, columnspan=4, sticky="ew", padx=10, pady=(5, 10))
-
-        self.tree = ttk.Treeview(master=self, columns=("name", "x", "y", "rm", "r_theta"), show="tree headings")
-        self.tree.grid(column=1, row=0, sticky="nsew")
-        self.tree.column("#0", width=70, anchor="w")
-        self.tree.column("name", width=50, anchor="w")
-        self.tree.column("x", width=70, anchor="e")
-        self.tree.column("y", width=70, anchor="e")
-        self.tree.column("rm", width=70, anchor="e")
-        self.tree.column("r_theta", width=70, anchor="e")
-        self.tree.heading("name", text="Name")
-        self.tree.heading("x", text="X")
-        self.tree.heading("y", text="Y")
-        self.tree.heading("rm", text="R")
-        self.tree.heading("r_theta", text="\u03B8")
-
-        self.tree_entries = {
-            "given": self.tree.insert("", "end", text="Given"),
-            "missing": self.tree.insert("", "end", text="Missing")
-            }
+        self.clear_all_button.grid(column=0, row=5, columnspan=4, sticky="ew", padx=10, pady=5)
+        self.import_button = ttk.Button(self.vector_frame, text="Import vectors...", command=self.import_vectors)
+        self.import_button.grid(column=0, row=6, columnspan=4, sticky="ew", padx=10, pady=(5, 10))
+
+        # Numbers entered without a unit are in these units, and can only be switched while no vector is listed.
+        self.unit_vars: dict[str, tk.StringVar] = {
+            "quantity": tk.StringVar(self, "displacement"),
+            "magnitude": tk.StringVar(self, "m"),
+            "angle": tk.StringVar(self, "deg")
+        }
+        self.units_frame = ttk.Labelframe(self.control_panel, text="Units")
+        self.units_frame.grid(column=0, row=1, sticky="new", padx=10)
+        for column in range(3):
+            self.units_frame.grid_columnconfigure(column, weight=1)
+
+        ttk.Label(self.units_frame, text="Quantity").grid(column=0, row=0, sticky="w", padx=10)
+        ttk.Label(self.units_frame, text="Magnitude").grid(column=1, row=0, sticky="w", padx=10)
+        ttk.Label(self.units_frame, text="Angle").grid(column=2, row=0, sticky="w", padx=10)
+        self.unit_boxes: list[ttk.Combobox] = [
+            ttk.Combobox(self.units_frame, textvariable=self.unit_vars["quantity"], values=list(units.QUANTITIES), state="readonly", width=12),
+            ttk.Combobox(self.units_frame, textvariable=self.unit_vars["magnitude"], values=list(units.QUANTITIES["displacement"]), state="readonly", width=8),
+            ttk.Combobox(self.units_frame, textvariable=self.unit_vars["angle"], values=list(units.ANGLE_UNITS), state="readonly", width=8)
+        ]
+        for column, box in enumerate(self.unit_boxes):
+            box.grid(column=column, row=1, sticky="ew", padx=10, pady=(0, 10))
+        self.unit_boxes[0].bind("<<ComboboxSelected>>", self.select_quantity)
+        self.unit_boxes[2].bind("<<ComboboxSelected>>", self.select_angle_unit)
+
+        self.table = VectorTable(self)
+        self.table.grid(column=1, row=0, sticky="nsew")
+        self.table.add_section("given", "Given", self.vector_stores["given"])
+        self.table.add_section("missing", "Missing", self.vector_stores["missing"])
 
         self.resultant_canvas = tk.Frame(self)
         self.resultant_canvas.grid(column=1, row=1, sticky="nsew", padx=10)
@@ -116,144 +244,139 @@ class BaseWindow(tk.Toplevel):
         ttk.Label(self.resultant_canvas, textvariable=self.resultant_str_vars["theta"]).grid(column=7, row=0, sticky="nsw", pady=10)
 
         self.fig = Figure()
-        self.plot: Axes = self.fig.subplots()
-        self.plot.set_aspect("equal")
-        self.plot.set_box_aspect(1.25)
-        self.plot.grid()
         self.canvas = FigureCanvasTkAgg(figure=self.fig, master=self)
         self.canvas.get_tk_widget().grid(column=2, row=0, sticky="nsew")
         self.toolbar = NavigationToolbar2Tk(self.canvas, self, pack_toolbar=False)
         self.toolbar.grid(column=2, row=1, sticky="sew")
-
-        self.resultant_plot: Quiver = self.plot.quiver(0, 0, color="black", scale=1, scale_units="xy", angles="xy")
+        self.setup_plane()
+
+        self.view = tk.IntVar(self, value=0)
+        self.tip_to_tail = tk.BooleanVar(self, value=False)
+        ttk.Checkbutton(self.toolbar, text="Tip to tail", variable=self.tip_to_tail, command=self.switch_chain).pack(side="right", padx=(0, 10))
+        ttk.Radiobutton(self.toolbar, text="Polar", variable=self.view, value=1, command=self.switch_view).pack(side="right", padx=(0, 10))
+        ttk.Radiobutton(self.toolbar, text="Cartesian", variable=self.view, value=0, command=self.switch_view).pack(side="right")
+
+        self.simulation_mode = tk.StringVar(self, "velocity")
+        self.simulate_frame = ttk.Labelframe(self.control_panel, text="Simulation")
+        self.simulate_frame.grid(column=0, row=4, sticky="sew", padx=10, pady=(0, 10))
+        self.simulate_frame.grid_columnconfigure(0, weight=1)
+        self.simulate_frame.grid_columnconfigure(1, weight=1)
+
+        ttk.Combobox(self.simulate_frame, textvariable=self.simulation_mode, values=list(simulation.MODES), state="readonly", width=12).grid(column=0, row=0, sticky="ew", padx=10, pady=10)
+        self.simulate_button = ttk.Button(self.simulate_frame, text="Simulate", command=self.toggle_simulation)
+        self.simulate_button.grid(column=1, row=0, sticky="ew", padx=10, pady=10)
+        self.frame_stats_label = ttk.Label(self.simulate_frame, font="TkFixedFont")
+        self.frame_stats_label.grid(column=0, row=1, columnspan=2, sticky="w", padx=10, pady=(0, 10))
+
+        if PROFILER.enabled:
+            self.profiler_panel = ProfilerPanel(self.control_panel)
+            self.profiler_panel.grid(column=0, row=5, sticky="sew", padx=10, pady=10)
 
         self.protocol("WM_DELETE_WINDOW", self.close)
         self.rescale_graph()
 
         return
 
-    def remove_vector(self) -> None:
+    def setup_plane(self) -> None:
         """
-        Remove the selected vector from the list.
+        Adds the Cartesian plane and the hidden polar plane with their arrows to the figure of the canvas, which
+        benchmark.py also does on a headless canvas.
         """
-        selected = self.tree.selection()
-
-        if len(selected) == 0:
-
-            showerror("Error", "No vector selected on the table!")
-
-        elif selected[0] in self.tree_entries.values():
-
-            showerror("Error", "Cannot remove top category")
-
-        else:
-
-            for name in selected:
-                self.vector_dict.pop(name)
-                self.quiver_dict.pop(name).remove()
-                self.tree.delete(name)
+        from matplotlib.collections import LineCollection
 
-            self.get_resultant()
-            self.rescale_graph()
+        self.plot: "Axes" = self.fig.subplots()
+        self.plot.set_aspect("equal")
+        self.plot.set_box_aspect(1.25)
+        self.plot.grid()
 
+        self.quivers: dict[str, "Quiver"] = {
+            category: self.plot.quiver(*np.zeros((4, 0)), alpha=0.5, color=CATEGORY_COLORS[category], **QUIVER_STYLE)
+            for category in ("given", "missing", "Other Angle")
+        }
+        self.resultant_plot: "Quiver" = self.plot.quiver(0, 0, 0, 0, color="black", **QUIVER_STYLE)
+
+        # Polar arrows are radial segments from the pole with a dot at the tip, drawn from the cached magnitudes and angles.
+        self.polar_plot: "PolarAxes" = self.fig.add_subplot(projection="polar")
+        self.polar_plot.set_visible(False)
+        self.polar_lines: dict[str, "LineCollection"] = {}
+        self.polar_tips: dict[str, "PathCollection"] = {}
+
+        for category, color in CATEGORY_COLORS.items():
+            alpha = 1 if category == "resultant" else 0.5
+            self.polar_lines[category] = self.polar_plot.add_collection(LineCollection([], colors=color, linewidths=2, alpha=alpha, animated=True), autolim=False)
+            self.polar_tips[category] = self.polar_plot.scatter([], [], s=16, c=color, alpha=alpha, animated=True)
+
+        # Bodies of the simulation, one per given vector and one for the resultant, shown instead of the Cartesian arrows.
+        # Opaque edgeless line markers are stamped from one cached bitmap, which draws thousands of them in a frame.
+        self.bodies: "Line2D" = self.plot.plot([], [], "o", color=CATEGORY_COLORS["given"], markersize=3, markeredgewidth=0, animated=True)[0]
+        self.resultant_body: "Line2D" = self.plot.plot([], [], "o", color=CATEGORY_COLORS["resultant"], markersize=7, animated=True)[0]
+        self.simulation: Simulation | None = None
+        self.frame_stats = FrameStats(SIMULATION_FPS)
+        self.simulation_id: str | None = None
+        self.simulation_origin = 0.
+        self.simulation_clock = 0.
+
+        self.polar_view = False
+        self.stale_categories: set[str] = set()
+        self.background = None
+        self.background_limits: tuple[tuple[float, float], tuple[float, float]] | None = None
+        self.redraw_id: str | None = None
+        self.canvas.mpl_connect("draw_event", self.on_draw)
         return
 
-    def get_resultant(self) -> tuple[float, float, float, float]:
+    def select_quantity(self, event=None) -> None:
         """
-        Get the resultant of the vectors listed on the table
+        Lists the magnitude units of the selected quantity, starting from its SI unit, and simulates its vectors as what
+        they are.
         """
-        self.resultant_vct = sum(self.vector_dict.values()) if len(self.vector_dict) else np.array([0., 0.])  # type: ignore
-        x: float = self.resultant_vct[0]
-        y: float = self.resultant_vct[1]
-        r: float = np.hypot(*self.resultant_vct)
-        theta: float = np.rad2deg(np.arctan2(self.resultant_vct[1], self.resultant_vct[0]))
-        self.resultant_str_vars["x"].set(value=f"{x: .4f}")  # type: ignore
-        self.resultant_str_vars["y"].set(value=f"{y: .4f}")  # type: ignore
-        self.resultant_str_vars["r"].set(value=f"{r: .4f}")
-        self.resultant_str_vars["theta"].set(value=f"{theta: .4f}")  # type: ignore
-        self.resultant_plot.remove()
-        self.resultant_plot = self.plot.quiver(*self.resultant_vct, color="black", scale=1, scale_units="xy", angles="xy")  # type: ignore
-        return x, y, r, theta
+        quantity = self.unit_vars["quantity"].get()
+        choices = list(units.QUANTITIES[quantity])
+        self.unit_boxes[1].configure(values=choices)
+        self.unit_vars["magnitude"].set(choices[0])
+        self.simulation_mode.set(simulation.QUANTITY_MODES[quantity])
+        return
 
-    def rescale_graph(self, include: dict[str, np.ndarray] | None = None) -> None:
+    def select_angle_unit(self, event=None) -> None:
         """
-        Rescales the canvas to fit all vectors on the screen.
+        Shows every angle in the selected unit, as the entries take them.
         """
-        x = [i[0] for i in self.vector_dict.values()] + [self.resultant_vct[0]]
-        y = [i[1] for i in self.vector_dict.values()] + [self.resultant_vct[1]]
-
-        if include:
-            for i in include.values():
-                x.append(i[0])
-                y.append(i[1])
-
-        x_min, x_max = np.floor(min(*x, 0)) - 1, np.ceil(max(*x, 0)) + 1
-        y_min, y_max = np.floor(min(*y, 0)) - 1, np.ceil(max(*y, 0)) + 1
-        x_mid = (x_min + x_max) / 2
-        y_mid = (y_min + y_max) / 2
-        x_range = x_max - x_min
-        y_range = y_max - y_min
-
-        if 1.25 * x_range > y_range:
-            self.plot.set_xlim(x_mid - x_range / 2, x_mid + x_range / 2)
-            self.plot.set_ylim(y_mid - x_range / 2 * 1.25, y_mid + x_range / 2 * 1.25)
-        else:
-            self.plot.set_xlim(x_mid - y_range / 2 / 1.25, x_mid + y_range / 2 / 1.25)
-            self.plot.set_ylim(y_mid - y_range / 2, y_mid + y_range / 2)
-
-        self.canvas.draw()
+        self.table.set_angle_unit(self.unit_vars["angle"].get())
+        self.get_resultant()
         return
 
-    def close(self) -> None:
+    def display_angle(self, degrees: float) -> float:
         """
-        Closes the vector canvas and program window.
+        Converts an angle in degrees counterclockwise from +X to the window's angle unit for display.
         """
-        self.canvas.callbacks.process('close_event')
-        self.master.focus_set()
-        self.destroy()
-        return
-
-
-class ResultantWindow(BaseWindow):
-    """
-    Window Class made for getting the resultant of the given vectors
-    """
-    def __init__(self, master: tk.Tk, min_width: int = 900, min_height: int = 700) -> None:
-        super().__init__(master, min_width, min_height)
+        unit = self.unit_vars["angle"].get()
+        return float(degrees) if unit == "deg" else float(units.from_degrees(degrees, unit))
 
-        self.resultant_frame = ttk.LabelFrame(self.control_panel, text="Resultant (Black)")
-        self.resultant_frame.grid(column=0, row=2, sticky="new", padx=10, pady=10)
-        self.resultant_frame.grid_columnconfigure(0, weight=1)
-        self.resultant_frame.grid_columnconfigure(1, weight=1)
-        self.resultant_frame.grid_columnconfigure(2, weight=1)
-        self.resultant_frame.grid_columnconfigure(3, weight=1)
-        self.resultant_frame.grid_rowconfigure(0, weight=1)
-        self.resultant_frame.grid_rowconfigure(1, weight=1)
-
-        self.result_str_vars: dict[str, tk.StringVar] = {
-            "x": tk.StringVar(self, "0.000000"),
-            "y": tk.StringVar(self, "0.000000"),
-            "r": tk.StringVar(self, "0.000000"),
-            "theta": tk.StringVar(self, "0.000000")
-        }
+    def parse_magnitude(self, text: str) -> float:
+        """
+        Reads a magnitude or component entry such as "12.5" or "3 km" in the window's magnitude unit.
+        Raises ValueError for anything else.
+        """
+        value, unit = units.split(text)
+        return float(units.convert(value, unit, self.unit_vars["magnitude"].get()))
 
-        ttk.Label(self.resultant_frame, text="X = ").grid(column=0, row=0, sticky="w", padx=20, pady=5)
-        ttk.Label(self.resultant_frame, textvariable=self.result_str_vars["x"]).grid(column=1, row=0, sticky="e", padx=20, pady=5)
-        ttk.Label(self.resultant_frame, text="R = ").grid(column=2, row=0, sticky="w", padx=20, pady=5)
-        ttk.Label(self.resultant_frame, textvariable=self.result_str_vars["r"]).grid(column=3, row=0, sticky="e", padx=20, pady=5)
-        ttk.Label(self.resultant_frame, text="Y = ").grid(column=0, row=1, sticky="w", padx=20, pady=5)
-        ttk.Label(self.resultant_frame, textvariable=self.result_str_vars["y"]).grid(column=1, row=1, sticky="e", padx=20, pady=5)
-        ttk.Label(self.resultant_frame, text="\u03B8 = ").grid(column=2, row=1, sticky="w", padx=20, pady=5)
-        ttk.Label(self.resultant_frame, textvariable=self.result_str_vars["theta"]).grid(column=3, row=1, sticky="e", padx=20, pady=5)
+    def parse_angle(self, text: str) -> float:
+        """
+        Reads an angle entry such as "30" or "0.5 rad" in degrees, taking bare numbers in the window's angle unit.
+        Raises ValueError for anything else.
+        """
+        value, unit = units.split(text)
+        return float(units.to_degrees(value, unit or self.unit_vars["angle"].get()))
 
-        self.add_vector_button.configure(command=self.add_vector)
-        self.remove_vector_button.configure(command=self.rm_vector)
-        self.clear_all_button.configure(command=self.clear_all)
-        return
+    def has_vector(self, name: str) -> bool:
+        """
+        Checks if a vector name is already listed under any category.
+        """
+        return any(name in store for store in self.vector_stores.values())
 
-    def add_vector(self) -> None:
+    def add_given_vector(self) -> bool:
         """
         Add a vector to the table with a unique name and plot the vector into the plane.
+        Returns False if the entries are invalid.
         """
         vector_name = self.vector_str_vars["name"].get()
 
@@ -261,284 +384,942 @@ class ResultantWindow(BaseWindow):
 
             showerror("Error", "Vector name is empty!")
             self.name_entry.focus_set()
-            return
+            return False
 
-        elif vector_name in self.vector_dict:
+        elif self.has_vector(vector_name):
 
             showerror("Error", f"Vector \"{vector_name}\" already exists!")
             self.name_entry.focus_set()
-            return
-
-        elif vector_name in self.tree_entries.values():
-
-            showerror("Error", f"{self.tree_entries['given']}, {self.tree_entries['missing']}, and {self.tree_entries['other']} are currently reserved for the main categories.")
-            self.name_entry.focus_set()
-            return
+            return False
 
         elif self.coordinate.get():
 
             try:
-                r = float(self.vector_str_vars["req1"].get())
+                r = self.parse_magnitude(self.vector_str_vars["req1"].get())
             except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
+                showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                 self.req1_entry.focus_set()
-                return
+                return False
 
             try:
-                theta = float(self.vector_str_vars["req2"].get())
+                theta = self.parse_angle(self.vector_str_vars["req2"].get())
             except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
+                showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                 self.req2_entry.focus_set()
-                return
+                return False
 
-            x = r * np.cos(np.radians(theta))
-            y = r * np.sin(np.radians(theta))
+            x, y = engine.from_polar(r, theta)
 
         else:
 
             try:
-                x = float(self.vector_str_vars["req1"].get())
+                x = self.parse_magnitude(self.vector_str_vars["req1"].get())
             except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
+                showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                 self.req1_entry.focus_set()
-                return
+                return False
 
             try:
-                y = float(self.vector_str_vars["req2"].get())
+                y = self.parse_magnitude(self.vector_str_vars["req2"].get())
             except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
+                showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                 self.req2_entry.focus_set()
-                return
+                return False
 
-            r = np.hypot(x, y)
-            theta_rad = np.arctan2(y, x)
-            theta = np.rad2deg(theta_rad)
+        self.vector_stores["given"][vector_name] = np.array([x, y])
+        self.update_vectors("given")
+        return True
 
-        self.vector_dict[vector_name] = np.array([x, y])
-        self.quiver_dict[vector_name] = self.plot.quiver(x, y, alpha=0.5, color="g", scale=1, scale_units="xy", angles="xy")
-        self.tree.insert(self.tree_entries["given"], "end", vector_name, values=(vector_name, f"{x: .6f}", f"{y: .6f}", f"{r: .6f}", f"{theta: .6f}"))
-        self.tree.item(self.tree_entries["given"], open=True)
+    @profiled("callback")
+    def import_vectors(self) -> None:
+        """
+        Adds every vector of a CSV or NumPy file to the table, read in the coordinate form selected for new vectors,
+        with a single resultant computation and redraw.
+        """
+        path = askopenfilename(parent=self, title="Import vectors", filetypes=[("Vector files", "*.csv *.npy *.npz"), ("All files", "*.*")])
 
-        # noinspection SpellCheckingInspection
-        rx, ry, rm, rtheta = self.get_resultant()  # type: ignore
+        if not path:
+            return
 
-        self.result_str_vars["x"].set(f"{rx: .6f}")  # type: ignore
-        self.result_str_vars["y"].set(f"{ry: .6f}")  # type: ignore
-        self.result_str_vars["r"].set(f"{rm: .6f}")
-        self.result_str_vars["theta"].set(f"{rtheta: .6f}")  # type: ignore
+        try:
+            names, vectors = vector_io.load_vectors(path, polar=bool(self.coordinate.get()), unit=self.unit_vars["magnitude"].get(), angle_unit=self.unit_vars["angle"].get())
+        except (OSError, ValueError) as error:
+            showerror("Error", f"Cannot import \"{path}\": {error}")
+            return
+
+        duplicates = [name for name in names if self.has_vector(name)]
+
+        if duplicates:
+            showerror("Error", f"Vector \"{duplicates[0]}\" already exists!")
+            return
+
+        try:
+            self.vector_stores["given"].extend(names, vectors)
+        except ValueError as error:
+            showerror("Error", str(error))
+            return
 
+        self.update_vectors("given")
+        self.update_solution()
+        self.get_resultant()
         self.rescale_graph()
+        return
 
+    def update_solution(self) -> None:
+        """
+        Recomputes the missing vectors after the listed vectors changed. Case windows with auto-update override this.
+        """
         return
 
-    # noinspection SpellCheckingInspection
-    def rm_vector(self) -> None:
+    def remove_vector(self) -> None:
+        """
+        Remove the selected vector from the list.
+        """
+        selected = self.table.selection()
 
-        self.remove_vector()
-        rx, ry, rm, rtheta = self.get_resultant()  # type: ignore
+        if len(selected) == 0:
 
-        self.result_str_vars["x"].set(f"{rx: .6f}")  # type: ignore
-        self.result_str_vars["y"].set(f"{ry: .6f}")  # type: ignore
-        self.result_str_vars["r"].set(f"{rm: .6f}")
-        self.result_str_vars["theta"].set(f"{rtheta: .6f}")  # type: ignore
+            showerror("Error", "No vector selected on the table!")
 
-        self.rescale_graph()
-        return
+        else:
 
-    def clear_all(self) -> None:
+            solved = len(self.vector_stores["missing"]) + len(self.vector_stores["Other Angle"])
 
-        for i in self.quiver_dict.values():
-            i.remove()
-        self.quiver_dict.clear()
-        self.vector_dict.clear()
-        self.tree.delete(*self.tree.get_children(self.tree_entries["given"]))
+            for store in self.vector_stores.values():
+                store.remove_many([name for name in store if name in selected])
 
-        self.result_str_vars["x"].set("0.000000")
-        self.result_str_vars["y"].set("0.000000")
-        self.result_str_vars["r"].set("0.000000")
-        self.result_str_vars["theta"].set("0.000000")
+            # A partly removed solution is no longer the one its inputs give.
+            if len(self.vector_stores["missing"]) + len(self.vector_stores["Other Angle"]) != solved:
+                self.solution_key = None
 
-        self.get_resultant()
-        self.rescale_graph()
-        return
+            for name in selected:
+                self.vector_colors.pop(name, None)
 
+            self.update_vectors()
+            self.get_resultant()
+            self.rescale_graph()
 
-class OneMissingVector(BaseWindow):
-    """
-    Window Class for finding one vector with missing angle and magnitude.
-    """
-    def __init__(self, master: tk.Tk, min_width: int = 900, min_height: int = 700) -> None:
+        return
 
-        super().__init__(master, min_width, min_height)
+    def move_vector(self, step: int) -> None:
+        """
+        Moves the selected given vector up or down the chain of given vectors, which leaves the resultant alone.
+        """
+        store = self.vector_stores["given"]
+        selected = [name for name in self.table.selection() if name in store]
 
-        self.missing_vector_frame = ttk.LabelFrame(master=self.control_panel, text="One Missing Vector (Red)")
-        self.missing_vector_frame.grid(column=0, row=2, sticky="new", padx=10, pady=10)
-        self.missing_vector_frame.grid_columnconfigure(0, weight=1)
-        self.missing_vector_frame.grid_columnconfigure(1, weight=3)
-        self.missing_vector_frame.grid_columnconfigure(2, weight=1)
-        self.missing_vector_frame.grid_columnconfigure(3, weight=3)
+        if len(selected) != 1:
+            showerror("Error", "Select exactly one given vector to move!")
+            return
 
-        self.expected_resultant_vars: dict[str, tk.StringVar] = {
-            "name": tk.StringVar(self),
-            "req1": tk.StringVar(self),
-            "req2": tk.StringVar(self)
-        }
-        self.expected_resultant_coordinate: tk.IntVar = tk.IntVar(self, value=0)
-        self.missing_vector_vars: dict[str, tk.StringVar] = {
-            "x": tk.StringVar(self),
-            "y": tk.StringVar(self),
-            "r": tk.StringVar(self),
-            "theta": tk.StringVar(self)
-        }
-        self.auto_update: tk.IntVar = tk.IntVar(self, value=0)
-        self.expected_resultant: np.ndarray = np.array([0., 0.])
+        store.move(selected[0], store.row(selected[0]) + step)
+        self.update_vectors("given")
+        self.rescale_graph()
+        return
 
-        ttk.Label(self.missing_vector_frame, text="Vector name: ").grid(column=0, row=0, sticky="nw", padx=10)
-        ttk.Label(self.missing_vector_frame, text="X / R : ").grid(column=0, row=2, sticky="ew", padx=10)
-        ttk.Label(self.missing_vector_frame, text="Y / \u03B8 : ").grid(column=2, row=2, sticky="ew", padx=10)
-        ttk.Label(self.missing_vector_frame, text="Expected Resultant").grid(column=0, row=1, columnspan=4, sticky="nw", padx=10, pady=(10, 0))
+    def clear_solutions(self) -> None:
+        """
+        Remove the solved vectors listed under the missing and other angle categories.
+        """
+        for category in ("missing", "Other Angle"):
 
-        self.missing_name_entry = ttk.Entry(self.missing_vector_frame, textvariable=self.expected_resultant_vars["name"])
-        self.missing_name_entry.grid(column=1, row=0, columnspan=3, sticky="new", padx=10)
-        self.missing_req1_entry = ttk.Entry(self.missing_vector_frame, textvariable=self.expected_resultant_vars["req1"])
-        self.missing_req1_entry.grid(column=1, row=2, sticky="ew", padx=10, pady=10)
-        self.missing_req2_entry = ttk.Entry(self.missing_vector_frame, textvariable=self.expected_resultant_vars["req2"])
-        self.missing_req2_entry.grid(column=3, row=2, sticky="ew", padx=10, pady=10)
+            for name in self.vector_stores[category]:
+                self.vector_colors.pop(name, None)
 
-        self.cartesian = ttk.Radiobutton(self.missing_vector_frame, text="X and Y components", variable=self.expected_resultant_coordinate, value=0)
-        self.cartesian.grid(column=0, row=3, columnspan=2, sticky="ew", padx=10, pady=10)
-        self.polar = ttk.Radiobutton(self.missing_vector_frame, text="Magnitude and Direction", variable=self.expected_resultant_coordinate, value=1)
-        self.polar.grid(column=2, row=3, columnspan=2, sticky="ew", padx=10, pady=10)
-        ttk.Checkbutton(self.missing_vector_frame, text="Find and Auto-update missing vector", command=self.get_expected_resultant, variable=self.auto_update).grid(column=0, row=4, columnspan=4, sticky="ew", pady=(5, 10), padx=10)
+            self.vector_stores[category].clear()
 
-        self.result_frame = ttk.LabelFrame(master=self.control_panel, text="Missing Vector (Red)")
-        self.result_frame.grid(column=0, row=3, sticky="ew", padx=10, pady=10)
-        self.result_frame.grid_columnconfigure(0, weight=2)
-        self.result_frame.grid_columnconfigure(1, weight=3)
-        self.result_frame.grid_columnconfigure(2, weight=2)
-        self.result_frame.grid_columnconfigure(3, weight=3)
+        self.solution_key = None
 
-        ttk.Label(self.result_frame, text="X = ").grid(column=0, row=0, sticky="w", padx=20, pady=5)
-        ttk.Label(self.result_frame, textvariable=self.missing_vector_vars["x"]).grid(column=1, row=0, sticky="e", padx=20, pady=5)
-        ttk.Label(self.result_frame, text="R = ").grid(column=2, row=0, sticky="w", padx=20, pady=5)
-        ttk.Label(self.result_frame, textvariable=self.missing_vector_vars["r"]).grid(column=3, row=0, sticky="e", padx=20, pady=5)
-        ttk.Label(self.result_frame, text="Y = ").grid(column=0, row=1, sticky="w", padx=20, pady=5)
-        ttk.Label(self.result_frame, textvariable=self.missing_vector_vars["y"]).grid(column=1, row=1, sticky="e", padx=20, pady=5)
-        ttk.Label(self.result_frame, text="\u03B8 = ").grid(column=2, row=1, sticky="w", padx=20, pady=5)
-        ttk.Label(self.result_frame, textvariable=self.missing_vector_vars["theta"]).grid(column=3, row=1, sticky="e", padx=20, pady=5)
+        self.update_vectors("missing", "Other Angle")
+        return
 
-        self.add_vector_button.configure(command=self.add_vector)
-        self.remove_vector_button.configure(command=self.rm_vector)
-        self.clear_all_button.configure(command=self.clear_all)
+    def clear_vectors(self) -> None:
+        """
+        Remove every listed vector from the table and the plane.
+        """
+        self.vector_stores["given"].clear()
+        self.clear_solutions()
+        self.update_vectors("given")
         return
 
-    def add_vector(self) -> None:
+    @profiled("artists")
+    def update_vectors(self, *categories: str) -> None:
         """
-        Add a vector to the table with a unique name and plot the vector into the plane.
+        Updates the arrows of each category in place from its vector store, or of every category if none are given,
+        and refreshes the table rows in view.
         """
-        vector_name = self.vector_str_vars["name"].get()
+        if self.simulation is not None:
+            self.stop_simulation()
 
-        if vector_name == "":
+        for category in categories or self.quivers:
+            self.update_artists(category)
 
-            showerror("Error", "Vector name is empty!")
-            self.name_entry.focus_set()
-            return
+        state = "disabled" if any(len(store) for store in self.vector_stores.values()) else "readonly"
+        for box in self.unit_boxes:
+            box.configure(state=state)
 
-        elif vector_name in self.vector_dict:
+        self.table.refresh()
+        return
 
-            showerror("Error", f"Vector \"{vector_name}\" already exists!")
-            self.name_entry.focus_set()
+    def update_artists(self, category: str) -> None:
+        """
+        Updates the arrows of a category, or of the resultant, in the visible plane only. The hidden plane catches up
+        when the view is switched to it.
+        """
+        if self.polar_view:
+            self.update_polar(category)
+        else:
+            self.update_cartesian(category)
+
+        self.stale_categories.add(category)
+        return
+
+    def update_cartesian(self, category: str) -> None:
+
+        if category == "resultant":
+            self.resultant_plot.set_UVC(*self.resultant_vct)
             return
 
-        elif vector_name in self.tree_entries.values():
+        store = self.vector_stores[category]
+        quiver = self.quivers[category]
+        tails = self.chain_tails(category) if self.tip_to_tail.get() else np.zeros((len(store), 2))
+        set_arrows(quiver, tails, store.x, store.y)
 
-            showerror("Error", f"{self.tree_entries['given']}, {self.tree_entries['missing']}, and {self.tree_entries['other']} are currently reserved for the main categories.")
-            self.name_entry.focus_set()
+        if category != "given":
+            quiver.set_facecolor([self.vector_colors[name] for name in store] or "none")
+        elif self.tip_to_tail.get():
+            # The solved vectors continue the chain from the tip of the last given vector.
+            self.update_cartesian("missing")
+            self.update_cartesian("Other Angle")
+
+        return
+
+    def chain_tails(self, category: str) -> np.ndarray:
+        """
+        Tails of the vectors of a category chained tip to tail, with the solved vectors starting where the given
+        vectors end, so the last missing vector ends on the tip of the resultant.
+        """
+        tails = self.vector_stores[category].tails
+
+        if category == "given":
+            return tails.copy()
+        return tails + self.vector_stores["given"].resultant
+
+    def switch_chain(self) -> None:
+        """
+        Draws the arrows tip to tail or from the origin, as the tip to tail toggle is set.
+        """
+        for category in self.quivers:
+            self.update_artists(category)
+
+        self.rescale_graph()
+        return
+
+    def update_polar(self, category: str) -> None:
+        """
+        Sets the polar arrows of a category from the cached magnitudes and angles, turning negative magnitudes into
+        positive ones pointing the opposite way.
+        """
+        if category == "resultant":
+            r, theta = engine.to_polar(self.resultant_vct)
+            r, theta = np.array([r]), np.array([theta])
+        else:
+            r, theta = self.vector_stores[category].magnitudes, self.vector_stores[category].angles
+
+        theta = np.radians(np.where(r < 0, theta + 180, theta))
+        r = np.abs(r)
+        tips = np.column_stack([theta, r])
+        self.polar_lines[category].set_segments(np.stack([np.column_stack([theta, np.zeros_like(r)]), tips], axis=1))
+        self.polar_tips[category].set_offsets(tips)
+
+        if category in ("missing", "Other Angle"):
+            colors = [self.vector_colors[name] for name in self.vector_stores[category]] or "none"
+            self.polar_lines[category].set_color(colors)
+            self.polar_tips[category].set_color(colors)
+
+        return
+
+    def switch_view(self) -> None:
+        """
+        Shows the plane selected by the view toggle, first updating the arrows that changed while it was hidden.
+        """
+        polar = bool(self.view.get())
+
+        if polar == self.polar_view:
             return
 
-        elif self.coordinate.get():
+        if self.simulation is not None:
+            self.stop_simulation()
 
-            try:
-                r = float(self.vector_str_vars["req1"].get())
-            except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
-                self.req1_entry.focus_set()
-                return
+        self.polar_view = polar
+        self.plot.set_visible(not polar)
+        self.polar_plot.set_visible(polar)
 
-            try:
-                theta = float(self.vector_str_vars["req2"].get())
-            except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
-                self.req2_entry.focus_set()
-                return
+        # The plane being hidden was up to date, so nothing is stale once the shown one catches up.
+        for category in list(self.stale_categories):
+            self.update_artists(category)
+        self.stale_categories.clear()
+
+        self.background = None
+        self.rescale_graph()
+        return
+
+    def given_sum(self) -> np.ndarray:
+        """
+        Running sum of the listed vectors as a (1, 2) array, which the engine solvers accept in place of every vector.
+        """
+        return self.vector_stores["given"].resultant[None, :]
+
+    def cached_solve(self, solver: Callable, *inputs: np.ndarray | float, names: tuple[str, ...]) -> object | None:
+        """
+        Solves through the window's LRU cache and clears the previous solution. Returns None instead if the solution on
+        display came from the same inputs and names, so re-solves that change nothing leave the missing vectors, their
+        arrows and their rows alone.
+        """
+        key = (self.solve_cache.key(solver, *inputs), names)
+
+        if key == self.solution_key:
+            self.solve_cache.touch(key[0])
+            return None
+
+        result = self.solve_cache.solve(solver, *inputs)
+        self.clear_solutions()
+        self.solution_key = key
+        return result
+
+    @profiled("artists")
+    def get_resultant(self) -> tuple[float, float, float, float]:
+        """
+        Get the resultant of the vectors listed on the table
+        """
+        self.resultant_vct = self.vector_stores["given"].resultant + self.vector_stores["missing"].resultant
+        x: float = self.resultant_vct[0]
+        y: float = self.resultant_vct[1]
+        r, theta = engine.to_polar(self.resultant_vct)
+        self.resultant_str_vars["x"].set(value=f"{x: .4f}")  # type: ignore
+        self.resultant_str_vars["y"].set(value=f"{y: .4f}")  # type: ignore
+        self.resultant_str_vars["r"].set(value=f"{r: .4f}")
+        self.resultant_str_vars["theta"].set(value=f"{self.display_angle(theta): .4f}")  # type: ignore
+        self.update_artists("resultant")
+        return x, y, r, theta
+
+    @profiled("artists")
+    def rescale_graph(self) -> None:
+        """
+        Rescales the canvas to fit all vectors on the screen.
+        """
+        if self.polar_view:
+            self.rescale_polar()
+            return
+
+        # The origin is always included, so empty stores still give a valid extent.
+        if self.tip_to_tail.get():
+            extents = [self.chain_extents(category) for category in self.vector_stores]
+        else:
+            extents = [store.extents for store in self.vector_stores.values()]
+        low = np.minimum.reduce([extent[0] for extent in extents] + [self.resultant_vct, np.zeros(2)])
+        high = np.maximum.reduce([extent[1] for extent in extents] + [self.resultant_vct, np.zeros(2)])
+
+        self.set_limits(np.floor(low) - 1, np.ceil(high) + 1)
+        self.request_redraw()
+        return
+
+    def chain_extents(self, category: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Smallest and largest coordinates of the tails and tips of a category's chained arrows.
+        """
+        if len(self.vector_stores[category]) == 0:
+            return np.full(2, np.inf), np.full(2, -np.inf)
+
+        tails = self.chain_tails(category)
+        tips = tails + self.vector_stores[category].xy
+        return np.minimum(tails.min(axis=0), tips.min(axis=0)), np.maximum(tails.max(axis=0), tips.max(axis=0))
+
+    def set_limits(self, low: np.ndarray, high: np.ndarray) -> None:
+        """
+        Sets the Cartesian limits to the smallest ones around the low and high corners that keep the plane's aspect.
+        """
+        x_min, y_min = low
+        x_max, y_max = high
+        x_mid = (x_min + x_max) / 2
+        y_mid = (y_min + y_max) / 2
+        x_range = x_max - x_min
+        y_range = y_max - y_min
+
+        if 1.25 * x_range > y_range:
+            limits = (x_mid - x_range / 2, x_mid + x_range / 2), (y_mid - x_range / 2 * 1.25, y_mid + x_range / 2 * 1.25)
+        else:
+            limits = (x_mid - y_range / 2 / 1.25, x_mid + y_range / 2 / 1.25), (y_mid - y_range / 2, y_mid + y_range / 2)
+
+        # Setting unchanged limits would still notify every axis callback and mark the figure stale.
+        if limits != (self.plot.get_xlim(), self.plot.get_ylim()):
+            self.plot.set_xlim(*limits[0])
+            self.plot.set_ylim(*limits[1])
+
+        return
+
+    def rescale_polar(self) -> None:
+        """
+        Fits the radius of the polar plane to the longest vector.
+        """
+        longest = max([float(np.hypot(*self.resultant_vct))] + [float(np.abs(store.magnitudes).max()) for store in self.vector_stores.values() if len(store)])
+        limits = (0., float(np.ceil(longest)) + 1)
+
+        if limits != tuple(self.polar_plot.get_ylim()):
+            self.polar_plot.set_ylim(*limits)
+
+        self.request_redraw()
+        return
+
+    def request_redraw(self) -> None:
+        """
+        Marks the canvas dirty so it gets redrawn once on the next Tk idle cycle, however many changes came before it.
+        """
+        if self.redraw_id is None:
+            self.redraw_id = self.after_idle(self.redraw)
+        return
 
-            x = r * np.cos(np.radians(theta))
-            y = r * np.sin(np.radians(theta))
+    @profiled("draw")
+    def redraw(self) -> None:
+        """
+        Blits the arrows over the cached background, or redraws the whole figure if the view limits changed.
+        """
+        self.redraw_id = None
+        plot = self.visible_plot()
+
+        if self.background is None or self.background_limits != (plot.get_xlim(), plot.get_ylim()):
+            self.canvas.draw()
+            return
+
+        self.canvas.restore_region(self.background)
+        for artist in self.arrow_artists():
+            plot.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
+        return
+
+    def on_draw(self, event) -> None:
+        """
+        Caches the static axes and grid after every full draw, including toolbar zooms and resizes, then draws the arrows on top.
+        """
+        if event.canvas is self.canvas:
+            self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+            self.background_limits = (self.visible_plot().get_xlim(), self.visible_plot().get_ylim())
+
+        for artist in self.arrow_artists():
+            artist.draw(event.renderer)
+
+        STARTUP_TIMER.draw_window()
+        return
+
+    def visible_plot(self) -> "Axes":
+        return self.polar_plot if self.polar_view else self.plot
 
+    def arrow_artists(self) -> list:
+        """
+        Arrows of the visible plane, which are the only ones drawn.
+        """
+        if self.polar_view:
+            return [*self.polar_lines.values(), *self.polar_tips.values()]
+        if self.simulation is not None:
+            return [self.bodies, self.resultant_body]
+        return [*self.quivers.values(), self.resultant_plot]
+
+    def toggle_simulation(self) -> None:
+
+        if self.simulation is None:
+            self.start_simulation()
         else:
+            self.stop_simulation()
+
+        return
+
+    def start_simulation(self) -> None:
+        """
+        Starts moving one body from the origin per given vector, and one more by their resultant, in the Cartesian plane.
+        """
+        store = self.vector_stores["given"]
+
+        if len(store) == 0:
+            showerror("Error", "Add given vectors to simulate first!")
+            return
+
+        self.view.set(0)
+        self.switch_view()
+
+        self.simulation = Simulation(np.vstack([store.xy, store.resultant]), self.simulation_mode.get())
+        self.frame_stats = FrameStats(SIMULATION_FPS)
+        self.simulate_button.configure(text="Stop")
+        self.update_bodies()
+        self.request_redraw()
+
+        self.simulation_origin = self.simulation_clock = time.perf_counter()
+        self.simulation_id = self.after(1000 // SIMULATION_FPS, self.step_simulation)
+        return
+
+    @profiled("simulation")
+    def step_simulation(self) -> None:
+        """
+        Advances the bodies by the wall time since the last frame and blits them, then schedules the next frame on the
+        fixed frame grid, so slow frames and Tk events in between neither slow the motion nor push later frames back.
+        """
+        start = time.perf_counter()
+        self.simulation.advance(start - self.simulation_clock)
+        self.simulation_clock = start
+        self.update_bodies()
+
+        # The frame draws now, so a redraw still queued for idle time would only blit the same frame again.
+        if self.redraw_id is not None:
+            self.after_cancel(self.redraw_id)
+        self.redraw()
+
+        self.frame_stats.add(start, time.perf_counter() - start)
+        if self.frame_stats.frames % SIMULATION_FPS == 0:
+            self.show_frame_stats()
+
+        interval = 1 / SIMULATION_FPS
+        delay = interval - (time.perf_counter() - self.simulation_origin) % interval
+        self.simulation_id = self.after(max(1, round(delay * 1000)), self.step_simulation)
+        return
+
+    def update_bodies(self) -> None:
+        """
+        Moves the body markers, and doubles the Cartesian limits around the origin once a body leaves them.
+        """
+        positions = self.simulation.positions
+        self.bodies.set_data(positions[:-1, 0], positions[:-1, 1])
+        self.resultant_body.set_data(positions[-1:, 0], positions[-1:, 1])
+
+        low, high = self.simulation.extents()
+        (x_min, x_max), (y_min, y_max) = self.plot.get_xlim(), self.plot.get_ylim()
+
+        if low[0] < x_min or low[1] < y_min or high[0] > x_max or high[1] > y_max:
+            self.set_limits(2 * np.minimum(low, 0) - 1, 2 * np.maximum(high, 0) + 1)
+
+        return
+
+    def show_frame_stats(self) -> None:
+
+        stats = self.frame_stats.summary()
+        self.frame_stats_label.configure(text=f"{stats['fps']:5.1f} fps  p99 {stats['p99'] * 1e3:5.2f} ms  late {stats['late']:4.0%}")
+        return
+
+    def stop_simulation(self) -> None:
+        """
+        Stops the bodies and brings back the arrows and the limits that fit them.
+        """
+        if self.simulation_id is not None:
+            self.after_cancel(self.simulation_id)
+            self.simulation_id = None
+
+        self.show_frame_stats()
+        self.simulation = None
+        self.simulate_button.configure(text="Simulate")
+        self.bodies.set_data([], [])
+        self.resultant_body.set_data([], [])
+        self.rescale_graph()
+        return
+
+    def close(self) -> None:
+        """
+        Closes the vector canvas and program window.
+        """
+        if self.redraw_id is not None:
+            self.after_cancel(self.redraw_id)
+        if self.simulation_id is not None:
+            self.after_cancel(self.simulation_id)
+        self.canvas.callbacks.process('close_event')
+        self.master.focus_set()
+        self.destroy()
+        return
+
+
+class ResultantWindow(BaseWindow):
+    """
+    Window Class made for getting the resultant of the given vectors
+    """
+    def __init__(self, master: tk.Tk, min_width: int = 900, min_height: int = 700, compensated_sum: bool = False) -> None:
+        super().__init__(master, min_width, min_height, compensated_sum)
+
+        self.resultant_frame = ttk.LabelFrame(self.control_panel, text="Resultant (Black)")
+        self.resultant_frame.grid(column=0, row=2, sticky="new", padx=10, pady=10)
+        self.resultant_frame.grid_columnconfigure(0, weight=1)
+        self.resultant_frame.grid_columnconfigure(1, weight=1)
+        self.resultant_frame.grid_columnconfigure(2, weight=1)
+        self.resultant_frame.grid_columnconfigure(3, weight=1)
+        self.resultant_frame.grid_rowconfigure(0, weight=1)
+        self.resultant_frame.grid_rowconfigure(1, weight=1)
+
+        self.result_str_vars: dict[str, tk.StringVar] = {
+            "x": tk.StringVar(self, "0.000000"),
+            "y": tk.StringVar(self, "0.000000"),
+            "r": tk.StringVar(self, "0.000000"),
+            "theta": tk.StringVar(self, "0.000000")
+        }
+
+        ttk.Label(self.resultant_frame, text="X = ").grid(column=0, row=0, sticky="w", padx=20, pady=5)
+        ttk.Label(self.resultant_frame, textvariable=self.result_str_vars["x"]).grid(column=1, row=0, sticky="e", padx=20, pady=5)
+        ttk.Label(self.resultant_frame, text="R = ").grid(column=2, row=0, sticky="w", padx=20, pady=5)
+        ttk.Label(self.resultant_frame, textvariable=self.result_str_vars["r"]).grid(column=3, row=0, sticky="e", padx=20, pady=5)
+        ttk.Label(self.resultant_frame, text="Y = ").grid(column=0, row=1, sticky="w", padx=20, pady=5)
+        ttk.Label(self.resultant_frame, textvariable=self.result_str_vars["y"]).grid(column=1, row=1, sticky="e", padx=20, pady=5)
+        ttk.Label(self.resultant_frame, text="\u03B8 = ").grid(column=2, row=1, sticky="w", padx=20, pady=5)
+        ttk.Label(self.resultant_frame, textvariable=self.result_str_vars["theta"]).grid(column=3, row=1, sticky="e", padx=20, pady=5)
+
+        self.add_vector_button.configure(command=self.add_vector)
+        self.remove_vector_button.configure(command=self.rm_vector)
+        self.clear_all_button.configure(command=self.clear_all)
+        return
+
+    @profiled("callback")
+    def add_vector(self) -> None:
+        """
+        Add a vector to the table with a unique name and plot the vector into the plane.
+        """
+        if not self.add_given_vector():
+            return
+
+        self.get_resultant()
+        self.rescale_graph()
+
+        return
+
+    @profiled("callback")
+    def rm_vector(self) -> None:
+
+        self.remove_vector()
+        self.get_resultant()
+        self.rescale_graph()
+        return
+
+    @profiled("callback")
+    def clear_all(self) -> None:
+
+        self.clear_vectors()
+        self.get_resultant()
+        self.rescale_graph()
+        return
+
+    # noinspection SpellCheckingInspection
+    def get_resultant(self) -> tuple[float, float, float, float]:
+        """
+        Gets the resultant and shows it on the resultant panel, after any change to the listed vectors including imports.
+        """
+        rx, ry, rm, rtheta = super().get_resultant()
+
+        self.result_str_vars["x"].set(f"{rx: .6f}")  # type: ignore
+        self.result_str_vars["y"].set(f"{ry: .6f}")  # type: ignore
+        self.result_str_vars["r"].set(f"{rm: .6f}")
+        self.result_str_vars["theta"].set(f"{self.display_angle(rtheta): .6f}")  # type: ignore
+
+        return rx, ry, rm, rtheta
+
+
+class OneMissingDirection(BaseWindow):
+    """
+    Window Class for finding the angle of one vector given its magnitude and the expected resultant's magnitude.
+    """
+    def __init__(self, master: tk.Tk, min_width: int = 900, min_height: int = 700, compensated_sum: bool = False) -> None:
+
+        super().__init__(master, min_width, min_height, compensated_sum)
+        self.table.add_section("Other Angle", "Other \u03B8", self.vector_stores["Other Angle"])
+
+        self.requirements_vars: dict[str, tk.StringVar] = {
+            "name": tk.StringVar(self),
+            "magnitude": tk.StringVar(self),
+            "result_magnitude": tk.StringVar(self)
+        }
+        self.magnitude = 0.
+        self.resultant_magnitude = 0.
+        self.auto_update = tk.IntVar(self, value=0)
+
+        self.missing_angle_frame = ttk.Labelframe(self.control_panel, text="One Missing Direction (Blue)")
+        self.missing_angle_frame.grid(column=0, row=2, sticky="new", padx=10, pady=10)
+        self.missing_angle_frame.grid_columnconfigure(0, weight=1)
+        self.missing_angle_frame.grid_columnconfigure(1, weight=3)
+        self.missing_angle_frame.grid_columnconfigure(2, weight=1)
+        self.missing_angle_frame.grid_columnconfigure(3, weight=3)
+
+        ttk.Label(self.missing_angle_frame, text="Missing Vector").grid(column=0, row=0, columnspan=4, sticky="nw", padx=10, pady=(10, 0))
+        ttk.Label(self.missing_angle_frame, text="Name: ").grid(column=0, row=1, sticky="nw", padx=10, pady=(3, 0))
+        ttk.Label(self.missing_angle_frame, text="Magnitude: ").grid(column=2, row=1, sticky="nw", padx=10, pady=(3, 13))
+        ttk.Label(self.missing_angle_frame, text="Expected Resultant").grid(column=0, row=2, columnspan=4, sticky="nw", padx=10, pady=(5, 0))
+        ttk.Label(self.missing_angle_frame, text="Magnitude: ").grid(column=0, row=3, sticky="nw", padx=10, pady=(3, 13))
+
+        self.vector_name_entry = ttk.Entry(self.missing_angle_frame, textvariable=self.requirements_vars["name"])
+        self.vector_name_entry.grid(column=1, row=1, sticky="new", padx=10, pady=(3, 0))
+        self.vector_magnitude_entry = ttk.Entry(self.missing_angle_frame, textvariable=self.requirements_vars["magnitude"])
+        self.vector_magnitude_entry.grid(column=3, row=1, sticky="new", padx=10, pady=(3, 13))
+        self.resultant_magnitude_entry = ttk.Entry(self.missing_angle_frame, textvariable=self.requirements_vars["result_magnitude"])
+        self.resultant_magnitude_entry.grid(column=1, row=3, sticky="new", padx=10, pady=(3, 13))
+
+        ttk.Checkbutton(self.missing_angle_frame, text="Find Missing Direction and auto-update", variable=self.auto_update, command=self.get_expected_resultant).grid(column=0, row=4, columnspan=4, sticky="ew", padx=10, pady=10)
+
+        self.add_vector_button.configure(command=self.add_vector)
+        self.remove_vector_button.configure(command=self.rm_vector)
+        self.clear_all_button.configure(command=self.clear_all)
+
+        self.no_solution_label = ttk.Label(self.control_panel, foreground="#DD2020", font=("Sans Serif", 12))
+        self.no_solution_label.grid(row=3, padx=20, pady=3, sticky="nw")
+        return
+
+    def update_solution(self) -> None:
+
+        if self.auto_update.get():
+            self.find_missing_direction()
+
+        return
+
+    @profiled("callback")
+    def add_vector(self) -> None:
+        """
+        Add a vector to the table with a unique name and plot the vector into the plane.
+        """
+        if not self.add_given_vector():
+            return
+
+        self.update_solution()
+        self.get_resultant()
+        self.rescale_graph()
+        return
+
+    @profiled("callback")
+    def rm_vector(self) -> None:
+        """
+        Checks vector to be removed before removing from list and graph
+        """
+        vector_name = self.requirements_vars["name"].get()
+        selection = self.table.selection()
+
+        if self.auto_update.get() and (vector_name in selection or vector_name + " 2" in selection):
+
+            showerror("Error", f"Cannot remove \"{vector_name}\" vector while auto-updating! Please disable auto-update first.")
+            return
+
+        self.remove_vector()
+
+        self.update_solution()
+        self.get_resultant()
+        self.rescale_graph()
+        return
+
+    @profiled("callback")
+    def clear_all(self) -> None:
+
+        self.auto_update.set(0)
+        self.clear_vectors()
+        for i in self.vector_str_vars.values():
+            i.set("")
+        for i in self.requirements_vars.values():
+            i.set("")
+        self.coordinate.set(0)
+        self.vector_name_entry.configure(state="enabled")
+        self.vector_magnitude_entry.configure(state="enabled")
+        self.resultant_magnitude_entry.configure(state="enabled")
+        self.no_solution_label.configure(text="")
+
+        self.get_resultant()
+        self.rescale_graph()
+        return
+
+    @profiled("solve")
+    def find_missing_direction(self) -> None:
+
+        vector_name = self.requirements_vars["name"].get()
+        solution = self.cached_solve(engine.one_missing_direction, self.given_sum(), self.magnitude, self.resultant_magnitude, names=(vector_name,))
+
+        if solution is None:
+            return
+
+        self.no_solution_label.configure(text="")
+        angles, count = solution
+
+        if count == 0:
+            self.no_solution_label.configure(text="\u24D8 There is no valid solution!")
+            return
+
+        x, y = engine.from_polar(self.magnitude, angles).T
+        self.vector_stores["missing"][vector_name] = np.array([x[0], y[0]])
+        self.vector_colors[vector_name] = "#008db9"
+        self.vector_stores["missing"].set_polar(vector_name, self.magnitude, angles[0])
+
+        if count == 2:
+            self.vector_stores["Other Angle"][vector_name + " 2"] = np.array([x[1], y[1]])
+            self.vector_colors[vector_name + " 2"] = "#cf4a49"
+            self.vector_stores["Other Angle"].set_polar(vector_name + " 2", self.magnitude, angles[1])
+
+        self.update_vectors("missing", "Other Angle")
+        return
+
+    @profiled("callback")
+    def get_expected_resultant(self) -> None:
+
+        vector_name = self.requirements_vars["name"].get()
+
+        if self.auto_update.get():
+
+            if vector_name == "":
+
+                showerror("Error", "Vector name is empty!")
+                self.auto_update.set(0)
+                self.vector_name_entry.focus_set()
+                return
+
+            elif vector_name in self.vector_stores["given"]:
+
+                showerror("Error", f"Vector \"{vector_name}\" already exists!")
+                self.auto_update.set(0)
+                self.vector_name_entry.focus_set()
+                return
 
             try:
-                x = float(self.vector_str_vars["req1"].get())
+                self.magnitude = self.parse_magnitude(self.requirements_vars["magnitude"].get())
             except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
-                self.req1_entry.focus_set()
+                showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
+                self.auto_update.set(0)
+                self.vector_magnitude_entry.focus_set()
                 return
 
             try:
-                y = float(self.vector_str_vars["req2"].get())
+                self.resultant_magnitude = self.parse_magnitude(self.requirements_vars["result_magnitude"].get())
             except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
-                self.req2_entry.focus_set()
+                showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
+                self.auto_update.set(0)
+                self.resultant_magnitude_entry.focus_set()
                 return
 
-            r = np.hypot(x, y)
-            theta_rad = np.arctan2(y, x)
-            theta = np.rad2deg(theta_rad)
+            self.vector_name_entry.configure(state="disabled")
+            self.vector_magnitude_entry.configure(state="disabled")
+            self.resultant_magnitude_entry.configure(state="disabled")
+
+            self.find_missing_direction()
+            self.get_resultant()
+            self.rescale_graph()
+
+        else:
+
+            self.vector_name_entry.configure(state="enabled")
+            self.vector_magnitude_entry.configure(state="enabled")
+            self.resultant_magnitude_entry.configure(state="enabled")
+
+        return
+
+
+class OneMissingVector(BaseWindow):
+    """
+    Window Class for finding one vector with missing angle and magnitude.
+    """
+    def __init__(self, master: tk.Tk, min_width: int = 900, min_height: int = 700, compensated_sum: bool = False) -> None:
+
+        super().__init__(master, min_width, min_height, compensated_sum)
+
+        self.missing_vector_frame = ttk.LabelFrame(master=self.control_panel, text="One Missing Vector (Red)")
+        self.missing_vector_frame.grid(column=0, row=2, sticky="new", padx=10, pady=10)
+        self.missing_vector_frame.grid_columnconfigure(0, weight=1)
+        self.missing_vector_frame.grid_columnconfigure(1, weight=3)
+        self.missing_vector_frame.grid_columnconfigure(2, weight=1)
+        self.missing_vector_frame.grid_columnconfigure(3, weight=3)
+
+        self.expected_resultant_vars: dict[str, tk.StringVar] = {
+            "name": tk.StringVar(self),
+            "req1": tk.StringVar(self),
+            "req2": tk.StringVar(self)
+        }
+        self.expected_resultant_coordinate: tk.IntVar = tk.IntVar(self, value=0)
+        self.missing_vector_vars: dict[str, tk.StringVar] = {
+            "x": tk.StringVar(self),
+            "y": tk.StringVar(self),
+            "r": tk.StringVar(self),
+            "theta": tk.StringVar(self)
+        }
+        self.auto_update: tk.IntVar = tk.IntVar(self, value=0)
+        self.expected_resultant: np.ndarray = np.array([0., 0.])
+
+        ttk.Label(self.missing_vector_frame, text="Vector name: ").grid(column=0, row=0, sticky="nw", padx=10)
+        ttk.Label(self.missing_vector_frame, text="X / R : ").grid(column=0, row=2, sticky="ew", padx=10)
+        ttk.Label(self.missing_vector_frame, text="Y / \u03B8 : ").grid(column=2, row=2, sticky="ew", padx=10)
+        ttk.Label(self.missing_vector_frame, text="Expected Resultant").grid(column=0, row=1, columnspan=4, sticky="nw", padx=10, pady=(10, 0))
+
+        self.missing_name_entry = ttk.Entry(self.missing_vector_frame, textvariable=self.expected_resultant_vars["name"])
+        self.missing_name_entry.grid(column=1, row=0, columnspan=3, sticky="new", padx=10)
+        self.missing_req1_entry = ttk.Entry(self.missing_vector_frame, textvariable=self.expected_resultant_vars["req1"])
+        self.missing_req1_entry.grid(column=1, row=2, sticky="ew", padx=10, pady=10)
+        self.missing_req2_entry = ttk.Entry(self.missing_vector_frame, textvariable=self.expected_resultant_vars["req2"])
+        self.missing_req2_entry.grid(column=3, row=2, sticky="ew", padx=10, pady=10)
+
+        self.cartesian = ttk.Radiobutton(self.missing_vector_frame, text="X and Y components", variable=self.expected_resultant_coordinate, value=0)
+        self.cartesian.grid(column=0, row=3, columnspan=2, sticky="ew", padx=10, pady=10)
+        self.polar = ttk.Radiobutton(self.missing_vector_frame, text="Magnitude and Direction", variable=self.expected_resultant_coordinate, value=1)
+        self.polar.grid(column=2, row=3, columnspan=2, sticky="ew", padx=10, pady=10)
+        ttk.Checkbutton(self.missing_vector_frame, text="Find and Auto-update missing vector", command=self.get_expected_resultant, variable=self.auto_update).grid(column=0, row=4, columnspan=4, sticky="ew", pady=(5, 10), padx=10)
+
+        self.result_frame = ttk.LabelFrame(master=self.control_panel, text="Missing Vector (Red)")
+        self.result_frame.grid(column=0, row=3, sticky="ew", padx=10, pady=10)
+        self.result_frame.grid_columnconfigure(0, weight=2)
+        self.result_frame.grid_columnconfigure(1, weight=3)
+        self.result_frame.grid_columnconfigure(2, weight=2)
+        self.result_frame.grid_columnconfigure(3, weight=3)
+
+        ttk.Label(self.result_frame, text="X = ").grid(column=0, row=0, sticky="w", padx=20, pady=5)
+        ttk.Label(self.result_frame, textvariable=self.missing_vector_vars["x"]).grid(column=1, row=0, sticky="e", padx=20, pady=5)
+        ttk.Label(self.result_frame, text="R = ").grid(column=2, row=0, sticky="w", padx=20, pady=5)
+        ttk.Label(self.result_frame, textvariable=self.missing_vector_vars["r"]).grid(column=3, row=0, sticky="e", padx=20, pady=5)
+        ttk.Label(self.result_frame, text="Y = ").grid(column=0, row=1, sticky="w", padx=20, pady=5)
+        ttk.Label(self.result_frame, textvariable=self.missing_vector_vars["y"]).grid(column=1, row=1, sticky="e", padx=20, pady=5)
+        ttk.Label(self.result_frame, text="\u03B8 = ").grid(column=2, row=1, sticky="w", padx=20, pady=5)
+        ttk.Label(self.result_frame, textvariable=self.missing_vector_vars["theta"]).grid(column=3, row=1, sticky="e", padx=20, pady=5)
+
+        self.add_vector_button.configure(command=self.add_vector)
+        self.remove_vector_button.configure(command=self.rm_vector)
+        self.clear_all_button.configure(command=self.clear_all)
+        return
 
-        self.vector_dict[vector_name] = np.array([x, y])
-        self.quiver_dict[vector_name] = self.plot.quiver(x, y, alpha=0.5, color="g", scale=1, scale_units="xy", angles="xy")
-        self.tree.insert(self.tree_entries["given"], "end", vector_name, values=(vector_name, f"{x: .6f}", f"{y: .6f}", f"{r: .6f}", f"{theta: .6f}"))
-        self.tree.item(self.tree_entries["given"], open=True)
+    def update_solution(self) -> None:
 
         if self.auto_update.get():
             self.find_missing_vector()
 
+        return
+
+    @profiled("callback")
+    def add_vector(self) -> None:
+        """
+        Add a vector to the table with a unique name and plot the vector into the plane.
+        """
+        if not self.add_given_vector():
+            return
+
+        self.update_solution()
         self.get_resultant()
         self.rescale_graph()
 
         return
 
+    @profiled("callback")
     def rm_vector(self) -> None:
         """
         Checks vector to be removed before removing from list and graph.
         """
         vector_name = self.expected_resultant_vars["name"].get()
 
-        if vector_name in self.tree.selection() and self.auto_update.get():
+        if vector_name in self.table.selection() and self.auto_update.get():
 
             showerror("Error", f"Cannot remove \"{vector_name}\" vector while auto-updating! Please disable auto-update first.")
             return
 
         self.remove_vector()
 
-        if self.auto_update.get():
-            self.find_missing_vector()
-
+        self.update_solution()
         self.get_resultant()
         self.rescale_graph()
         return
 
+    @profiled("callback")
     def clear_all(self) -> None:
         """
         Clear all vectors from screen and stop auto-update
         """
         self.auto_update.set(0)
-        for i in self.quiver_dict.values():
-            i.remove()
-        self.quiver_dict.clear()
-        self.vector_dict.clear()
-        self.tree.delete(*self.tree.get_children(self.tree_entries["given"]))
-        self.tree.delete(*self.tree.get_children(self.tree_entries["missing"]))
+        self.clear_vectors()
         self.expected_resultant: np.ndarray = np.array([0., 0.])
         for i in self.vector_str_vars.values():
             i.set("")
@@ -558,31 +1339,30 @@ class OneMissingVector(BaseWindow):
         self.rescale_graph()
         return
 
+    @profiled("solve")
     def find_missing_vector(self) -> None:
         """
         Computes and plots the missing vector on the graph using the listed vectors.
         """
         vector_name = self.expected_resultant_vars["name"].get()
+        missing_vector = self.cached_solve(engine.one_missing_vector, self.given_sum(), self.expected_resultant, names=(vector_name,))
 
-        self.vector_dict.pop(vector_name)
-        self.quiver_dict[vector_name].remove()
-        self.tree.delete(vector_name)
+        if missing_vector is None:
+            return
 
-        missing_vector: np.ndarray = self.expected_resultant - (sum(self.vector_dict.values()) if len(self.vector_dict) else np.array([0., 0.]))
         x, y = missing_vector[0], missing_vector[1]
-        magnitude = np.hypot(x, y)
-        direction = np.rad2deg(np.arctan2(y, x))
-        self.vector_dict[vector_name] = missing_vector
-        self.quiver_dict[vector_name] = self.plot.quiver(x, y, alpha=0.5, color="r", scale=1, scale_units="xy", angles="xy")
-        self.tree.insert(self.tree_entries["missing"], "end", vector_name, values=(vector_name, f"{x: .6f}", f"{y: .6f}", f"{magnitude: .6f}", f"{direction: .6f}"))
-        self.tree.item(self.tree_entries["missing"], open=True)
+        magnitude, direction = engine.to_polar(missing_vector)
+        self.vector_stores["missing"][vector_name] = missing_vector
+        self.vector_colors[vector_name] = "r"
         self.missing_vector_vars["x"].set(f"{x: .6f}")
         self.missing_vector_vars["y"].set(f"{y: .6f}")
         self.missing_vector_vars["r"].set(f"{magnitude: .6f}")
-        self.missing_vector_vars["theta"].set(f"{direction: .6f}")
+        self.missing_vector_vars["theta"].set(f"{self.display_angle(direction): .6f}")
 
+        self.update_vectors("missing")
         return
 
+    @profiled("callback")
     def get_expected_resultant(self) -> None:
 
         vector_name = self.expected_resultant_vars["name"].get()
@@ -596,55 +1376,47 @@ class OneMissingVector(BaseWindow):
                 self.missing_name_entry.focus_set()
                 return
 
-            elif vector_name in self.vector_dict:
+            elif vector_name in self.vector_stores["given"]:
 
                 showerror("Error", f"Vector \"{vector_name}\" already exists!")
                 self.auto_update.set(0)
                 self.missing_name_entry.focus_set()
                 return
 
-            elif vector_name in self.tree_entries.values():
-
-                showerror("Error", f"{self.tree_entries['given']}, {self.tree_entries['missing']}, and {self.tree_entries['other']} are currently reserved for the main categories.")
-                self.auto_update.set(0)
-                self.missing_name_entry.focus_set()
-                return
-
             elif self.expected_resultant_coordinate.get():
 
                 try:
-                    r = float(self.expected_resultant_vars["req1"].get())
+                    r = self.parse_magnitude(self.expected_resultant_vars["req1"].get())
                 except ValueError:
-                    showerror("Error", "Value must be a valid decimal number!")
+                    showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                     self.auto_update.set(0)
                     self.missing_req1_entry.focus_set()
                     return
 
                 try:
-                    theta = float(self.expected_resultant_vars["req2"].get())
+                    theta = self.parse_angle(self.expected_resultant_vars["req2"].get())
                 except ValueError:
-                    showerror("Error", "Value must be a valid decimal number!")
+                    showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                     self.auto_update.set(0)
                     self.missing_req2_entry.focus_set()
                     return
 
-                x = r * np.cos(np.radians(theta))
-                y = r * np.sin(np.radians(theta))
+                x, y = engine.from_polar(r, theta)
 
             else:
 
                 try:
-                    x = float(self.expected_resultant_vars["req1"].get())
+                    x = self.parse_magnitude(self.expected_resultant_vars["req1"].get())
                 except ValueError:
-                    showerror("Error", "Value must be a valid decimal number!")
+                    showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                     self.auto_update.set(0)
                     self.missing_req1_entry.focus_set()
                     return
 
                 try:
-                    y = float(self.expected_resultant_vars["req2"].get())
+                    y = self.parse_magnitude(self.expected_resultant_vars["req2"].get())
                 except ValueError:
-                    showerror("Error", "Value must be a valid decimal number!")
+                    showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                     self.auto_update.set(0)
                     self.missing_req2_entry.focus_set()
                     return
@@ -655,9 +1427,6 @@ class OneMissingVector(BaseWindow):
             self.cartesian.configure(state="disabled")
             self.polar.configure(state="disabled")
 
-            self.vector_dict[vector_name] = np.array([0., 0.])
-            self.quiver_dict[vector_name] = self.plot.quiver(0, 0)
-            self.tree.insert(self.tree_entries["missing"], "end", vector_name, values=(vector_name, 0, 0, 0, 0))
             self.expected_resultant = np.array([x, y])
 
             self.find_missing_vector()
@@ -679,9 +1448,9 @@ class TwoMissingMagnitudes(BaseWindow):
     """
     Window Class for finding the magnitudes of two vectors given their angles.
     """
-    def __init__(self, master: tk.Tk, min_width: int = 900, min_height: int = 700) -> None:
+    def __init__(self, master: tk.Tk, min_width: int = 900, min_height: int = 700, compensated_sum: bool = False) -> None:
 
-        super().__init__(master, min_width, min_height)
+        super().__init__(master, min_width, min_height, compensated_sum)
 
         self.requirements_vars: dict[str, tk.StringVar] = {
             "v1_name": tk.StringVar(self),
@@ -713,134 +1482,380 @@ class TwoMissingMagnitudes(BaseWindow):
         ttk.Label(self.missing_magnitudes_frame, text="X / Y: ").grid(column=0, row=5, sticky="nw", padx=10)
         ttk.Label(self.missing_magnitudes_frame, text="R / \u03B8: ").grid(column=2, row=5, sticky="nw", padx=10, pady=(3, 13))
 
-        self.vector1_name_entry = ttk.Entry(self.missing_magnitudes_frame, textvariable=self.requirements_vars["v1_name"])
+        self.vector1_name_entry = ttk.Entry(self.missing_magnitudes_frame, textvariable=self.requirements_vars["v1_name"])
+        self.vector1_name_entry.grid(column=1, row=1, sticky="new", padx=10, pady=(3, 0))
+        self.vector1_angle_entry = ttk.Entry(self.missing_magnitudes_frame, textvariable=self.requirements_vars["v1_angle"])
+        self.vector1_angle_entry.grid(column=3, row=1, sticky="new", padx=10, pady=(3, 13))
+        self.vector2_name_entry = ttk.Entry(self.missing_magnitudes_frame, textvariable=self.requirements_vars["v2_name"])
+        self.vector2_name_entry.grid(column=1, row=3, sticky="new", padx=10)
+        self.vector2_angle_entry = ttk.Entry(self.missing_magnitudes_frame, textvariable=self.requirements_vars["v2_angle"])
+        self.vector2_angle_entry.grid(column=3, row=3, sticky="new", padx=10, pady=(3, 13))
+        self.resultant_req1_entry = ttk.Entry(self.missing_magnitudes_frame, textvariable=self.requirements_vars["result_req1"])
+        self.resultant_req1_entry.grid(column=1, row=5, sticky="new", padx=10)
+        self.resultant_req2_entry = ttk.Entry(self.missing_magnitudes_frame, textvariable=self.requirements_vars["result_req2"])
+        self.resultant_req2_entry.grid(column=3, row=5, sticky="new", padx=10, pady=(3, 13))
+
+        self.cartesian = ttk.Radiobutton(self.missing_magnitudes_frame, text="X and Y components", variable=self.missing_coordinate, value=0)
+        self.cartesian.grid(column=0, row=6, columnspan=2, sticky="ew", padx=10, pady=10)
+        self.polar = ttk.Radiobutton(self.missing_magnitudes_frame, text="Magnitude and Direction", variable=self.missing_coordinate, value=1)
+        self.polar.grid(column=2, row=6, columnspan=2, sticky="ew", padx=10, pady=10)
+        ttk.Checkbutton(self.missing_magnitudes_frame, text="Find Missing Magnitudes and auto-update", variable=self.auto_update, command=self.get_expected_resultant).grid(column=0, row=7, columnspan=4, sticky="ew", padx=10, pady=10)
+
+        self.add_vector_button.configure(command=self.add_vector)
+        self.remove_vector_button.configure(command=self.rm_vector)
+        self.clear_all_button.configure(command=self.clear_all)
+        return
+
+    def update_solution(self) -> None:
+
+        if self.auto_update.get():
+            self.find_missing_magnitudes()
+
+        return
+
+    @profiled("callback")
+    def add_vector(self) -> None:
+        """
+        Add a vector to the table with a unique name and plot the vector into the plane.
+        """
+        if not self.add_given_vector():
+            return
+
+        self.update_solution()
+        self.get_resultant()
+        self.rescale_graph()
+
+        return
+
+    @profiled("callback")
+    def rm_vector(self) -> None:
+        """
+        Checks vector to be removed before removing from list and graph
+        """
+        vector1_name = self.requirements_vars["v1_name"].get()
+        vector2_name = self.requirements_vars["v2_name"].get()
+
+        if self.auto_update.get() and vector1_name in self.table.selection():
+
+            showerror("Error", f"Cannot remove \"{vector1_name}\" vector while auto-updating! Please disable auto-update first.")
+            return
+
+        elif self.auto_update.get() and vector2_name in self.table.selection():
+            showerror("Error", f"Cannot remove \"{vector2_name}\" vector while auto-updating! Please disable auto-update first.")
+            return
+
+        self.remove_vector()
+
+        self.update_solution()
+        self.get_resultant()
+        self.rescale_graph()
+        return
+
+    @profiled("callback")
+    def clear_all(self) -> None:
+
+        self.auto_update.set(0)
+        self.clear_vectors()
+        self.expected_resultant: np.ndarray = np.array([0., 0.])
+        for i in self.vector_str_vars.values():
+            i.set("")
+        for i in self.requirements_vars.values():
+            i.set("")
+        self.coordinate.set(0)
+        self.missing_coordinate.set(0)
+        self.vector1_name_entry.configure(state="enabled")
+        self.vector1_angle_entry.configure(state="enabled")
+        self.vector2_name_entry.configure(state="enabled")
+        self.vector2_angle_entry.configure(state="enabled")
+        self.resultant_req1_entry.configure(state="enabled")
+        self.resultant_req2_entry.configure(state="enabled")
+        self.cartesian.configure(state="enabled")
+        self.polar.configure(state="enabled")
+
+        self.get_resultant()
+        self.rescale_graph()
+        return
+
+    @profiled("solve")
+    def find_missing_magnitudes(self) -> None:
+
+        vector1_name = self.requirements_vars["v1_name"].get()
+        vector2_name = self.requirements_vars["v2_name"].get()
+
+        solution = self.cached_solve(engine.two_missing_magnitudes, self.given_sum(), self.angle_array, self.expected_resultant, names=(vector1_name, vector2_name))
+
+        if solution is None:
+            return
+
+        magnitude, _ = solution
+        x, y = engine.from_polar(magnitude, self.angle_array).T
+        self.vector_stores["missing"][vector1_name] = np.array([x[0], y[0]])
+        self.vector_stores["missing"][vector2_name] = np.array([x[1], y[1]])
+        self.vector_colors[vector1_name] = "b"
+        self.vector_colors[vector2_name] = "orange"
+        self.vector_stores["missing"].set_polar(vector1_name, magnitude[0], self.angle_array[0])
+        self.vector_stores["missing"].set_polar(vector2_name, magnitude[1], self.angle_array[1])
+
+        self.update_vectors("missing")
+        return
+
+    @profiled("callback")
+    def get_expected_resultant(self) -> None:
+
+        vector1_name = self.requirements_vars["v1_name"].get()
+        vector2_name = self.requirements_vars["v2_name"].get()
+
+        if self.auto_update.get():
+
+            if vector1_name == "":
+
+                showerror("Error", "Vector name is empty!")
+                self.auto_update.set(0)
+                self.vector1_name_entry.focus_set()
+                return
+
+            elif vector1_name in self.vector_stores["given"]:
+
+                showerror("Error", f"Vector \"{vector1_name}\" already exists!")
+                self.auto_update.set(0)
+                self.vector1_name_entry.focus_set()
+                return
+
+            elif vector2_name == "":
+
+                showerror("Error", "Vector name is empty!")
+                self.auto_update.set(0)
+                self.vector2_name_entry.focus_set()
+                return
+
+            elif vector2_name in self.vector_stores["given"]:
+
+                showerror("Error", f"Vector \"{vector2_name}\" already exists!")
+                self.auto_update.set(0)
+                self.vector2_name_entry.focus_set()
+                return
+
+            elif vector1_name == vector2_name:
+
+                showerror("Error", "Vector names must be different!")
+                self.auto_update.set(0)
+                self.vector1_name_entry.focus_set()
+                return
+
+            try:
+                self.angle_array[0] = self.parse_angle(self.requirements_vars["v1_angle"].get())
+            except ValueError:
+                showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
+                self.auto_update.set(0)
+                self.vector1_angle_entry.focus_set()
+                return
+
+            try:
+                self.angle_array[1] = self.parse_angle(self.requirements_vars["v2_angle"].get())
+            except ValueError:
+                showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
+                self.auto_update.set(0)
+                self.vector2_angle_entry.focus_set()
+                return
+
+            if engine.two_missing_magnitudes(self.given_sum(), self.angle_array, np.array([0., 0.]))[1]:
+
+                showerror("Error", "Angles must not be parallel! Might result in infinitely many solutions or no solution.")
+                self.auto_update.set(0)
+                self.vector2_angle_entry.focus_set()
+                return
+
+            if self.missing_coordinate.get():
+
+                try:
+                    resultant_magnitude = self.parse_magnitude(self.requirements_vars["result_req1"].get())
+                except ValueError:
+                    showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
+                    self.auto_update.set(0)
+                    self.resultant_req1_entry.focus_set()
+                    return
+
+                try:
+                    resultant_angle = self.parse_angle(self.requirements_vars["result_req2"].get())
+                except ValueError:
+                    showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
+                    self.auto_update.set(0)
+                    self.resultant_req2_entry.focus_set()
+                    return
+
+                resultant_x, resultant_y = engine.from_polar(resultant_magnitude, resultant_angle)
+
+            else:
+
+                try:
+                    resultant_x = self.parse_magnitude(self.requirements_vars["result_req1"].get())
+                except ValueError:
+                    showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
+                    self.auto_update.set(0)
+                    self.resultant_req1_entry.focus_set()
+                    return
+
+                try:
+                    resultant_y = self.parse_magnitude(self.requirements_vars["result_req2"].get())
+                except ValueError:
+                    showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
+                    self.auto_update.set(0)
+                    self.resultant_req2_entry.focus_set()
+                    return
+
+            self.vector1_name_entry.configure(state="disabled")
+            self.vector1_angle_entry.configure(state="disabled")
+            self.vector2_name_entry.configure(state="disabled")
+            self.vector2_angle_entry.configure(state="disabled")
+            self.resultant_req1_entry.configure(state="disabled")
+            self.resultant_req2_entry.configure(state="disabled")
+            self.cartesian.configure(state="disabled")
+            self.polar.configure(state="disabled")
+
+            self.expected_resultant = np.array([resultant_x, resultant_y])
+
+            self.find_missing_magnitudes()
+            self.get_resultant()
+            self.rescale_graph()
+
+        else:
+
+            self.vector1_name_entry.configure(state="enabled")
+            self.vector1_angle_entry.configure(state="enabled")
+            self.vector2_name_entry.configure(state="enabled")
+            self.vector2_angle_entry.configure(state="enabled")
+            self.resultant_req1_entry.configure(state="enabled")
+            self.resultant_req2_entry.configure(state="enabled")
+            self.cartesian.configure(state="enabled")
+            self.polar.configure(state="enabled")
+
+        return
+
+
+class TwoMissingDirections(BaseWindow):
+    """
+    Window Class for finding the angles of two vectors given their magnitudes.
+    """
+    def __init__(self, master: tk.Tk, min_width: int = 900, min_height: int = 700, compensated_sum: bool = False) -> None:
+
+        super().__init__(master, min_width, min_height, compensated_sum)
+        self.table.add_section("Other Angle", "Other \u03B8", self.vector_stores["Other Angle"])
+
+        self.requirements_vars: dict[str, tk.StringVar] = {
+            "v1_name": tk.StringVar(self),
+            "v1_magnitude": tk.StringVar(self),
+            "v2_name": tk.StringVar(self),
+            "v2_magnitude": tk.StringVar(self),
+            "result_req1": tk.StringVar(self),
+            "result_req2": tk.StringVar(self)
+        }
+        self.missing_coordinate = tk.IntVar(self, value=0)
+        self.magnitude_array = np.array([0., 0.])
+        self.auto_update = tk.IntVar(self, value=0)
+        self.expected_resultant = np.array([0., 0.])
+
+        self.missing_angle_frame = ttk.Labelframe(self.control_panel, text="Two Missing Directions (Blue)")
+        self.missing_angle_frame.grid(column=0, row=2, sticky="new", padx=10, pady=10)
+        self.missing_angle_frame.grid_columnconfigure(0, weight=1)
+        self.missing_angle_frame.grid_columnconfigure(1, weight=3)
+        self.missing_angle_frame.grid_columnconfigure(2, weight=1)
+        self.missing_angle_frame.grid_columnconfigure(3, weight=3)
+
+        ttk.Label(self.missing_angle_frame, text="Vector 1").grid(column=0, row=0, columnspan=4, sticky="nw", padx=10, pady=(10, 0))
+        ttk.Label(self.missing_angle_frame, text="Name: ").grid(column=0, row=1, sticky="nw", padx=10, pady=(3, 0))
+        ttk.Label(self.missing_angle_frame, text="Magnitude: ").grid(column=2, row=1, sticky="nw", padx=10, pady=(3, 13))
+        ttk.Label(self.missing_angle_frame, text="Vector 2").grid(column=0, row=2, columnspan=4, sticky="nw", padx=10, pady=(5, 0))
+        ttk.Label(self.missing_angle_frame, text="Name: ").grid(column=0, row=3, sticky="nw", padx=10)
+        ttk.Label(self.missing_angle_frame, text="Magnitude: ").grid(column=2, row=3, sticky="nw", padx=10, pady=(3, 13))
+        ttk.Label(self.missing_angle_frame, text="Expected Resultant").grid(column=0, row=4, columnspan=4, sticky="nw", padx=10, pady=(5, 0))
+        ttk.Label(self.missing_angle_frame, text="X / R: ").grid(column=0, row=5, sticky="nw", padx=10)
+        ttk.Label(self.missing_angle_frame, text="Y / \u03B8: ").grid(column=2, row=5, sticky="nw", padx=10, pady=(3, 13))
+
+        self.vector1_name_entry = ttk.Entry(self.missing_angle_frame, textvariable=self.requirements_vars["v1_name"])
         self.vector1_name_entry.grid(column=1, row=1, sticky="new", padx=10, pady=(3, 0))
-        self.vector1_angle_entry = ttk.Entry(self.missing_magnitudes_frame, textvariable=self.requirements_vars["v1_angle"])
-        self.vector1_angle_entry.grid(column=3, row=1, sticky="new", padx=10, pady=(3, 13))
-        self.vector2_name_entry = ttk.Entry(self.missing_magnitudes_frame, textvariable=self.requirements_vars["v2_name"])
+        self.vector1_magnitude_entry = ttk.Entry(self.missing_angle_frame, textvariable=self.requirements_vars["v1_magnitude"])
+        self.vector1_magnitude_entry.grid(column=3, row=1, sticky="new", padx=10, pady=(3, 13))
+        self.vector2_name_entry = ttk.Entry(self.missing_angle_frame, textvariable=self.requirements_vars["v2_name"])
         self.vector2_name_entry.grid(column=1, row=3, sticky="new", padx=10)
-        self.vector2_angle_entry = ttk.Entry(self.missing_magnitudes_frame, textvariable=self.requirements_vars["v2_angle"])
-        self.vector2_angle_entry.grid(column=3, row=3, sticky="new", padx=10, pady=(3, 13))
-        self.resultant_req1_entry = ttk.Entry(self.missing_magnitudes_frame, textvariable=self.requirements_vars["result_req1"])
+        self.vector2_magnitude_entry = ttk.Entry(self.missing_angle_frame, textvariable=self.requirements_vars["v2_magnitude"])
+        self.vector2_magnitude_entry.grid(column=3, row=3, sticky="new", padx=10, pady=(3, 13))
+        self.resultant_req1_entry = ttk.Entry(self.missing_angle_frame, textvariable=self.requirements_vars["result_req1"])
         self.resultant_req1_entry.grid(column=1, row=5, sticky="new", padx=10)
-        self.resultant_req2_entry = ttk.Entry(self.missing_magnitudes_frame, textvariable=self.requirements_vars["result_req2"])
+        self.resultant_req2_entry = ttk.Entry(self.missing_angle_frame, textvariable=self.requirements_vars["result_req2"])
         self.resultant_req2_entry.grid(column=3, row=5, sticky="new", padx=10, pady=(3, 13))
 
-        self.cartesian = ttk.Radiobutton(self.missing_magnitudes_frame, text="X and Y components", variable=self.missing_coordinate, value=0)
+        self.cartesian = ttk.Radiobutton(self.missing_angle_frame, text="X and Y components", variable=self.missing_coordinate, value=0)
         self.cartesian.grid(column=0, row=6, columnspan=2, sticky="ew", padx=10, pady=10)
-        self.polar = ttk.Radiobutton(self.missing_magnitudes_frame, text="Magnitude and Direction", variable=self.missing_coordinate, value=1)
+        self.polar = ttk.Radiobutton(self.missing_angle_frame, text="Magnitude and Direction", variable=self.missing_coordinate, value=1)
         self.polar.grid(column=2, row=6, columnspan=2, sticky="ew", padx=10, pady=10)
-        ttk.Checkbutton(self.missing_magnitudes_frame, text="Find Missing Magnitudes and auto-update", variable=self.auto_update, command=self.get_expected_resultant).grid(column=0, row=7, columnspan=4, sticky="ew", padx=10, pady=10)
+        ttk.Checkbutton(self.missing_angle_frame, text="Find Missing Directions and auto-update", variable=self.auto_update, command=self.get_expected_resultant).grid(column=0, row=7, columnspan=4, sticky="ew", padx=10, pady=10)
 
         self.add_vector_button.configure(command=self.add_vector)
         self.remove_vector_button.configure(command=self.rm_vector)
         self.clear_all_button.configure(command=self.clear_all)
+
+        self.no_solution_label = ttk.Label(self.control_panel, foreground="#DD2020", font=("Sans Serif", 12))
+        self.no_solution_label.grid(row=3, padx=20, pady=3, sticky="nw")
         return
 
+    def update_solution(self) -> None:
+
+        if self.auto_update.get():
+            self.find_missing_directions()
+
+        return
+
+    @profiled("callback")
     def add_vector(self) -> None:
         """
         Add a vector to the table with a unique name and plot the vector into the plane.
         """
-        vector_name = self.vector_str_vars["name"].get()
-
-        if vector_name == "":
-
-            showerror("Error", "Vector name is empty!")
-            self.name_entry.focus_set()
-            return
-
-        elif vector_name in self.vector_dict:
-
-            showerror("Error", f"Vector \"{vector_name}\" already exists!")
-            self.name_entry.focus_set()
+        if not self.add_given_vector():
             return
 
-        elif self.coordinate.get():
-
-            try:
-                r = float(self.vector_str_vars["req1"].get())
-            except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
-                self.req1_entry.focus_set()
-                return
-
-            try:
-                theta = float(self.vector_str_vars["req2"].get())
-            except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
-                self.req2_entry.focus_set()
-                return
-
-            x = r * np.cos(np.radians(theta))
-            y = r * np.sin(np.radians(theta))
-
-        else:
-
-            try:
-                x = float(self.vector_str_vars["req1"].get())
-            except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
-                self.req1_entry.focus_set()
-                return
-
-            try:
-                y = float(self.vector_str_vars["req2"].get())
-            except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
-                self.req2_entry.focus_set()
-                return
-
-            r = np.hypot(x, y)
-            theta_rad = np.arctan2(y, x)
-            theta = np.rad2deg(theta_rad)
-
-        self.vector_dict[vector_name] = np.array([x, y])
-        self.quiver_dict[vector_name] = self.plot.quiver(x, y, alpha=0.5, color="g", scale=1, scale_units="xy", angles="xy")
-        self.tree.insert(self.tree_entries["given"], "end", vector_name, values=(vector_name, f"{x: .6f}", f"{y: .6f}", f"{r: .6f}", f"{theta: .6f}"))
-        self.tree.item(self.tree_entries["given"], open=True)
-
-        if self.auto_update.get():
-            self.find_missing_magnitudes()
-
+        self.update_solution()
         self.get_resultant()
         self.rescale_graph()
-
         return
 
+    @profiled("callback")
     def rm_vector(self) -> None:
         """
         Checks vector to be removed before removing from list and graph
         """
         vector1_name = self.requirements_vars["v1_name"].get()
         vector2_name = self.requirements_vars["v2_name"].get()
+        selection = self.table.selection()
 
-        if self.auto_update.get() and vector1_name in self.tree.selection():
+        if self.auto_update.get() and vector1_name in selection:
 
             showerror("Error", f"Cannot remove \"{vector1_name}\" vector while auto-updating! Please disable auto-update first.")
             return
 
-        elif self.auto_update.get() and vector2_name in self.tree.selection():
+        elif self.auto_update.get() and vector2_name in selection:
             showerror("Error", f"Cannot remove \"{vector2_name}\" vector while auto-updating! Please disable auto-update first.")
             return
 
-        self.remove_vector()
+        elif self.auto_update.get() and vector1_name + " 2" in selection:
+            showerror("Error", f"Cannot remove \"{vector2_name}\" vector while auto-updating! Please disable auto-update first.")
+            return
 
-        if self.auto_update.get():
-            self.find_missing_magnitudes()
+        elif self.auto_update.get() and vector2_name + " 2" in selection:
+            showerror("Error", f"Cannot remove \"{vector2_name}\" vector while auto-updating! Please disable auto-update first.")
+            return
+
+        self.remove_vector()
 
+        self.update_solution()
         self.get_resultant()
         self.rescale_graph()
         return
 
+    @profiled("callback")
     def clear_all(self) -> None:
 
         self.auto_update.set(0)
-        for i in self.quiver_dict.values():
-            i.remove()
-        self.quiver_dict.clear()
-        self.vector_dict.clear()
-        self.tree.delete(*self.tree.get_children(self.tree_entries["given"]))
-        self.tree.delete(*self.tree.get_children(self.tree_entries["missing"]))
+        self.clear_vectors()
         self.expected_resultant: np.ndarray = np.array([0., 0.])
         for i in self.vector_str_vars.values():
             i.set("")
@@ -849,47 +1864,57 @@ class TwoMissingMagnitudes(BaseWindow):
         self.coordinate.set(0)
         self.missing_coordinate.set(0)
         self.vector1_name_entry.configure(state="enabled")
-        self.vector1_angle_entry.configure(state="enabled")
+        self.vector1_magnitude_entry.configure(state="enabled")
         self.vector2_name_entry.configure(state="enabled")
-        self.vector2_angle_entry.configure(state="enabled")
+        self.vector2_magnitude_entry.configure(state="enabled")
         self.resultant_req1_entry.configure(state="enabled")
         self.resultant_req2_entry.configure(state="enabled")
         self.cartesian.configure(state="enabled")
         self.polar.configure(state="enabled")
+        self.no_solution_label.configure(text="")
 
         self.get_resultant()
         self.rescale_graph()
         return
 
-    def find_missing_magnitudes(self) -> None:
+    @profiled("solve")
+    def find_missing_directions(self) -> None:
 
         vector1_name = self.requirements_vars["v1_name"].get()
         vector2_name = self.requirements_vars["v2_name"].get()
+        solution = self.cached_solve(engine.two_missing_directions, self.given_sum(), self.magnitude_array, self.expected_resultant, names=(vector1_name, vector2_name))
+
+        if solution is None:
+            return
+
+        self.no_solution_label.configure(text="")
+        angle1, angle2, count = solution
 
-        self.vector_dict.pop(vector1_name)
-        self.vector_dict.pop(vector2_name)
-        self.quiver_dict[vector1_name].remove()
-        self.quiver_dict[vector2_name].remove()
-        self.tree.delete(vector1_name)
-        self.tree.delete(vector2_name)
-
-        expected_sum: np.ndarray = self.expected_resultant - (sum(self.vector_dict.values()) if len(self.vector_dict) else np.array([0., 0.]))
-        angle_rad_array: np.ndarray = np.radians(self.angle_array)
-        matrix = np.array([np.cos(angle_rad_array), np.sin(angle_rad_array)])
-        inverted_matrix = np.linalg.inv(matrix)
-        magnitude = np.dot(inverted_matrix, expected_sum)
-        x = magnitude * np.cos(angle_rad_array)
-        y = magnitude * np.sin(angle_rad_array)
-        self.vector_dict[vector1_name] = np.array([x[0], y[0]])
-        self.vector_dict[vector2_name] = np.array([x[1], y[1]])
-        self.quiver_dict[vector1_name] = self.plot.quiver(x[0], y[0], alpha=0.5, color="b", scale=1, scale_units="xy", angles="xy")
-        self.quiver_dict[vector2_name] = self.plot.quiver(x[1], y[1], alpha=0.5, color="orange", scale=1, scale_units="xy", angles="xy")
-        self.tree.insert(self.tree_entries["missing"], "end", vector1_name, values=(vector1_name, f"{x[0]: .6f}", f"{y[0]: .6f}", f"{magnitude[0]: .6f}", f"{self.angle_array[0]: .6f}"))
-        self.tree.insert(self.tree_entries["missing"], "end", vector2_name, values=(vector2_name, f"{x[1]: .6f}", f"{y[1]: .6f}", f"{magnitude[1]: .6f}", f"{self.angle_array[1]: .6f}"))
-        self.tree.item(self.tree_entries["missing"], open=True)
+        if count == 0:
+            self.no_solution_label.configure(text="\u24D8 There is no valid solution!")
+            return
 
+        x1, y1 = engine.from_polar(self.magnitude_array, angle1).T
+        self.vector_stores["missing"][vector1_name] = np.array([x1[0], y1[0]])
+        self.vector_stores["missing"][vector2_name] = np.array([x1[1], y1[1]])
+        self.vector_colors[vector1_name] = "#008db9"
+        self.vector_colors[vector2_name] = "#71daff"
+        self.vector_stores["missing"].set_polar(vector1_name, self.magnitude_array[0], angle1[0])
+        self.vector_stores["missing"].set_polar(vector2_name, self.magnitude_array[1], angle1[1])
+
+        if count == 2:
+            x2, y2 = engine.from_polar(self.magnitude_array, angle2).T
+            self.vector_stores["Other Angle"][vector1_name + " 2"] = np.array([x2[0], y2[0]])
+            self.vector_stores["Other Angle"][vector2_name + " 2"] = np.array([x2[1], y2[1]])
+            self.vector_colors[vector1_name + " 2"] = "#cf4a49"
+            self.vector_colors[vector2_name + " 2"] = "#ff6666"
+            self.vector_stores["Other Angle"].set_polar(vector1_name + " 2", self.magnitude_array[0], angle2[0])
+            self.vector_stores["Other Angle"].set_polar(vector2_name + " 2", self.magnitude_array[1], angle2[1])
+
+        self.update_vectors("missing", "Other Angle")
         return
 
+    @profiled("callback")
     def get_expected_resultant(self) -> None:
 
         vector1_name = self.requirements_vars["v1_name"].get()
@@ -904,7 +1929,7 @@ class TwoMissingMagnitudes(BaseWindow):
                 self.vector1_name_entry.focus_set()
                 return
 
-            elif vector1_name in self.quiver_dict:
+            elif vector1_name in self.vector_stores["given"]:
 
                 showerror("Error", f"Vector \"{vector1_name}\" already exists!")
                 self.auto_update.set(0)
@@ -918,7 +1943,7 @@ class TwoMissingMagnitudes(BaseWindow):
                 self.vector2_name_entry.focus_set()
                 return
 
-            elif vector2_name in self.quiver_dict:
+            elif vector2_name in self.vector_stores["given"]:
 
                 showerror("Error", f"Vector \"{vector2_name}\" already exists!")
                 self.auto_update.set(0)
@@ -932,95 +1957,81 @@ class TwoMissingMagnitudes(BaseWindow):
                 self.vector1_name_entry.focus_set()
                 return
 
-            elif self.requirements_vars["v1_angle"].get() == self.requirements_vars["v2_angle"].get():
-
-                showerror("Error", "Angles must be different! Might result in infinitely solutions or no solution.")
-                self.auto_update.set(0)
-                self.vector2_angle_entry.focus_set()
-                return
-
             try:
-                self.angle_array[0] = float(self.requirements_vars["v1_angle"].get())
+                self.magnitude_array[0] = self.parse_magnitude(self.requirements_vars["v1_magnitude"].get())
             except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
+                showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                 self.auto_update.set(0)
-                self.vector1_angle_entry.focus_set()
+                self.vector1_magnitude_entry.focus_set()
                 return
 
             try:
-                self.angle_array[1] = float(self.requirements_vars["v2_angle"].get())
+                self.magnitude_array[1] = self.parse_magnitude(self.requirements_vars["v2_magnitude"].get())
             except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
+                showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                 self.auto_update.set(0)
-                self.vector2_angle_entry.focus_set()
+                self.vector2_magnitude_entry.focus_set()
                 return
 
             if self.missing_coordinate.get():
 
                 try:
-                    resultant_magnitude = float(self.requirements_vars["result_req1"].get())
+                    resultant_magnitude = self.parse_magnitude(self.requirements_vars["result_req1"].get())
                 except ValueError:
-                    showerror("Error", "Value must be a valid decimal number!")
+                    showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                     self.auto_update.set(0)
                     self.resultant_req1_entry.focus_set()
                     return
 
                 try:
-                    resultant_angle = float(self.requirements_vars["result_req2"].get())
+                    resultant_angle = self.parse_angle(self.requirements_vars["result_req2"].get())
                 except ValueError:
-                    showerror("Error", "Value must be a valid decimal number!")
+                    showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                     self.auto_update.set(0)
                     self.resultant_req2_entry.focus_set()
                     return
 
-                resultant_x = resultant_magnitude * np.cos(np.radians(resultant_angle))
-                resultant_y = resultant_magnitude * np.sin(np.radians(resultant_angle))
+                resultant_x, resultant_y = engine.from_polar(resultant_magnitude, resultant_angle)
 
             else:
 
                 try:
-                    resultant_x = float(self.requirements_vars["result_req1"].get())
+                    resultant_x = self.parse_magnitude(self.requirements_vars["result_req1"].get())
                 except ValueError:
-                    showerror("Error", "Value must be a valid decimal number!")
+                    showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                     self.auto_update.set(0)
                     self.resultant_req1_entry.focus_set()
                     return
 
                 try:
-                    resultant_y = float(self.requirements_vars["result_req2"].get())
+                    resultant_y = self.parse_magnitude(self.requirements_vars["result_req2"].get())
                 except ValueError:
-                    showerror("Error", "Value must be a valid decimal number!")
+                    showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                     self.auto_update.set(0)
                     self.resultant_req2_entry.focus_set()
                     return
 
             self.vector1_name_entry.configure(state="disabled")
-            self.vector1_angle_entry.configure(state="disabled")
+            self.vector1_magnitude_entry.configure(state="disabled")
             self.vector2_name_entry.configure(state="disabled")
-            self.vector2_angle_entry.configure(state="disabled")
+            self.vector2_magnitude_entry.configure(state="disabled")
             self.resultant_req1_entry.configure(state="disabled")
             self.resultant_req2_entry.configure(state="disabled")
             self.cartesian.configure(state="disabled")
             self.polar.configure(state="disabled")
 
-            self.vector_dict[vector1_name] = np.array([0., 0.])
-            self.vector_dict[vector2_name] = np.array([0., 0.])
-            self.quiver_dict[vector1_name] = self.plot.quiver(0, 0)
-            self.quiver_dict[vector2_name] = self.plot.quiver(0, 0)
-            self.tree.insert(self.tree_entries["missing"], "end", vector1_name, values=(vector1_name, 0, 0, 0, 0))
-            self.tree.insert(self.tree_entries["missing"], "end", vector2_name, values=(vector2_name, 0, 0, 0, 0))
             self.expected_resultant = np.array([resultant_x, resultant_y])
 
-            self.find_missing_magnitudes()
+            self.find_missing_directions()
             self.get_resultant()
             self.rescale_graph()
 
         else:
 
             self.vector1_name_entry.configure(state="enabled")
-            self.vector1_angle_entry.configure(state="enabled")
+            self.vector1_magnitude_entry.configure(state="enabled")
             self.vector2_name_entry.configure(state="enabled")
-            self.vector2_angle_entry.configure(state="enabled")
+            self.vector2_magnitude_entry.configure(state="enabled")
             self.resultant_req1_entry.configure(state="enabled")
             self.resultant_req2_entry.configure(state="enabled")
             self.cartesian.configure(state="enabled")
@@ -1029,64 +2040,64 @@ class TwoMissingMagnitudes(BaseWindow):
         return
 
 
-class TwoMissingDirections(BaseWindow):
+class MissingMagnitudeAndDirection(BaseWindow):
     """
-    Window Class for finding the angles of two vectors given their magnitudes.
+    Window Class for finding the magnitude of one vector given its angle and the angle of another given its magnitude.
     """
-    def __init__(self, master: tk.Tk, min_width: int = 900, min_height: int = 700) -> None:
+    def __init__(self, master: tk.Tk, min_width: int = 900, min_height: int = 700, compensated_sum: bool = False) -> None:
 
-        super().__init__(master, min_width, min_height)
-        self.tree_entries["Other Angle"] = self.tree.insert("", "end", text="Other \u03B8")
+        super().__init__(master, min_width, min_height, compensated_sum)
+        self.table.add_section("Other Angle", "Other \u03B8", self.vector_stores["Other Angle"])
 
         self.requirements_vars: dict[str, tk.StringVar] = {
             "v1_name": tk.StringVar(self),
-            "v1_magnitude": tk.StringVar(self),
+            "v1_angle": tk.StringVar(self),
             "v2_name": tk.StringVar(self),
             "v2_magnitude": tk.StringVar(self),
             "result_req1": tk.StringVar(self),
             "result_req2": tk.StringVar(self)
         }
         self.missing_coordinate = tk.IntVar(self, value=0)
-        self.magnitude_array = np.array([0., 0.])
+        self.angle = 0.
+        self.magnitude = 0.
         self.auto_update = tk.IntVar(self, value=0)
         self.expected_resultant = np.array([0., 0.])
-        self.solution_set_two: dict[str, np.ndarray] = {}
-
-        self.missing_angle_frame = ttk.Labelframe(self.control_panel, text="Two Missing Directions (Blue)")
-        self.missing_angle_frame.grid(column=0, row=2, sticky="new", padx=10, pady=10)
-        self.missing_angle_frame.grid_columnconfigure(0, weight=1)
-        self.missing_angle_frame.grid_columnconfigure(1, weight=3)
-        self.missing_angle_frame.grid_columnconfigure(2, weight=1)
-        self.missing_angle_frame.grid_columnconfigure(3, weight=3)
-
-        ttk.Label(self.missing_angle_frame, text="Vector 1").grid(column=0, row=0, columnspan=4, sticky="nw", padx=10, pady=(10, 0))
-        ttk.Label(self.missing_angle_frame, text="Name: ").grid(column=0, row=1, sticky="nw", padx=10, pady=(3, 0))
-        ttk.Label(self.missing_angle_frame, text="Magnitude: ").grid(column=2, row=1, sticky="nw", padx=10, pady=(3, 13))
-        ttk.Label(self.missing_angle_frame, text="Vector 2").grid(column=0, row=2, columnspan=4, sticky="nw", padx=10, pady=(5, 0))
-        ttk.Label(self.missing_angle_frame, text="Name: ").grid(column=0, row=3, sticky="nw", padx=10)
-        ttk.Label(self.missing_angle_frame, text="Magnitude: ").grid(column=2, row=3, sticky="nw", padx=10, pady=(3, 13))
-        ttk.Label(self.missing_angle_frame, text="Expected Resultant").grid(column=0, row=4, columnspan=4, sticky="nw", padx=10, pady=(5, 0))
-        ttk.Label(self.missing_angle_frame, text="X / R: ").grid(column=0, row=5, sticky="nw", padx=10)
-        ttk.Label(self.missing_angle_frame, text="Y / \u03B8: ").grid(column=2, row=5, sticky="nw", padx=10, pady=(3, 13))
 
-        self.vector1_name_entry = ttk.Entry(self.missing_angle_frame, textvariable=self.requirements_vars["v1_name"])
+        self.missing_frame = ttk.Labelframe(self.control_panel, text="Missing Magnitude and Direction (Blue)")
+        self.missing_frame.grid(column=0, row=2, sticky="new", padx=10, pady=10)
+        self.missing_frame.grid_columnconfigure(0, weight=1)
+        self.missing_frame.grid_columnconfigure(1, weight=3)
+        self.missing_frame.grid_columnconfigure(2, weight=1)
+        self.missing_frame.grid_columnconfigure(3, weight=3)
+
+        ttk.Label(self.missing_frame, text="Vector 1 (Missing Magnitude)").grid(column=0, row=0, columnspan=4, sticky="nw", padx=10, pady=(10, 0))
+        ttk.Label(self.missing_frame, text="Name: ").grid(column=0, row=1, sticky="nw", padx=10, pady=(3, 0))
+        ttk.Label(self.missing_frame, text="Angle: ").grid(column=2, row=1, sticky="nw", padx=10, pady=(3, 13))
+        ttk.Label(self.missing_frame, text="Vector 2 (Missing Direction)").grid(column=0, row=2, columnspan=4, sticky="nw", padx=10, pady=(5, 0))
+        ttk.Label(self.missing_frame, text="Name: ").grid(column=0, row=3, sticky="nw", padx=10)
+        ttk.Label(self.missing_frame, text="Magnitude: ").grid(column=2, row=3, sticky="nw", padx=10, pady=(3, 13))
+        ttk.Label(self.missing_frame, text="Expected Resultant").grid(column=0, row=4, columnspan=4, sticky="nw", padx=10, pady=(5, 0))
+        ttk.Label(self.missing_frame, text="X / R: ").grid(column=0, row=5, sticky="nw", padx=10)
+        ttk.Label(self.missing_frame, text="Y / \u03B8: ").grid(column=2, row=5, sticky="nw", padx=10, pady=(3, 13))
+
+        self.vector1_name_entry = ttk.Entry(self.missing_frame, textvariable=self.requirements_vars["v1_name"])
         self.vector1_name_entry.grid(column=1, row=1, sticky="new", padx=10, pady=(3, 0))
-        self.vector1_magnitude_entry = ttk.Entry(self.missing_angle_frame, textvariable=self.requirements_vars["v1_magnitude"])
-        self.vector1_magnitude_entry.grid(column=3, row=1, sticky="new", padx=10, pady=(3, 13))
-        self.vector2_name_entry = ttk.Entry(self.missing_angle_frame, textvariable=self.requirements_vars["v2_name"])
+        self.vector1_angle_entry = ttk.Entry(self.missing_frame, textvariable=self.requirements_vars["v1_angle"])
+        self.vector1_angle_entry.grid(column=3, row=1, sticky="new", padx=10, pady=(3, 13))
+        self.vector2_name_entry = ttk.Entry(self.missing_frame, textvariable=self.requirements_vars["v2_name"])
         self.vector2_name_entry.grid(column=1, row=3, sticky="new", padx=10)
-        self.vector2_magnitude_entry = ttk.Entry(self.missing_angle_frame, textvariable=self.requirements_vars["v2_magnitude"])
+        self.vector2_magnitude_entry = ttk.Entry(self.missing_frame, textvariable=self.requirements_vars["v2_magnitude"])
         self.vector2_magnitude_entry.grid(column=3, row=3, sticky="new", padx=10, pady=(3, 13))
-        self.resultant_req1_entry = ttk.Entry(self.missing_angle_frame, textvariable=self.requirements_vars["result_req1"])
+        self.resultant_req1_entry = ttk.Entry(self.missing_frame, textvariable=self.requirements_vars["result_req1"])
         self.resultant_req1_entry.grid(column=1, row=5, sticky="new", padx=10)
-        self.resultant_req2_entry = ttk.Entry(self.missing_angle_frame, textvariable=self.requirements_vars["result_req2"])
+        self.resultant_req2_entry = ttk.Entry(self.missing_frame, textvariable=self.requirements_vars["result_req2"])
         self.resultant_req2_entry.grid(column=3, row=5, sticky="new", padx=10, pady=(3, 13))
 
-        self.cartesian = ttk.Radiobutton(self.missing_angle_frame, text="X and Y components", variable=self.missing_coordinate, value=0)
+        self.cartesian = ttk.Radiobutton(self.missing_frame, text="X and Y components", variable=self.missing_coordinate, value=0)
         self.cartesian.grid(column=0, row=6, columnspan=2, sticky="ew", padx=10, pady=10)
-        self.polar = ttk.Radiobutton(self.missing_angle_frame, text="Magnitude and Direction", variable=self.missing_coordinate, value=1)
+        self.polar = ttk.Radiobutton(self.missing_frame, text="Magnitude and Direction", variable=self.missing_coordinate, value=1)
         self.polar.grid(column=2, row=6, columnspan=2, sticky="ew", padx=10, pady=10)
-        ttk.Checkbutton(self.missing_angle_frame, text="Find Missing Directions and auto-update", variable=self.auto_update, command=self.get_expected_resultant).grid(column=0, row=7, columnspan=4, sticky="ew", padx=10, pady=10)
+        ttk.Checkbutton(self.missing_frame, text="Find Missing Magnitude and Direction and auto-update", variable=self.auto_update, command=self.get_expected_resultant).grid(column=0, row=7, columnspan=4, sticky="ew", padx=10, pady=10)
 
         self.add_vector_button.configure(command=self.add_vector)
         self.remove_vector_button.configure(command=self.rm_vector)
@@ -1096,131 +2107,54 @@ class TwoMissingDirections(BaseWindow):
         self.no_solution_label.grid(row=3, padx=20, pady=3, sticky="nw")
         return
 
+    def update_solution(self) -> None:
+
+        if self.auto_update.get():
+            self.find_missing()
+
+        return
+
+    @profiled("callback")
     def add_vector(self) -> None:
         """
         Add a vector to the table with a unique name and plot the vector into the plane.
         """
-        vector_name = self.vector_str_vars["name"].get()
-
-        if vector_name == "":
-
-            showerror("Error", "Vector name is empty!")
-            self.name_entry.focus_set()
-            return
-
-        elif vector_name in self.vector_dict:
-
-            showerror("Error", f"Vector \"{vector_name}\" already exists!")
-            self.name_entry.focus_set()
+        if not self.add_given_vector():
             return
 
-        elif self.coordinate.get():
-
-            try:
-                r = float(self.vector_str_vars["req1"].get())
-            except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
-                self.req1_entry.focus_set()
-                return
-
-            try:
-                theta = float(self.vector_str_vars["req2"].get())
-            except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
-                self.req2_entry.focus_set()
-                return
-
-            x = r * np.cos(np.radians(theta))
-            y = r * np.sin(np.radians(theta))
-
-        else:
-
-            try:
-                x = float(self.vector_str_vars["req1"].get())
-            except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
-                self.req1_entry.focus_set()
-                return
-
-            try:
-                y = float(self.vector_str_vars["req2"].get())
-            except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
-                self.req2_entry.focus_set()
-                return
-
-            r = np.hypot(x, y)
-            theta_rad = np.arctan2(y, x)
-            theta = np.rad2deg(theta_rad)
-
-        self.vector_dict[vector_name] = np.array([x, y])
-        self.quiver_dict[vector_name] = self.plot.quiver(x, y, alpha=0.5, color="g", scale=1, scale_units="xy", angles="xy")
-        self.tree.insert(self.tree_entries["given"], "end", vector_name, values=(vector_name, f"{x: .6f}", f"{y: .6f}", f"{r: .6f}", f"{theta: .6f}"))
-        self.tree.item(self.tree_entries["given"], open=True)
-
-        if self.auto_update.get():
-            self.find_missing_directions()
-
+        self.update_solution()
         self.get_resultant()
-        self.rescale_graph(self.solution_set_two)
+        self.rescale_graph()
         return
 
+    @profiled("callback")
     def rm_vector(self) -> None:
         """
         Checks vector to be removed before removing from list and graph
         """
         vector1_name = self.requirements_vars["v1_name"].get()
         vector2_name = self.requirements_vars["v2_name"].get()
-        selection = self.tree.selection()
-
-        if self.auto_update.get() and vector1_name in selection:
-
-            showerror("Error", f"Cannot remove \"{vector1_name}\" vector while auto-updating! Please disable auto-update first.")
-            return
-
-        elif self.auto_update.get() and vector2_name in selection:
-            showerror("Error", f"Cannot remove \"{vector2_name}\" vector while auto-updating! Please disable auto-update first.")
-            return
-
-        elif self.auto_update.get() and vector1_name + " 2" in selection:
-            showerror("Error", f"Cannot remove \"{vector2_name}\" vector while auto-updating! Please disable auto-update first.")
-            return
-
-        elif self.auto_update.get() and vector2_name + " 2" in selection:
-            showerror("Error", f"Cannot remove \"{vector2_name}\" vector while auto-updating! Please disable auto-update first.")
-            return
+        selection = self.table.selection()
 
-        if vector1_name + " 2" in selection:
-            self.quiver_dict.pop(vector1_name + " 2").remove()
-            self.tree.delete(vector1_name + " 2")
-            self.solution_set_two.pop(vector1_name + " 2")
+        for name in (vector1_name, vector2_name):
 
-        if vector2_name + " 2" in selection:
-            self.quiver_dict.pop(vector2_name + " 2").remove()
-            self.tree.delete(vector2_name + " 2")
-            self.solution_set_two.pop(vector2_name + " 2")
+            if self.auto_update.get() and (name in selection or name + " 2" in selection):
 
-        if len(self.tree.selection()):
-            self.remove_vector()
+                showerror("Error", f"Cannot remove \"{name}\" vector while auto-updating! Please disable auto-update first.")
+                return
 
-        if self.auto_update.get():
-            self.find_missing_directions()
+        self.remove_vector()
 
+        self.update_solution()
         self.get_resultant()
-        self.rescale_graph(self.solution_set_two)
+        self.rescale_graph()
         return
 
+    @profiled("callback")
     def clear_all(self) -> None:
 
         self.auto_update.set(0)
-        for i in self.quiver_dict.values():
-            i.remove()
-        self.quiver_dict.clear()
-        self.vector_dict.clear()
-        self.solution_set_two.clear()
-        self.tree.delete(*self.tree.get_children(self.tree_entries["given"]))
-        self.tree.delete(*self.tree.get_children(self.tree_entries["missing"]))
-        self.tree.delete(*self.tree.get_children(self.tree_entries["Other Angle"]))
+        self.clear_vectors()
         self.expected_resultant: np.ndarray = np.array([0., 0.])
         for i in self.vector_str_vars.values():
             i.set("")
@@ -1229,7 +2163,7 @@ class TwoMissingDirections(BaseWindow):
         self.coordinate.set(0)
         self.missing_coordinate.set(0)
         self.vector1_name_entry.configure(state="enabled")
-        self.vector1_magnitude_entry.configure(state="enabled")
+        self.vector1_angle_entry.configure(state="enabled")
         self.vector2_name_entry.configure(state="enabled")
         self.vector2_magnitude_entry.configure(state="enabled")
         self.resultant_req1_entry.configure(state="enabled")
@@ -1242,96 +2176,44 @@ class TwoMissingDirections(BaseWindow):
         self.rescale_graph()
         return
 
-    def find_missing_directions(self) -> None:
+    @profiled("solve")
+    def find_missing(self) -> None:
 
-        self.no_solution_label.configure(text="")
         vector1_name = self.requirements_vars["v1_name"].get()
         vector2_name = self.requirements_vars["v2_name"].get()
+        solution = self.cached_solve(engine.missing_magnitude_and_direction, self.given_sum(), self.angle, self.magnitude, self.expected_resultant, names=(vector1_name, vector2_name))
 
-        if vector1_name in self.vector_dict:
-            self.vector_dict.pop(vector1_name)
-            self.vector_dict.pop(vector2_name)
-            self.quiver_dict.pop(vector1_name).remove()
-            self.quiver_dict.pop(vector2_name).remove()
-            self.tree.delete(vector1_name)
-            self.tree.delete(vector2_name)
-
-        if vector1_name + ' 2' in self.quiver_dict:
-            self.quiver_dict.pop(vector1_name + " 2").remove()
-            self.quiver_dict.pop(vector2_name + " 2").remove()
-            self.tree.delete(vector1_name + " 2")
-            self.tree.delete(vector2_name + " 2")
-            self.solution_set_two.pop(vector1_name + " 2")
-            self.solution_set_two.pop(vector2_name + " 2")
-
-        expected_sum: np.ndarray = self.expected_resultant - (sum(self.vector_dict.values()) if len(self.vector_dict) else np.array([0, 0]))
-        expected_sum_magnitude = np.hypot(expected_sum[0], expected_sum[1])
-        expected_sum_angle = np.arctan2(expected_sum[1], expected_sum[0])
+        if solution is None:
+            return
 
-        try:
-            def get_sin(angle):
-                return (expected_sum_magnitude*np.sin(expected_sum_angle) - self.magnitude_array[1]*np.sin(angle)) / self.magnitude_array[0]
-
-            def get_cos(angle):
-                return (expected_sum_magnitude*np.cos(expected_sum_angle) - self.magnitude_array[1]*np.cos(angle)) / self.magnitude_array[0]
-
-            angle_diff = np.arccos((expected_sum_magnitude ** 2 + self.magnitude_array[1] ** 2 - self.magnitude_array[0] ** 2) / (2 * expected_sum_magnitude * self.magnitude_array[1]))
-            angle2_1 = expected_sum_angle + angle_diff
-            angle2_2 = expected_sum_angle - angle_diff
-            angle1_1 = np.arctan2(get_sin(angle2_1), get_cos(angle2_1))
-            angle1_2 = np.arctan2(get_sin(angle2_2), get_cos(angle2_2))
-
-            x1: np.ndarray = np.array([self.magnitude_array[0]*np.cos(angle1_1), self.magnitude_array[1]*np.cos(angle2_1)])
-            y1: np.ndarray = np.array([self.magnitude_array[0]*np.sin(angle1_1), self.magnitude_array[1]*np.sin(angle2_1)])
-            x2: np.ndarray = np.array([self.magnitude_array[0]*np.cos(angle1_2), self.magnitude_array[1]*np.cos(angle2_2)])
-            y2: np.ndarray = np.array([self.magnitude_array[0]*np.sin(angle1_2), self.magnitude_array[1]*np.sin(angle2_2)])
-            angle1: np.ndarray = np.array([np.arctan2(y1[0], x1[0]), np.arctan2(y1[1], x1[1])])
-            angle2: np.ndarray = np.array([np.arctan2(y2[0], x2[0]), np.arctan2(y2[1], x2[1])])
-
-            check_sum1 = np.around(sum(self.vector_dict.values()) + np.array([x1[0], y1[0]]) + np.array([x1[1], y1[1]]), decimals=8)
-            check_sum2 = np.around(sum(self.vector_dict.values()) + np.array([x2[0], y2[0]]) + np.array([x2[1], y2[1]]), decimals=8)
-            expected_resultant = np.around(self.expected_resultant, decimals=8)
-
-            if (check_sum1 == expected_resultant).all() and (check_sum2 != expected_resultant).all():
-                self.vector_dict[vector1_name] = np.array([x1[0], y1[0]])
-                self.vector_dict[vector2_name] = np.array([x1[1], y1[1]])
-                self.quiver_dict[vector1_name] = self.plot.quiver(x1[0], y1[0], alpha=0.5, color="#008db9", scale=1, scale_units="xy", angles="xy")
-                self.quiver_dict[vector2_name] = self.plot.quiver(x1[1], y1[1], alpha=0.5, color="#71daff", scale=1, scale_units="xy", angles="xy")
-                self.tree.insert(self.tree_entries["missing"], "end", vector1_name, values=(vector1_name, f"{x1[0]: .6f}", f"{y1[0]: .6f}", f"{self.magnitude_array[0]: .6f}", f"{np.rad2deg(angle1[0]): .6f}"))
-                self.tree.insert(self.tree_entries["missing"], "end", vector2_name, values=(vector2_name, f"{x1[1]: .6f}", f"{y1[1]: .6f}", f"{self.magnitude_array[1]: .6f}", f"{np.rad2deg(angle1[1]): .6f}"))
-                self.tree.item(self.tree_entries["missing"], open=True)
-
-            elif (check_sum2 == expected_resultant).all() and (check_sum1 != expected_resultant).all():
-                self.vector_dict[vector1_name] = np.array([x2[0], y2[0]])
-                self.vector_dict[vector2_name] = np.array([x2[1], y2[1]])
-                self.quiver_dict[vector1_name] = self.plot.quiver(x2[0], y2[0], alpha=0.5, color="#cf4a49", scale=1, scale_units="xy", angles="xy")
-                self.quiver_dict[vector2_name] = self.plot.quiver(x2[1], y2[1], alpha=0.5, color="#ff6666", scale=1, scale_units="xy", angles="xy")
-                self.tree.insert(self.tree_entries["missing"], "end", vector1_name, values=(vector1_name, f"{x2[0]: .6f}", f"{y2[0]: .6f}", f"{self.magnitude_array[0]: .6f}", f"{np.rad2deg(angle2[0]): .6f}"))
-                self.tree.insert(self.tree_entries["missing"], "end", vector2_name, values=(vector2_name, f"{x2[1]: .6f}", f"{y2[1]: .6f}", f"{self.magnitude_array[1]: .6f}", f"{np.rad2deg(angle2[1]): .6f}"))
-                self.tree.item(self.tree_entries["missing"], open=True)
-
-            elif (check_sum1 == expected_resultant).all() and (check_sum2 == expected_resultant).all():
-                self.vector_dict[vector1_name] = np.array([x1[0], y1[0]])
-                self.vector_dict[vector2_name] = np.array([x1[1], y1[1]])
-                self.solution_set_two[vector1_name + " 2"] = np.array([x2[0], y2[0]])
-                self.solution_set_two[vector2_name + " 2"] = np.array([x2[1], y2[1]])
-                self.quiver_dict[vector1_name] = self.plot.quiver(x1[0], y1[0], alpha=0.5, color="#008db9", scale=1, scale_units="xy", angles="xy")
-                self.quiver_dict[vector2_name] = self.plot.quiver(x1[1], y1[1], alpha=0.5, color="#71daff", scale=1, scale_units="xy", angles="xy")
-                self.quiver_dict[vector1_name + " 2"] = self.plot.quiver(x2[0], y2[0], alpha=0.5, color="#cf4a49", scale=1, scale_units="xy", angles="xy")
-                self.quiver_dict[vector2_name + " 2"] = self.plot.quiver(x2[1], y2[1], alpha=0.5, color="#ff6666", scale=1, scale_units="xy", angles="xy")
-                self.tree.insert(self.tree_entries["missing"], "end", vector1_name, values=(vector1_name, f"{x1[0]: .6f}", f"{y1[0]: .6f}", f"{self.magnitude_array[0]: .6f}", f"{np.rad2deg(angle1[0]): .6f}"))
-                self.tree.insert(self.tree_entries["missing"], "end", vector2_name, values=(vector2_name, f"{x1[1]: .6f}", f"{y1[1]: .6f}", f"{self.magnitude_array[1]: .6f}", f"{np.rad2deg(angle1[1]): .6f}"))
-                self.tree.insert(self.tree_entries["Other Angle"], "end", vector1_name + " 2", values=(vector1_name, f"{x2[0]: .6f}", f"{y2[0]: .6f}", f"{self.magnitude_array[0]: .6f}", f"{np.rad2deg(angle2[0]): .6f}"))
-                self.tree.insert(self.tree_entries["Other Angle"], "end", vector2_name + " 2", values=(vector2_name, f"{x2[1]: .6f}", f"{y2[1]: .6f}", f"{self.magnitude_array[1]: .6f}", f"{np.rad2deg(angle2[1]): .6f}"))
-                self.tree.item(self.tree_entries["missing"], open=True)
-                self.tree.item(self.tree_entries["Other Angle"], open=True)
-                return
+        self.no_solution_label.configure(text="")
+        magnitudes, angles, valid = solution
 
-        except RuntimeWarning:
+        if not valid[0]:
             self.no_solution_label.configure(text="\u24D8 There is no valid solution!")
+            return
 
+        x1, y1 = engine.from_polar(magnitudes, self.angle).T
+        x2, y2 = engine.from_polar(self.magnitude, angles).T
+        self.vector_stores["missing"][vector1_name] = np.array([x1[0], y1[0]])
+        self.vector_stores["missing"][vector2_name] = np.array([x2[0], y2[0]])
+        self.vector_colors[vector1_name] = "#008db9"
+        self.vector_colors[vector2_name] = "#71daff"
+        self.vector_stores["missing"].set_polar(vector1_name, magnitudes[0], self.angle)
+        self.vector_stores["missing"].set_polar(vector2_name, self.magnitude, angles[0])
+
+        if valid[1]:
+            self.vector_stores["Other Angle"][vector1_name + " 2"] = np.array([x1[1], y1[1]])
+            self.vector_stores["Other Angle"][vector2_name + " 2"] = np.array([x2[1], y2[1]])
+            self.vector_colors[vector1_name + " 2"] = "#cf4a49"
+            self.vector_colors[vector2_name + " 2"] = "#ff6666"
+            self.vector_stores["Other Angle"].set_polar(vector1_name + " 2", magnitudes[1], self.angle)
+            self.vector_stores["Other Angle"].set_polar(vector2_name + " 2", self.magnitude, angles[1])
+
+        self.update_vectors("missing", "Other Angle")
         return
 
+    @profiled("callback")
     def get_expected_resultant(self) -> None:
 
         vector1_name = self.requirements_vars["v1_name"].get()
@@ -1346,7 +2228,7 @@ class TwoMissingDirections(BaseWindow):
                 self.vector1_name_entry.focus_set()
                 return
 
-            elif vector1_name in self.quiver_dict:
+            elif vector1_name in self.vector_stores["given"]:
 
                 showerror("Error", f"Vector \"{vector1_name}\" already exists!")
                 self.auto_update.set(0)
@@ -1360,7 +2242,7 @@ class TwoMissingDirections(BaseWindow):
                 self.vector2_name_entry.focus_set()
                 return
 
-            elif vector2_name in self.quiver_dict:
+            elif vector2_name in self.vector_stores["given"]:
 
                 showerror("Error", f"Vector \"{vector2_name}\" already exists!")
                 self.auto_update.set(0)
@@ -1375,17 +2257,17 @@ class TwoMissingDirections(BaseWindow):
                 return
 
             try:
-                self.magnitude_array[0] = float(self.requirements_vars["v1_magnitude"].get())
+                self.angle = self.parse_angle(self.requirements_vars["v1_angle"].get())
             except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
+                showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                 self.auto_update.set(0)
-                self.vector1_magnitude_entry.focus_set()
+                self.vector1_angle_entry.focus_set()
                 return
 
             try:
-                self.magnitude_array[1] = float(self.requirements_vars["v2_magnitude"].get())
+                self.magnitude = self.parse_magnitude(self.requirements_vars["v2_magnitude"].get())
             except ValueError:
-                showerror("Error", "Value must be a valid decimal number!")
+                showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                 self.auto_update.set(0)
                 self.vector2_magnitude_entry.focus_set()
                 return
@@ -1393,44 +2275,43 @@ class TwoMissingDirections(BaseWindow):
             if self.missing_coordinate.get():
 
                 try:
-                    resultant_magnitude = float(self.requirements_vars["result_req1"].get())
+                    resultant_magnitude = self.parse_magnitude(self.requirements_vars["result_req1"].get())
                 except ValueError:
-                    showerror("Error", "Value must be a valid decimal number!")
+                    showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                     self.auto_update.set(0)
                     self.resultant_req1_entry.focus_set()
                     return
 
                 try:
-                    resultant_angle = float(self.requirements_vars["result_req2"].get())
+                    resultant_angle = self.parse_angle(self.requirements_vars["result_req2"].get())
                 except ValueError:
-                    showerror("Error", "Value must be a valid decimal number!")
+                    showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                     self.auto_update.set(0)
                     self.resultant_req2_entry.focus_set()
                     return
 
-                resultant_x = resultant_magnitude * np.cos(np.radians(resultant_angle))
-                resultant_y = resultant_magnitude * np.sin(np.radians(resultant_angle))
+                resultant_x, resultant_y = engine.from_polar(resultant_magnitude, resultant_angle)
 
             else:
 
                 try:
-                    resultant_x = float(self.requirements_vars["result_req1"].get())
+                    resultant_x = self.parse_magnitude(self.requirements_vars["result_req1"].get())
                 except ValueError:
-                    showerror("Error", "Value must be a valid decimal number!")
+                    showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                     self.auto_update.set(0)
                     self.resultant_req1_entry.focus_set()
                     return
 
                 try:
-                    resultant_y = float(self.requirements_vars["result_req2"].get())
+                    resultant_y = self.parse_magnitude(self.requirements_vars["result_req2"].get())
                 except ValueError:
-                    showerror("Error", "Value must be a valid decimal number!")
+                    showerror("Error", "Value must be a valid decimal number, optionally followed by a unit!")
                     self.auto_update.set(0)
                     self.resultant_req2_entry.focus_set()
                     return
 
             self.vector1_name_entry.configure(state="disabled")
-            self.vector1_magnitude_entry.configure(state="disabled")
+            self.vector1_angle_entry.configure(state="disabled")
             self.vector2_name_entry.configure(state="disabled")
             self.vector2_magnitude_entry.configure(state="disabled")
             self.resultant_req1_entry.configure(state="disabled")
@@ -1438,22 +2319,16 @@ class TwoMissingDirections(BaseWindow):
             self.cartesian.configure(state="disabled")
             self.polar.configure(state="disabled")
 
-            self.vector_dict[vector1_name] = np.array([0, 0])
-            self.vector_dict[vector2_name] = np.array([0, 0])
-            self.quiver_dict[vector1_name] = self.plot.quiver(0, 0)
-            self.quiver_dict[vector2_name] = self.plot.quiver(0, 0)
-            self.tree.insert(self.tree_entries["missing"], "end", vector1_name, values=(vector1_name, 0, 0, 0, 0))
-            self.tree.insert(self.tree_entries["missing"], "end", vector2_name, values=(vector2_name, 0, 0, 0, 0))
             self.expected_resultant = np.array([resultant_x, resultant_y])
 
-            self.find_missing_directions()
+            self.find_missing()
             self.get_resultant()
-            self.rescale_graph(self.solution_set_two)
+            self.rescale_graph()
 
         else:
 
             self.vector1_name_entry.configure(state="enabled")
-            self.vector1_magnitude_entry.configure(state="enabled")
+            self.vector1_angle_entry.configure(state="enabled")
             self.vector2_name_entry.configure(state="enabled")
             self.vector2_magnitude_entry.configure(state="enabled")
             self.resultant_req1_entry.configure(state="enabled")
@@ -1466,17 +2341,36 @@ class TwoMissingDirections(BaseWindow):
 
 def main():
 
+    parser = argparse.ArgumentParser(description="VectorSim")
+    parser.add_argument("--timing", action="store_true", help="report startup times on stderr")
+    parser.add_argument("--no-prewarm", action="store_true", help="import matplotlib only when the first window opens")
+    parser.add_argument("--profile", action="store_true", help="time every callback and show a timing panel in each window")
+    parser.add_argument("--compensated", action="store_true", help="keep the resultant with compensated summation so long add/remove sessions do not drift")
+    args = parser.parse_args()
+    STARTUP_TIMER.enabled = args.timing
+    PROFILER.enabled = args.profile
+
     root = HdpiTk()
     root.title("VectorSim")
     root.minsize(300, 100)
     root.grid_columnconfigure(0, weight=1)
     root.grid_propagate(True)
 
-    ttk.Button(root, text="Resultant Vector", command=lambda: ResultantWindow(root)).grid(column=0, row=0, sticky="nsew", padx=20, pady=(20, 0), ipadx=5, ipady=5)
-    ttk.Button(root, text="One Missing Vector", command=lambda: OneMissingVector(root)).grid(column=0, row=1, sticky="nsew", padx=20, ipadx=5, ipady=5)
-    ttk.Button(root, text="Two Missing Magnitudes", command=lambda: TwoMissingMagnitudes(root)).grid(column=0, row=2, sticky="nsew", padx=20, ipadx=5, ipady=5)
-    ttk.Button(root, text="Two Missing Directions", command=lambda: TwoMissingDirections(root)).grid(column=0, row=3, sticky="nsew", padx=20, pady=(0, 20), ipadx=5, ipady=5)
+    ttk.Button(root, text="Resultant Vector", command=lambda: ResultantWindow(root, compensated_sum=args.compensated)).grid(column=0, row=0, sticky="nsew", padx=20, pady=(20, 0), ipadx=5, ipady=5)
+    ttk.Button(root, text="One Missing Direction", command=lambda: OneMissingDirection(root, compensated_sum=args.compensated)).grid(column=0, row=1, sticky="nsew", padx=20, ipadx=5, ipady=5)
+    ttk.Button(root, text="One Missing Vector", command=lambda: OneMissingVector(root, compensated_sum=args.compensated)).grid(column=0, row=2, sticky="nsew", padx=20, ipadx=5, ipady=5)
+    ttk.Button(root, text="Two Missing Magnitudes", command=lambda: TwoMissingMagnitudes(root, compensated_sum=args.compensated)).grid(column=0, row=3, sticky="nsew", padx=20, ipadx=5, ipady=5)
+    ttk.Button(root, text="Two Missing Directions", command=lambda: TwoMissingDirections(root, compensated_sum=args.compensated)).grid(column=0, row=4, sticky="nsew", padx=20, ipadx=5, ipady=5)
+    ttk.Button(root, text="Missing Magnitude and Direction", command=lambda: MissingMagnitudeAndDirection(root, compensated_sum=args.compensated)).grid(column=0, row=5, sticky="nsew", padx=20, pady=(0, 20), ipadx=5, ipady=5)
+
+    def launcher_shown() -> None:
+
+        STARTUP_TIMER.launcher_shown()
+        if not args.no_prewarm:
+            prewarm_plotting()
+        return
 
+    root.after_idle(launcher_shown)
     root.mainloop()
     return
 
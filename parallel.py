@@ -0,0 +1,144 @@
+"""
+VectorSim parallel - Splits stacked engine problems across a process pool through shared memory
+
+The inputs are copied once into shared memory blocks, every worker solves its own slice of the batch axis in place,
+and the outputs are written straight into shared output blocks, so no array is ever pickled.
+"""
+import atexit
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import engine
+
+# Below this many problems per worker the pool costs more than the solve itself.
+MIN_CHUNK = 10_000
+
+_pools: dict[int, ProcessPoolExecutor] = {}
+
+BlockSpec = tuple[str, tuple[int, ...], str]
+
+
+def cpu_count() -> int:
+
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Reuses one pool per worker count, so repeated solves do not pay for starting processes again.
+    """
+    if workers not in _pools:
+        _pools[workers] = ProcessPoolExecutor(max_workers=workers)
+    return _pools[workers]
+
+
+@atexit.register
+def shutdown() -> None:
+
+    for pool in _pools.values():
+        pool.shutdown(cancel_futures=True)
+    _pools.clear()
+    return
+
+
+def _create(shape: tuple[int, ...], dtype: np.dtype) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+
+    block = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1))
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _attach(spec: BlockSpec) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+    """
+    Maps a block created by the parent. Pool workers share the parent's resource tracker, so the block is still
+    unlinked only once, by the parent.
+    """
+    name, shape, dtype = spec
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _solve_slice(solver: str, inputs: list[BlockSpec], outputs: list[BlockSpec], start: int, stop: int, options: dict) -> None:
+    """
+    Worker - Solves problems start to stop of the shared inputs into the shared outputs.
+    """
+    blocks, arrays = zip(*(_attach(spec) for spec in inputs + outputs))
+
+    try:
+        results = getattr(engine, solver)(*(array[start:stop] for array in arrays[:len(inputs)]), **options)
+        for output, result in zip(arrays[len(inputs):], results if isinstance(results, tuple) else (results,)):
+            output[start:stop] = result
+    finally:
+        # Views into a block must be gone before it can be closed.
+        arrays = results = None
+        for block in blocks:
+            block.close()
+
+    return
+
+
+def solve(solver: Callable, *inputs: np.ndarray, workers: int | None = None, **options) -> tuple[np.ndarray, ...] | np.ndarray:
+    """
+    Runs an engine solver over stacked problems split into one chunk per worker.
+
+    Every input must be stacked along the same leading batch axis. workers=None uses every available core; batches too
+    small to be worth a pool are solved in this process.
+    """
+    arrays = [np.ascontiguousarray(array, dtype=float) for array in inputs]
+    size = len(arrays[0]) if arrays and arrays[0].ndim else 0
+
+    if any(array.ndim == 0 or len(array) != size for array in arrays):
+        raise ValueError("Parallel solving needs every input stacked along the same leading batch axis!")
+
+    workers = min(workers or cpu_count(), max(size // MIN_CHUNK, 1))
+
+    if workers <= 1:
+        return solver(*arrays, **options)
+
+    # Solving the first problem gives the dtype and trailing shape of every output.
+    sample = solver(*(array[:1] for array in arrays), **options)
+    single = not isinstance(sample, tuple)
+    sample = (sample,) if single else sample
+
+    blocks: list[shared_memory.SharedMemory] = []
+    outputs: list[np.ndarray] = []
+    specs: list[BlockSpec] = []
+
+    try:
+        for array in arrays:
+            block, shared = _create(array.shape, array.dtype)
+            shared[...] = array
+            blocks.append(block)
+            specs.append((block.name, array.shape, array.dtype.str))
+
+        for result in map(np.asarray, sample):
+            block, shared = _create((size, *result.shape[1:]), result.dtype)
+            blocks.append(block)
+            outputs.append(shared)
+            specs.append((block.name, shared.shape, shared.dtype.str))
+
+        shared = None
+        bounds = np.linspace(0, size, workers + 1).astype(int)
+        futures = [
+            get_pool(workers).submit(_solve_slice, solver.__name__, specs[:len(arrays)], specs[len(arrays):], int(start), int(stop), options)
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        for future in futures:
+            future.result()
+
+        results = tuple(output.copy() for output in outputs)
+
+    finally:
+        # Views into a block must be gone before it can be closed.
+        outputs.clear()
+        shared = None
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    return results[0] if single else results
@@ -0,0 +1,197 @@
+"""
+VectorSim profiling - Opt-in timing of the case window callbacks and their solve, table, artist and draw phases
+
+Run main.py with --profile to time every button callback and the phases nested in it. Each case window then shows
+a live timing panel and can export the recorded events as a Chrome trace, which chrome://tracing and Perfetto open.
+"""
+import functools
+import json
+import os
+import threading
+import time
+import tkinter as tk
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from tkinter import ttk
+from tkinter.filedialog import asksaveasfilename
+from tkinter.messagebox import showerror
+
+
+class PhaseStats:
+    """
+    Call count and wall times in seconds of one timed method.
+    """
+    def __init__(self, category: str) -> None:
+
+        self.category = category
+        self.count = 0
+        self.total = 0.
+        self.last = 0.
+        self.max = 0.
+        return
+
+    def add(self, duration: float) -> None:
+
+        self.count += 1
+        self.total += duration
+        self.last = duration
+        self.max = max(self.max, duration)
+        return
+
+
+class Profiler:
+    """
+    Records nested timed phases as complete events and keeps running stats per phase name.
+
+    Only the latest events are kept, so a long session does not grow without bound. While disabled, timed methods
+    run without any recording.
+    """
+    def __init__(self, enabled: bool = False, max_events: int = 200_000) -> None:
+
+        self.enabled = enabled
+        self.origin = time.perf_counter()
+        self.events: deque[tuple[str, str, float, float, int, dict]] = deque(maxlen=max_events)
+        self.stats: dict[str, PhaseStats] = {}
+        return
+
+    @contextmanager
+    def phase(self, name: str, category: str, **details: object) -> Iterator[None]:
+        """
+        Times the body under a phase name, nested inside whatever phase is already running.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self.events.append((name, category, start, duration, threading.get_ident(), details))
+            self.stats.setdefault(name, PhaseStats(category)).add(duration)
+
+    def reset(self) -> None:
+
+        self.events.clear()
+        self.stats.clear()
+        return
+
+    def summary(self) -> list[tuple[str, PhaseStats]]:
+        """
+        Stats of every phase, slowest in total first.
+        """
+        return sorted(self.stats.items(), key=lambda item: item[1].total, reverse=True)
+
+    def chrome_trace(self) -> dict:
+        """
+        Events in the Chrome trace event format, with timestamps in microseconds since the profiler started.
+        """
+        pid = os.getpid()
+        events: list[dict] = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "VectorSim"}}]
+        events += [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self.origin) * 1e6,
+                "dur": duration * 1e6,
+                "pid": pid,
+                "tid": tid,
+                "args": details
+            }
+            for name, category, start, duration, tid, details in self.events
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> None:
+
+        with open(path, "w") as file:
+            json.dump(self.chrome_trace(), file)
+        return
+
+
+PROFILER = Profiler()
+
+
+def profiled(category: str) -> Callable[[Callable], Callable]:
+    """
+    Times every call of a window method as a phase of the given category, named after the method.
+    """
+    def decorator(method: Callable) -> Callable:
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+
+            if not PROFILER.enabled:
+                return method(self, *args, **kwargs)
+
+            with PROFILER.phase(method.__name__, category, window=type(self).__name__):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class ProfilerPanel(ttk.Labelframe):
+    """
+    Live table of the slowest phases in milliseconds, with buttons to export a Chrome trace and to reset.
+    """
+    def __init__(self, master: tk.Misc, rows: int = 10, interval: int = 500) -> None:
+
+        super().__init__(master, text="Timing (ms)")
+        self.rows = rows
+        self.interval = interval
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_columnconfigure(1, weight=1)
+
+        self.stats_label = ttk.Label(self, font="TkFixedFont", justify="left")
+        self.stats_label.grid(column=0, row=0, columnspan=2, sticky="nsew", padx=10, pady=(5, 0))
+        ttk.Button(self, text="Export trace...", command=self.export).grid(column=0, row=1, sticky="ew", padx=(10, 5), pady=10)
+        ttk.Button(self, text="Reset", command=self.reset).grid(column=1, row=1, sticky="ew", padx=(5, 10), pady=10)
+
+        self.update_id: str | None = None
+        self.update_stats()
+        return
+
+    def update_stats(self) -> None:
+        """
+        Refreshes the table and schedules the next refresh for as long as the panel exists.
+        """
+        self.show_stats()
+        self.update_id = self.after(self.interval, self.update_stats)
+        return
+
+    def show_stats(self) -> None:
+
+        lines = [f"{'phase':<24}{'calls':>6}{'last':>9}{'mean':>9}{'max':>9}"]
+        for name, stats in PROFILER.summary()[:self.rows]:
+            lines.append(f"{name[:23]:<24}{stats.count:>6}{stats.last * 1e3:>9.2f}{stats.total / stats.count * 1e3:>9.2f}{stats.max * 1e3:>9.2f}")
+
+        self.stats_label.configure(text="\n".join(lines))
+        return
+
+    def export(self) -> None:
+
+        path = asksaveasfilename(parent=self, title="Export trace", defaultextension=".json", filetypes=[("Chrome trace", "*.json")])
+
+        if not path:
+            return
+
+        try:
+            PROFILER.export_chrome_trace(path)
+        except OSError as error:
+            showerror("Error", f"Cannot export \"{path}\": {error}")
+
+        return
+
+    def reset(self) -> None:
+
+        PROFILER.reset()
+        self.show_stats()
+        return
+
+    def destroy(self) -> None:
+
+        if self.update_id is not None:
+            self.after_cancel(self.update_id)
+        super().destroy()
+        return
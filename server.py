@@ -0,0 +1,207 @@
+"""
+VectorSim solve server - Serves the engine solvers to local services over JSON lines, without Tk or matplotlib
+
+Every request line is one problem in the format read by batch, such as {"id": 7, "case": "two_missing_directions",
+"given": [[1, 2]], "magnitudes": [3, 4], "expected": [5, 6]}, and is answered by one solution line in request order.
+Requests from every connection that arrive within --max-delay-ms of each other are coalesced into one vectorized
+solve of at most --max-batch problems.
+
+Usage: python server.py [--host 127.0.0.1] [--port 8765 | --unix /tmp/vectorsim.sock] [--max-batch 256] [--max-delay-ms 2]
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import batch
+
+CASES = ("resultant", "one_missing_vector", "two_missing_magnitudes", "two_missing_directions")
+
+# Longest request line, which bounds how many given vectors one problem may have.
+LINE_LIMIT = 1 << 24
+
+
+class MicroBatcher:
+    """
+    Collects requests into batches, closing a batch once it holds max_batch problems or max_delay seconds after its
+    first problem arrived, whichever comes first.
+    """
+    def __init__(self, max_batch: int = 256, max_delay: float = 0.002) -> None:
+
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.queue: asyncio.Queue[tuple[dict, asyncio.Future]] = asyncio.Queue()
+        self.batches = 0
+        self.solved = 0
+        return
+
+    def submit(self, record: dict) -> asyncio.Future:
+        """
+        Queues a problem and returns the future of its solution.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((record, future))
+        return future
+
+    async def collect(self) -> list[tuple[dict, asyncio.Future]]:
+        """
+        Waits for the first request of a batch, then for more until the batch is full or its latency budget runs out.
+        """
+        pending = [await self.queue.get()]
+        deadline = time.perf_counter() + self.max_delay
+
+        while len(pending) < self.max_batch:
+
+            # Whatever is already queued joins without waiting.
+            while len(pending) < self.max_batch and not self.queue.empty():
+                pending.append(self.queue.get_nowait())
+
+            remaining = deadline - time.perf_counter()
+            if len(pending) == self.max_batch or remaining <= 0:
+                break
+
+            try:
+                pending.append(await asyncio.wait_for(self.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return pending
+
+    async def run(self) -> None:
+        """
+        Solves batches forever with one vectorized call per case.
+        """
+        while True:
+            pending = await self.collect()
+            records = [record for record, _ in pending]
+
+            try:
+                solutions = list(batch.solve_chunk(records))
+            except Exception as error:
+                # One broken batch must not take the server down with it.
+                solutions = [{"error": f"Solve failed: {error}"} for _ in records]
+
+            for (_, future), solution in zip(pending, solutions):
+                if not future.done():
+                    future.set_result(solution)
+
+            self.batches += 1
+            self.solved += len(pending)
+
+
+def parse(line: bytes) -> dict:
+    """
+    Turns a request line into a problem, or into a record holding why it cannot be one.
+    """
+    try:
+        record = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError) as error:
+        return {"error": f"Invalid JSON: {error}"}
+
+    if not isinstance(record, dict):
+        return {"error": "Request must be a JSON object"}
+    if record.get("case") not in CASES:
+        return {**record, "error": f"Unknown case \"{record.get('case')}\", expected one of {', '.join(CASES)}"}
+
+    return record
+
+
+class SolveServer:
+    """
+    Answers every connection in request order while its requests are solved in batches shared with other connections.
+    """
+    def __init__(self, batcher: MicroBatcher) -> None:
+
+        self.batcher = batcher
+        return
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+
+        answers: asyncio.Queue[asyncio.Future | None] = asyncio.Queue()
+        replying = asyncio.create_task(self.reply(answers, writer))
+
+        try:
+            # Requests are read ahead of their answers, so clients may pipeline as many as they like.
+            while line := await reader.readline():
+                if line.strip():
+                    answers.put_nowait(self.batcher.submit(parse(line)))
+        except ConnectionError:
+            pass
+        except ValueError:
+            # readline gives up on a line over LINE_LIMIT, after which the rest of the stream cannot be framed again.
+            too_long = asyncio.get_running_loop().create_future()
+            too_long.set_result({"error": f"Request line longer than {LINE_LIMIT:,} bytes"})
+            answers.put_nowait(too_long)
+        finally:
+            answers.put_nowait(None)
+            await replying
+
+        return
+
+    @staticmethod
+    async def reply(answers: asyncio.Queue, writer: asyncio.StreamWriter) -> None:
+
+        try:
+            while (future := await answers.get()) is not None:
+                writer.write(batch.dumps(await future).encode() + b"\n")
+                if answers.empty():
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+        return
+
+
+async def serve(host: str, port: int, unix: str | None, max_batch: int, max_delay: float) -> None:
+
+    batcher = MicroBatcher(max_batch, max_delay)
+    handler = SolveServer(batcher).handle
+
+    if unix is not None:
+        server = await asyncio.start_unix_server(handler, unix, limit=LINE_LIMIT)
+    else:
+        server = await asyncio.start_server(handler, host, port, limit=LINE_LIMIT)
+
+    addresses = ", ".join(str(socket.getsockname()) for socket in server.sockets)
+    print(f"Serving {', '.join(CASES)} on {addresses} (batches of up to {max_batch}, {max_delay * 1e3:g} ms budget)", flush=True)
+
+    solving = asyncio.create_task(batcher.run())
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        solving.cancel()
+        if batcher.batches:
+            print(f"Solved {batcher.solved:,} problems in {batcher.batches:,} batches ({batcher.solved / batcher.batches:.1f} per batch)", flush=True)
+
+    return
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description="Serve the VectorSim solvers over JSON lines.")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on")
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--max-batch", type=int, default=256, help="most problems solved per vectorized call")
+    parser.add_argument("--max-delay-ms", type=float, default=2.0, help="longest a request waits for others to batch with")
+    args = parser.parse_args()
+
+    if args.max_batch < 1:
+        parser.error("max batch must be positive")
+    if args.max_delay_ms < 0:
+        parser.error("max delay must not be negative")
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.max_batch, args.max_delay_ms / 1e3))
+    except KeyboardInterrupt:
+        pass
+
+    return
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+VectorSim simulation - Point masses driven by the given vectors, stepped in fixed time steps across every body at once
+
+Each given vector drives one body from the origin, as its velocity, its acceleration or a force on a unit mass, and
+one more body is driven by the resultant, so the sum of the vectors can be watched as a motion.
+"""
+from collections import deque
+
+import numpy as np
+
+MODES = ("velocity", "acceleration", "force")
+
+# Mode that fits the vectors of each quantity, with displacements taken as distances covered per second.
+QUANTITY_MODES = {"displacement": "velocity", "velocity": "velocity", "acceleration": "acceleration", "force": "force"}
+
+
+class Simulation:
+    """
+    Bodies with positions and velocities of shape (N, 2) under constant accelerations, advanced with velocity Verlet
+    in fixed time steps, which is exact for constant accelerations.
+
+    advance() takes the wall time elapsed since the last frame and carries the remainder of a step over to the next
+    call, so the motion runs at the same speed whatever the frame rate.
+    """
+    def __init__(self, vectors: np.ndarray, mode: str = "velocity", masses: np.ndarray | None = None, step: float = 1 / 240, max_steps: int = 16) -> None:
+
+        if mode not in MODES:
+            raise ValueError(f"Unknown simulation mode \"{mode}\", expected one of {', '.join(MODES)}")
+
+        vectors = np.asarray(vectors, dtype=float).reshape(-1, 2)
+        masses = np.ones(len(vectors)) if masses is None else np.asarray(masses, dtype=float)
+
+        self.mode = mode
+        self.step = step
+        self.max_steps = max_steps
+        self.time = 0.
+        self.backlog = 0.
+        self.positions = np.zeros_like(vectors)
+
+        if mode == "velocity":
+            self.velocities = vectors.copy()
+            self.accelerations = np.zeros_like(vectors)
+        else:
+            self.velocities = np.zeros_like(vectors)
+            self.accelerations = vectors / masses[:, None] if mode == "force" else vectors.copy()
+
+        return
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def advance(self, elapsed: float) -> int:
+        """
+        Takes as many whole steps as fit in the elapsed seconds plus the carried remainder, dropping time beyond
+        max_steps so a stalled frame does not make the next ones catch up forever. Returns the steps taken.
+        """
+        self.backlog += elapsed
+        steps = min(int(self.backlog / self.step), self.max_steps)
+        self.backlog = 0. if steps == self.max_steps else self.backlog - steps * self.step
+
+        if steps == 0:
+            return 0
+
+        # Constant accelerations let every step of the frame be taken in one update.
+        duration = steps * self.step
+        self.positions += self.velocities * duration + 0.5 * self.accelerations * duration ** 2
+        self.velocities += self.accelerations * duration
+        self.time += duration
+        return steps
+
+    def extents(self) -> tuple[np.ndarray, np.ndarray]:
+        return self.positions.min(axis=0), self.positions.max(axis=0)
+
+
+class FrameStats:
+    """
+    Intervals between recent frames and the time spent on each, with the rate and percentiles they add up to.
+    """
+    def __init__(self, target_fps: float = 60., size: int = 600) -> None:
+
+        self.budget = 1 / target_fps
+        self.intervals: deque[float] = deque(maxlen=size)
+        self.work: deque[float] = deque(maxlen=size)
+        self.last: float | None = None
+        self.frames = 0
+        return
+
+    def add(self, start: float, work: float) -> None:
+        """
+        Records a frame that started at a perf_counter time and took work seconds to step and draw.
+        """
+        if self.last is not None:
+            self.intervals.append(start - self.last)
+
+        self.last = start
+        self.frames += 1
+        self.work.append(work)
+        return
+
+    def summary(self) -> dict[str, float]:
+        """
+        Frame rate, 50th and 99th percentile frame work in seconds, and the share of frames over the frame budget.
+        """
+        if not self.work:
+            return {"fps": 0., "p50": 0., "p99": 0., "late": 0.}
+
+        work = np.array(self.work)
+        p50, p99 = np.percentile(work, [50, 99])
+        return {
+            "fps": len(self.intervals) / sum(self.intervals) if self.intervals else 0.,
+            "p50": float(p50),
+            "p99": float(p99),
+            "late": float(np.mean(work > self.budget))
+        }
+
@@ -0,0 +1,72 @@
+"""
+VectorSim solve cache - Bounded LRU memo of engine solver results keyed on the solver inputs
+"""
+from collections import OrderedDict
+from collections.abc import Callable
+
+import numpy as np
+
+
+class SolveCache:
+    """
+    Least recently used cache of solver results with hit and miss counters.
+
+    Keys hold the exact float values of every input, so a hit returns the same arrays the solver gave for bit-identical
+    inputs. The cached arrays are shared between hits and must not be modified.
+    """
+    def __init__(self, maxsize: int = 256) -> None:
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results: OrderedDict[tuple, object] = OrderedDict()
+        return
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    @staticmethod
+    def key(solver: Callable, *inputs: np.ndarray | float) -> tuple:
+        """
+        Hashable key of a solver and its inputs.
+        """
+        return (solver.__name__, *(tuple(np.asarray(value, dtype=float).ravel().tolist()) for value in inputs))
+
+    def solve(self, solver: Callable, *inputs: np.ndarray | float) -> object:
+        """
+        Returns the cached result of the solver for these inputs, or solves and caches it, evicting the least recently
+        used result once the cache is full.
+        """
+        key = self.key(solver, *inputs)
+
+        if key in self._results:
+            self.hits += 1
+            self._results.move_to_end(key)
+            return self._results[key]
+
+        self.misses += 1
+        result = self._results[key] = solver(*inputs)
+
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+        return result
+
+    def touch(self, key: tuple) -> None:
+        """
+        Counts a hit on a key its caller reused without calling solve, and marks its result as most recently used if it
+        is still cached.
+        """
+        self.hits += 1
+        if key in self._results:
+            self._results.move_to_end(key)
+        return
+
+    def clear(self) -> None:
+
+        self._results.clear()
+        self.hits = self.misses = 0
+        return
+
+    def info(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._results), "maxsize": self.maxsize}
@@ -0,0 +1,180 @@
+"""
+VectorSim streaming - Resultants of vector files too large to load, computed chunk by chunk in constant memory
+
+Binary files hold raw (N, 2) floats and are memory-mapped, .npy files are memory-mapped through their header, and
+CSV files are parsed a chunk of lines at a time.
+
+Usage: python stream.py forces.bin [--dtype float32] [--polar] [--chunk-size 1048576] [--expected X Y]
+"""
+import argparse
+import csv
+import itertools
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import numpy as np
+
+import engine
+
+
+def iter_binary(path: str | Path, dtype: str = "float64", chunk_size: int = 1 << 20) -> Iterator[np.ndarray]:
+    """
+    Yields (chunk_size, 2) views of a memory-mapped file of raw vectors, or of a .npy file.
+    """
+    if Path(path).suffix.lower() == ".npy":
+        vectors = np.load(path, mmap_mode="r")
+    else:
+        vectors = np.memmap(path, dtype=dtype, mode="r")
+
+    if vectors.size % 2:
+        raise ValueError("File does not hold a whole number of 2D vectors!")
+
+    vectors = vectors.reshape(-1, 2)
+    for start in range(0, len(vectors), chunk_size):
+        yield vectors[start:start + chunk_size]
+
+
+def iter_csv(path: str | Path, chunk_size: int = 1 << 16) -> Iterator[np.ndarray]:
+    """
+    Yields (chunk_size, 2) arrays of the last two columns of a CSV file, skipping a header line if there is one.
+    """
+    with open(path, newline="") as file:
+
+        rows = csv.reader(line for line in file if line.strip())
+        first = next(rows, None)
+
+        if first is None:
+            return
+
+        try:
+            pending = [np.array(first[-2:], dtype=float)]
+        except ValueError:
+            pending = []
+
+        while True:
+            chunk = pending + [row[-2:] for row in itertools.islice(rows, chunk_size - len(pending))]
+            pending = []
+
+            if not chunk:
+                return
+
+            yield np.array(chunk, dtype=float).reshape(-1, 2)
+
+
+def iter_vectors(path: str | Path, dtype: str = "float64", chunk_size: int = 1 << 20) -> Iterator[np.ndarray]:
+    """
+    Yields chunks of a .csv file, or of a .npy or raw binary file otherwise.
+    """
+    if Path(path).suffix.lower() == ".csv":
+        return iter_csv(path, min(chunk_size, 1 << 16))
+    return iter_binary(path, dtype, chunk_size)
+
+
+class StreamingResultant:
+    """
+    Resultant and extents of a stream of vector chunks.
+
+    Every chunk is summed with NumPy's pairwise summation and the chunk sums are carried in a compensated running sum,
+    so the result stays accurate over billions of vectors. The extents match what rescale_graph needs to fit every
+    vector on the plane.
+    """
+    def __init__(self, polar: bool = False) -> None:
+
+        self.polar = polar
+        self.running_sum = engine.RunningSum(compensated=True)
+        self.count = 0
+        self.minimum = np.zeros(2)
+        self.maximum = np.zeros(2)
+        return
+
+    def add(self, chunk: np.ndarray) -> None:
+        """
+        Adds a chunk of vectors of shape (N, 2), given as magnitudes and angles in degrees if polar.
+        """
+        chunk = np.asarray(chunk, dtype=float)
+
+        if len(chunk) == 0:
+            return
+
+        if self.polar:
+            chunk = engine.from_polar(chunk[:, 0], chunk[:, 1])
+
+        self.running_sum.add(engine.resultant(chunk))
+        np.minimum(self.minimum, chunk.min(axis=0), out=self.minimum)
+        np.maximum(self.maximum, chunk.max(axis=0), out=self.maximum)
+        self.count += len(chunk)
+        return
+
+    @property
+    def value(self) -> np.ndarray:
+        return self.running_sum.value
+
+    def summary(self) -> dict[str, float]:
+        """
+        Resultant in both coordinate forms with the extents of the vectors, the origin and the resultant.
+        """
+        x, y = self.value
+        r, theta = engine.to_polar(self.value)
+        return {
+            "count": self.count,
+            "x": float(x),
+            "y": float(y),
+            "r": float(r),
+            "theta": float(theta),
+            "x_min": float(min(self.minimum[0], x)),
+            "x_max": float(max(self.maximum[0], x)),
+            "y_min": float(min(self.minimum[1], y)),
+            "y_max": float(max(self.maximum[1], y))
+        }
+
+
+def stream_resultant(chunks: Iterable[np.ndarray], polar: bool = False) -> StreamingResultant:
+    """
+    Case 1 - Reduces a stream of vector chunks to their resultant.
+    """
+    reduction = StreamingResultant(polar)
+    for chunk in chunks:
+        reduction.add(chunk)
+    return reduction
+
+
+def stream_one_missing_vector(chunks: Iterable[np.ndarray], expected: np.ndarray, polar: bool = False) -> np.ndarray:
+    """
+    Case 4 - Finds the vector that completes a stream of given vectors to the expected resultant.
+    """
+    return engine.one_missing_vector(stream_resultant(chunks, polar).value[None, :], expected)
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description="Stream the resultant of a vector file too large to load.")
+    parser.add_argument("path", help="raw binary (N, 2) floats, .npy or .csv file")
+    parser.add_argument("--dtype", default="float64", help="float type of raw binary files (default: float64)")
+    parser.add_argument("--polar", action="store_true", help="columns are magnitudes and angles in degrees")
+    parser.add_argument("--chunk-size", type=int, default=1 << 20, help="vectors per chunk")
+    parser.add_argument("--expected", nargs=2, type=float, metavar=("X", "Y"), help="also find the one missing vector")
+    args = parser.parse_args()
+
+    if args.chunk_size < 1:
+        parser.error("chunk size must be positive")
+
+    start = time.perf_counter()
+    reduction = stream_resultant(iter_vectors(args.path, args.dtype, args.chunk_size), args.polar)
+    elapsed = time.perf_counter() - start
+
+    for name, value in reduction.summary().items():
+        print(f"{name:<10}{value: .6f}" if isinstance(value, float) else f"{name:<10}{value:,}")
+
+    if args.expected is not None:
+        missing = engine.one_missing_vector(reduction.value[None, :], np.array(args.expected))
+        magnitude, direction = engine.to_polar(missing)
+        print(f"{'missing':<10}X={missing[0]: .6f}  Y={missing[1]: .6f}  R={magnitude: .6f}  \u03B8={direction: .6f}")
+
+    size = Path(args.path).stat().st_size
+    print(f"{'elapsed':<10}{elapsed * 1e3: .3f} ms  {reduction.count / max(elapsed, 1e-12):,.0f} vectors/s  {size / max(elapsed, 1e-12) / 1e6:,.1f} MB/s")
+    return
+
+
+if __name__ == "__main__":
+    main()
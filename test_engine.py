@@ -0,0 +1,49 @@
+"""
+Tests of the branches of engine.missing_magnitude_and_direction against the vectors they should add up to
+"""
+import numpy as np
+
+import engine
+
+
+def test_both_non_negative_branches_are_valid() -> None:
+
+    magnitudes, angles, valid = engine.missing_magnitude_and_direction(np.zeros((1, 2)), 0., 1., np.array([3., 0.]))
+
+    np.testing.assert_array_equal(valid, [True, True])
+    np.testing.assert_allclose(magnitudes, [4., 2.])
+    np.testing.assert_allclose(angles, [180., 0.], atol=1e-12)
+
+
+def test_negative_magnitude_branch_is_invalid() -> None:
+
+    magnitudes, angles, valid = engine.missing_magnitude_and_direction(np.zeros((1, 2)), 0., 1., np.array([0.5, 0.]))
+
+    np.testing.assert_array_equal(valid, [True, False])
+    np.testing.assert_allclose(magnitudes[0], 1.5)
+    np.testing.assert_allclose(angles[0], 180.)
+    assert np.isnan(magnitudes[1]) and np.isnan(angles[1])
+
+
+def test_both_negative_branches_are_invalid() -> None:
+
+    magnitudes, angles, valid = engine.missing_magnitude_and_direction(np.zeros((1, 2)), 0., 1., np.array([-3., 0.]))
+
+    assert not valid.any()
+    assert np.isnan(magnitudes).all() and np.isnan(angles).all()
+
+
+def test_valid_branches_add_up_to_the_expected_sum() -> None:
+
+    rng = np.random.default_rng(0)
+    given = rng.normal(size=(200, 3, 2))
+    expected = rng.normal(size=(200, 2))
+    magnitude = rng.uniform(0.1, 3., size=200)
+    angle = rng.uniform(-180., 180., size=200)
+
+    magnitudes, angles, valid = engine.missing_magnitude_and_direction(given, angle, magnitude, expected)
+    assert valid.any()
+    assert (magnitudes[valid] >= 0).all()
+
+    total = given.sum(axis=1)[:, None, :] + engine.from_polar(magnitudes, angle[:, None]) + engine.from_polar(magnitude[:, None], angles)
+    np.testing.assert_allclose(total[valid], np.broadcast_to(expected[:, None, :], total.shape)[valid], atol=1e-9)
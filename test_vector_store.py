@@ -0,0 +1,92 @@
+"""
+Tests of the cached tip-to-tail tails and the extents of VectorStore against a brute-force cumulative sum and min/max
+"""
+import numpy as np
+import pytest
+
+from vector_store import VectorStore
+
+
+def expected_tails(store: VectorStore) -> np.ndarray:
+    return np.cumsum(np.vstack([np.zeros((1, 2)), store.xy]), axis=0)[:-1]
+
+
+def expected_extents(store: VectorStore) -> tuple[np.ndarray, np.ndarray]:
+    if len(store) == 0:
+        return np.full(2, np.inf), np.full(2, -np.inf)
+    return store.xy.min(axis=0), store.xy.max(axis=0)
+
+
+def assert_store_matches(store: VectorStore) -> None:
+    np.testing.assert_allclose(store.tails, expected_tails(store), atol=1e-9)
+    for extent, expected in zip(store.extents, expected_extents(store)):
+        np.testing.assert_array_equal(extent, expected)
+
+
+@pytest.mark.parametrize("remove", ["pop", "remove_many"])
+def test_tails_after_removing_the_last_row_and_growing(remove: str) -> None:
+
+    rng = np.random.default_rng(0)
+    store = VectorStore()
+    store.extend([f"v{i}" for i in range(16)], rng.normal(size=(16, 2)))
+    store.tails
+
+    if remove == "pop":
+        store.pop("v15")
+    else:
+        store.remove_many(["v15"])
+
+    store.extend(["a", "b", "c"], rng.normal(size=(3, 2)))
+    np.testing.assert_allclose(store.tails, expected_tails(store))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_store_matches_brute_force_under_random_operations(seed: int) -> None:
+
+    rng = np.random.default_rng(seed)
+    store = VectorStore(capacity=1)
+    names = (f"v{i}" for i in range(1 << 62))
+
+    for _ in range(3000):
+        operation = rng.integers(8) if len(store) > 2 else rng.integers(2)
+
+        if operation == 0:
+            store[next(names)] = rng.normal(size=2)
+        elif operation == 1:
+            count = int(rng.integers(1, 20))
+            store.extend([next(names) for _ in range(count)], rng.normal(size=(count, 2)))
+        elif operation == 2:
+            store.pop(store.names[rng.integers(len(store))])
+        elif operation == 3:
+            store.remove_many(rng.choice(store.names, int(rng.integers(1, len(store))), replace=False).tolist())
+        elif operation == 4:
+            store.move(store.names[rng.integers(len(store))], int(rng.integers(len(store))))
+        elif operation == 5:
+            store[store.names[rng.integers(len(store))]] = rng.normal(size=2)
+        elif operation == 6:
+            store.remove_many(store.names[-int(rng.integers(1, len(store))):])
+        elif rng.random() < 0.1:
+            store.clear()
+
+        # Reading only some of the time lets several changes pile up between recomputations.
+        if rng.random() < 0.3:
+            assert_store_matches(store)
+
+    assert_store_matches(store)
+
+
+def test_extents_with_repeated_components_and_bounded_heaps() -> None:
+
+    rng = np.random.default_rng(0)
+    store = VectorStore()
+    store.extend([f"v{i}" for i in range(100)], rng.integers(-3, 4, size=(100, 2)).astype(float))
+
+    # Edge values shared by many vectors only leave the extents once every one of them is gone.
+    for i in range(100000):
+        name = f"v{rng.integers(100)}"
+        store[name] = rng.integers(-3, 4, size=2).astype(float)
+        if i % 997 == 0:
+            assert_store_matches(store)
+
+    assert len(store._heaps[0]) <= 3 * len(store) + 16
+    assert_store_matches(store)
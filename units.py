@@ -0,0 +1,130 @@
+"""
+VectorSim units - Conversion factor tables for the magnitudes and angles of every quantity the cases work with
+
+Magnitudes convert through the SI unit of their quantity and angles through degrees counterclockwise from the
+positive X axis, which is what the engine solves in. Every conversion takes one unit name or an array of them, one
+per row of values, and converts whole arrays in one vectorized pass that looks each distinct unit up only once.
+"""
+import re
+from collections.abc import Sequence
+
+import numpy as np
+
+# Factors to the SI unit of each quantity, which is listed first.
+QUANTITIES: dict[str, dict[str, float]] = {
+    "displacement": {"m": 1., "cm": 0.01, "km": 1000., "in": 0.0254, "ft": 0.3048, "mi": 1609.344},
+    "velocity": {"m/s": 1., "km/h": 1 / 3.6, "ft/s": 0.3048, "mph": 0.44704},
+    "acceleration": {"m/s^2": 1., "ft/s^2": 0.3048, "g": 9.80665},
+    "force": {"N": 1., "kN": 1000., "lbf": 4.4482216152605}
+}
+
+# Degrees counterclockwise from +X are offset + scale * value. Bearings are degrees clockwise from north.
+ANGLE_UNITS: dict[str, tuple[float, float]] = {
+    "deg": (1., 0.),
+    "rad": (180 / np.pi, 0.),
+    "grad": (0.9, 0.),
+    "bearing": (-1., 90.)
+}
+
+QUANTITY_OF: dict[str, str] = {unit: quantity for quantity, table in QUANTITIES.items() for unit in table}
+
+# Factor and quantity number of every magnitude unit, with NaN for values that have no unit of their own.
+MAGNITUDE_TABLE: dict[str, tuple[float, float]] = {
+    "": (np.nan, np.nan),
+    **{unit: (factor, number) for number, table in enumerate(QUANTITIES.values()) for unit, factor in table.items()}
+}
+ANGLE_TABLE: dict[str, tuple[float, float]] = {"": ANGLE_UNITS["deg"], **ANGLE_UNITS}
+
+NUMBER = re.compile(r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(\S*)\s*$")
+
+Units = str | None | Sequence[str | None] | np.ndarray
+
+
+def split(text: str) -> tuple[float, str | None]:
+    """
+    Splits an entry such as "12.5 km", "3e2ft" or "-40" into its number and its unit, or None without one.
+
+    Raises ValueError if the entry is not a number with an optional unit.
+    """
+    match = NUMBER.match(text)
+
+    if match is None:
+        raise ValueError(f"\"{text}\" is not a number")
+
+    return float(match[1]), match[2] or None
+
+
+def lookup(units: Units, table: dict[str, tuple[float, float]], kind: str) -> np.ndarray:
+    """
+    Table rows of one unit, or of an array of units found with one pass over their distinct names. None and "" select
+    the row of "".
+    """
+    if units is None or isinstance(units, str):
+        names = np.array(units or "")
+    elif isinstance(units, np.ndarray) and units.dtype.kind == "U":
+        names = units
+    else:
+        names = np.array([unit or "" for unit in units], dtype=str)
+
+    distinct, inverse = np.unique(names, return_inverse=True)
+
+    for name in distinct.tolist():
+        if name not in table:
+            raise ValueError(f"Unknown {kind} unit \"{name}\", expected one of {', '.join(unit for unit in table if unit)}")
+
+    return np.array([table[name] for name in distinct.tolist()]).reshape(-1, 2)[inverse.reshape(names.shape)]
+
+
+def factors(units: Units) -> np.ndarray:
+    """
+    SI factors of one magnitude unit or of an array of them, with NaN for values that have no unit.
+    """
+    return lookup(units, MAGNITUDE_TABLE, "magnitude")[..., 0]
+
+
+def per_row(factors: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Reshapes one factor per row so it broadcasts over values of shape (M, ...).
+    """
+    return factors.reshape(factors.shape + (1,) * (values.ndim - factors.ndim))
+
+
+def convert(values: np.ndarray | float, from_units: Units, to_unit: str) -> np.ndarray:
+    """
+    Converts magnitudes or components from their units, one or one per row, to a single unit of the same quantity.
+    Values without a unit of their own are taken to be in the target unit already.
+    """
+    values = np.asarray(values, dtype=float)
+
+    if to_unit not in QUANTITY_OF:
+        raise ValueError(f"Unknown magnitude unit \"{to_unit}\", expected one of {', '.join(QUANTITY_OF)}")
+
+    target_factor, target_quantity = MAGNITUDE_TABLE[to_unit]
+    rows = lookup(from_units, MAGNITUDE_TABLE, "magnitude")
+    factor, quantity = rows[..., 0], rows[..., 1]
+
+    if np.any(quantity[~np.isnan(quantity)] != target_quantity):
+        raise ValueError(f"Units must be {QUANTITY_OF[to_unit]} units like {to_unit}")
+
+    scale = np.where(np.isnan(factor), 1., factor / target_factor)
+    return values * per_row(scale, values)
+
+
+def to_degrees(values: np.ndarray | float, units: Units) -> np.ndarray:
+    """
+    Converts angles from their units, one or one per row, to degrees counterclockwise from +X. None means degrees.
+    """
+    values = np.asarray(values, dtype=float)
+    rows = lookup(units, ANGLE_TABLE, "angle")
+    return per_row(rows[..., 1], values) + per_row(rows[..., 0], values) * values
+
+
+def from_degrees(values: np.ndarray | float, units: Units) -> np.ndarray:
+    """
+    Converts angles in degrees counterclockwise from +X to their units, one or one per row, with bearings in [0, 360).
+    """
+    values = np.asarray(values, dtype=float)
+    rows = lookup(units, ANGLE_TABLE, "angle")
+    scale = per_row(rows[..., 0], values)
+    converted = (values - per_row(rows[..., 1], values)) / scale
+    return np.where(scale < 0, converted % 360, converted)
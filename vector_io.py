@@ -0,0 +1,124 @@
+"""
+VectorSim vector files - Loads named vectors from CSV and NumPy files
+
+CSV files hold one vector per line as name, X / R, Y / theta, with an optional header line. Lines with only two
+columns are named after the file. NumPy .npy files hold an (N, 2) array, and .npz archives hold a "vectors" array
+with an optional "names" array next to it.
+
+Vectors may come in mixed units: CSV files with a header can add unit and angle_unit columns anywhere, and .npz
+archives "units" and "angle_units" arrays. Blank units mean the units the vectors are loaded in.
+"""
+import csv
+from pathlib import Path
+
+import numpy as np
+
+import engine
+import units
+
+UNIT_COLUMNS = ("unit", "angle_unit")
+
+
+def default_names(path: str | Path, count: int) -> list[str]:
+    """
+    Names vectors without names after the file they came from, counting from 1.
+    """
+    stem = Path(path).stem
+    return [f"{stem}{i}" for i in range(1, count + 1)]
+
+
+def read_csv(path: str | Path) -> tuple[list[str] | None, np.ndarray, dict[str, np.ndarray]]:
+    """
+    Reads the names, if any, the two number columns and the unit columns named in the header of a CSV file.
+    """
+    with open(path, newline="") as file:
+        rows = [row for row in csv.reader(file) if row and any(field.strip() for field in row)]
+
+    if not rows:
+        return None, np.empty((0, 2)), {}
+
+    header = [field.strip().lower() for field in rows[0]]
+    unit_columns = {column: header.index(column) for column in UNIT_COLUMNS if column in header}
+    found: dict[str, np.ndarray] = {}
+
+    if unit_columns:
+        rows = rows[1:]
+        found = {column: np.array([row[index].strip() if index < len(row) else "" for row in rows], dtype=str) for column, index in unit_columns.items()}
+        rows = [[field for index, field in enumerate(row) if index not in unit_columns.values()] for row in rows]
+    else:
+        # A header line is the first line whose number columns are not numbers.
+        try:
+            np.array(rows[0][-2:], dtype=float)
+        except ValueError:
+            rows = rows[1:]
+
+    if any(len(row) != len(rows[0]) or len(row) not in (2, 3) for row in rows):
+        raise ValueError("Every line must have the same 2 or 3 columns!")
+
+    values = np.array([row[-2:] for row in rows], dtype=float).reshape(-1, 2)
+    names = [row[0].strip() for row in rows] if rows and len(rows[0]) == 3 else None
+    return names, values, found
+
+
+def read_numpy(path: str | Path) -> tuple[list[str] | None, np.ndarray, dict[str, np.ndarray]]:
+    """
+    Reads the vectors, and the names and units of .npz archives that have them, of a NumPy file.
+    """
+    data = np.load(path, allow_pickle=False)
+
+    if isinstance(data, np.ndarray):
+        return None, data, {}
+
+    with data:
+
+        if "vectors" not in data:
+            raise ValueError("Archive has no \"vectors\" array!")
+
+        names = [str(name) for name in data["names"]] if "names" in data else None
+        found = {column: data[f"{column}s"].astype(str) for column in UNIT_COLUMNS if f"{column}s" in data}
+        return names, data["vectors"], found
+
+
+def load_vectors(path: str | Path, polar: bool = False, unit: str | None = None, angle_unit: str = "deg") -> tuple[list[str], np.ndarray]:
+    """
+    Loads named vectors of shape (N, 2) from a .csv, .npy or .npz file.
+
+    With polar=True the two columns are magnitudes and angles, which are converted to X and Y components in one
+    vectorized pass. Magnitudes with units of their own are converted to unit, and angles without one are in
+    angle_unit.
+    """
+    if Path(path).suffix.lower() in (".npy", ".npz"):
+        names, values, found = read_numpy(path)
+    else:
+        names, values, found = read_csv(path)
+
+    values = np.asarray(values, dtype=float)
+
+    if values.ndim != 2 or values.shape[1] != 2:
+        raise ValueError(f"Vectors must have 2 columns, got an array of shape {values.shape}!")
+    if not np.isfinite(values).all():
+        raise ValueError("Vectors must be finite numbers!")
+
+    if names is None:
+        names = default_names(path, len(values))
+    elif len(names) != len(values):
+        raise ValueError("Every vector needs exactly one name!")
+    elif not all(names):
+        raise ValueError("Vector names must not be empty!")
+
+    if any(len(column) != len(values) for column in found.values()):
+        raise ValueError("Every vector needs exactly one unit!")
+
+    if "unit" in found and np.any(found["unit"] != ""):
+        if unit is None:
+            raise ValueError("Vectors with units need a unit to load them in!")
+        if polar:
+            values[:, 0] = units.convert(values[:, 0], found["unit"], unit)
+        else:
+            values = units.convert(values, found["unit"], unit)
+
+    if polar:
+        angle_units = np.where(found["angle_unit"] == "", angle_unit, found["angle_unit"]) if "angle_unit" in found else angle_unit
+        values = engine.from_polar(values[:, 0], units.to_degrees(values[:, 1], angle_units))
+
+    return names, values
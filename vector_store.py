@@ -0,0 +1,341 @@
+"""
+VectorSim vector store - Compact array-backed storage for named vectors
+"""
+import heapq
+from collections import Counter
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+import engine
+
+
+class VectorStore:
+    """
+    Named vectors kept in a growable contiguous (capacity, 2) float64 buffer with a name to row index.
+
+    Magnitudes and angles are cached next to the components when a vector is stored, so every column is available as a
+    zero-copy view. Removing a vector moves the last row into its place, which keeps removal O(1) but does not keep
+    insertion order.
+
+    The extents of the components are kept in a min-heap and a max-heap per axis with lazy deletion. A removed
+    component is only counted as deleted and leaves the heaps once it reaches the top, so keeping the extents costs
+    O(log N) per stored or removed vector and bulk imports are heapified in O(N). The heaps are rebuilt from the rows
+    in use once deleted entries make up most of them. Reordering rows leaves the extents as they are.
+
+    The tails of the vectors chained tip to tail are cumulative sums cached for a prefix of the rows. Changing a row
+    only cuts the prefix back to it, and the rows after it are summed again the next time the tails are read.
+    """
+    def __init__(self, capacity: int = 16, compensated: bool = False) -> None:
+
+        self._buffer = np.empty((max(capacity, 1), 2))
+        self._polar = np.empty((max(capacity, 1), 2))
+        self._tails = np.empty((max(capacity, 1), 2))
+        self._tails_valid = 0
+        self._names: list[str] = []
+        self._index: dict[str, int] = {}
+        self.running_resultant = engine.RunningSum(compensated=compensated)
+        # Smallest X, smallest Y, negated largest X and negated largest Y, with the deleted entries of each heap.
+        self._heaps: list[list[float]] = [[], [], [], []]
+        self._deleted: list[Counter[float]] = [Counter(), Counter(), Counter(), Counter()]
+        return
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._buffer[self._index[name]].copy()
+
+    def __setitem__(self, name: str, vector: np.ndarray) -> None:
+        """
+        Adds a vector or replaces the vector stored under the same name.
+        """
+        if name in self._index:
+            row = self._index[name]
+            self.running_resultant.remove(self._buffer[row])
+            self._discard(self._buffer[row:row + 1])
+            self._invalidate_tails(row + 1)
+        else:
+            row = len(self._names)
+            self._reserve(row + 1)
+            self._names.append(name)
+            self._index[name] = row
+
+        self._buffer[row] = vector
+        self._polar[row] = engine.to_polar(self._buffer[row])
+        self.running_resultant.add(self._buffer[row])
+        self._push(self._buffer[row:row + 1])
+        return
+
+    def _push(self, vectors: np.ndarray) -> None:
+        """
+        Adds the components of vectors of shape (K, 2) already in the rows in use to the extent heaps, heapifying the
+        whole heap in O(N) when the batch is large next to it instead of pushing each component in O(log N).
+
+        Once deleted entries would outnumber the stored vectors twice over, the heaps are rebuilt from the rows in use
+        instead, which keeps them O(N) in size at an amortized O(1) per removal.
+        """
+        if len(self._heaps[0]) + len(vectors) > 3 * len(self._names) + 16:
+            self._heaps = [[], [], [], []]
+            self._deleted = [Counter(), Counter(), Counter(), Counter()]
+            vectors = self.xy
+
+        for k, heap in enumerate(self._heaps):
+            values = (vectors[:, k % 2] if k < 2 else -vectors[:, k % 2]).tolist()
+            if len(values) * 8 > len(heap):
+                heap.extend(values)
+                heapq.heapify(heap)
+            else:
+                for value in values:
+                    heapq.heappush(heap, value)
+
+        return
+
+    def _discard(self, vectors: np.ndarray) -> None:
+        """
+        Counts the components of vectors of shape (K, 2) being removed as deleted from the extent heaps.
+        """
+        for k, deleted in enumerate(self._deleted):
+            deleted.update((vectors[:, k % 2] if k < 2 else -vectors[:, k % 2]).tolist())
+
+        return
+
+    def _invalidate_tails(self, row: int) -> None:
+        """
+        Marks the tails from a row on stale, after a change to the row before it. Tails past the last row are never
+        kept, since growing the buffers only copies the rows in use.
+        """
+        self._tails_valid = min(self._tails_valid, row, len(self._names))
+        return
+
+    def _reserve(self, size: int) -> None:
+        """
+        Doubles the capacity of the buffers until they fit the requested number of rows.
+        """
+        capacity = len(self._buffer)
+
+        if size <= capacity:
+            return
+
+        while capacity < size:
+            capacity *= 2
+
+        for attribute in ("_buffer", "_polar", "_tails"):
+            buffer = np.empty((capacity, 2))
+            buffer[:len(self._names)] = getattr(self, attribute)[:len(self._names)]
+            setattr(self, attribute, buffer)
+
+        return
+
+    def extend(self, names: Iterable[str], vectors: np.ndarray) -> None:
+        """
+        Appends many new vectors of shape (N, 2) at once with a single vectorized polar conversion.
+        """
+        names = list(names)
+        vectors = np.asarray(vectors, dtype=float).reshape(-1, 2)
+
+        if len(names) != len(vectors):
+            raise ValueError("Every vector needs exactly one name!")
+        if len(set(names)) != len(names) or any(name in self._index for name in names):
+            raise ValueError("Vector names must be unique!")
+
+        start = len(self._names)
+        self._reserve(start + len(names))
+        self._buffer[start:start + len(names)] = vectors
+        self._polar[start:start + len(names), 0], self._polar[start:start + len(names), 1] = engine.to_polar(vectors)
+        self._names.extend(names)
+        self._index.update(zip(names, range(start, start + len(names))))
+
+        if len(vectors):
+            self.running_resultant.add(engine.resultant(vectors))
+            self._push(vectors)
+
+        return
+
+    def pop(self, name: str) -> np.ndarray:
+        """
+        Removes a vector by swapping the last row into its place and returns the removed vector.
+        """
+        row = self._index.pop(name)
+        last = len(self._names) - 1
+        vector = self._buffer[row].copy()
+        self._discard(vector[None])
+
+        if row != last:
+            self._buffer[row] = self._buffer[last]
+            self._polar[row] = self._polar[last]
+            self._names[row] = self._names[last]
+            self._index[self._names[row]] = row
+
+        self._names.pop()
+        self._invalidate_tails(row + 1)
+
+        if self._names:
+            self.running_resultant.remove(vector)
+        else:
+            self.running_resultant.reset()
+
+        return vector
+
+    def remove_many(self, names: Iterable[str]) -> None:
+        """
+        Removes many vectors at once by compacting the buffers, which keeps the remaining vectors in order.
+        """
+        rows = np.fromiter((self._index[name] for name in names), dtype=np.intp)
+
+        if len(rows) == 0:
+            return
+
+        keep = np.ones(len(self._names), dtype=bool)
+        keep[rows] = False
+        removed = engine.resultant(self._buffer[rows])
+        self._discard(self._buffer[rows])
+        count = int(keep.sum())
+
+        self._buffer[:count] = self.xy[keep]
+        self._polar[:count] = self._polar[:len(self._names)][keep]
+        self._names = [name for name, kept in zip(self._names, keep.tolist()) if kept]
+        self._index = dict(zip(self._names, range(count)))
+        self._invalidate_tails(int(rows.min()) + 1)
+
+        if self._names:
+            self.running_resultant.remove(removed)
+        else:
+            self.running_resultant.reset()
+
+        return
+
+    def move(self, name: str, row: int) -> None:
+        """
+        Moves a vector to another row, shifting the rows in between by one so the others keep their order.
+        """
+        old = self._index[name]
+        row = min(max(row, 0), len(self._names) - 1)
+
+        if row == old:
+            return
+
+        low, high = min(old, row), max(old, row)
+        order = np.roll(np.arange(low, high + 1), 1 if row < old else -1)
+        self._buffer[low:high + 1] = self._buffer[order]
+        self._polar[low:high + 1] = self._polar[order]
+        self._names[low:high + 1] = [self._names[i] for i in order.tolist()]
+        self._index.update(zip(self._names[low:high + 1], range(low, high + 1)))
+        self._invalidate_tails(low + 1)
+        return
+
+    def set_polar(self, name: str, magnitude: float, angle: float) -> None:
+        """
+        Overrides the cached magnitude and angle of a vector, for solvers that give signed magnitudes.
+        """
+        self._polar[self._index[name]] = magnitude, angle
+        return
+
+    def clear(self) -> None:
+        """
+        Removes every vector while keeping the allocated capacity.
+        """
+        self._names.clear()
+        self._index.clear()
+        self.running_resultant.reset()
+        self._heaps = [[], [], [], []]
+        self._deleted = [Counter(), Counter(), Counter(), Counter()]
+        self._tails_valid = 0
+        return
+
+    def row(self, name: str) -> int:
+        """
+        Current row of a vector in the column views.
+        """
+        return self._index[name]
+
+    @property
+    def names(self) -> list[str]:
+        """
+        Vector names in row order.
+        """
+        return self._names
+
+    @property
+    def xy(self) -> np.ndarray:
+        """
+        Zero-copy (N, 2) view of the X and Y components.
+        """
+        return self._buffer[:len(self._names)]
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._buffer[:len(self._names), 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._buffer[:len(self._names), 1]
+
+    @property
+    def magnitudes(self) -> np.ndarray:
+        return self._polar[:len(self._names), 0]
+
+    @property
+    def angles(self) -> np.ndarray:
+        """
+        Zero-copy view of the cached angles in degrees.
+        """
+        return self._polar[:len(self._names), 1]
+
+    @property
+    def resultant(self) -> np.ndarray:
+        """
+        Running resultant of every stored vector.
+        """
+        return self.running_resultant.value
+
+    @property
+    def extents(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Smallest and largest X and Y components of the stored vectors, or infinities while the store is empty.
+
+        Deleted components are popped off the top of each heap until a stored one is left.
+        """
+        if not self._names:
+            return np.full(2, np.inf), np.full(2, -np.inf)
+
+        for heap, deleted in zip(self._heaps, self._deleted):
+            while heap[0] in deleted:
+                deleted[heap[0]] -= 1
+                if not deleted[heap[0]]:
+                    del deleted[heap[0]]
+                heapq.heappop(heap)
+
+        return np.array(self._heaps[0][:1] + self._heaps[1][:1]), -np.array(self._heaps[2][:1] + self._heaps[3][:1])
+
+    @property
+    def tails(self) -> np.ndarray:
+        """
+        Zero-copy (N, 2) view of the tail of every vector when they are chained tip to tail from the origin in row
+        order, which sums only the rows after the cached prefix.
+        """
+        count = len(self._names)
+        start = min(self._tails_valid, count)
+
+        if start < count:
+            if start == 0:
+                self._tails[0] = 0.
+                start = 1
+            np.cumsum(self._buffer[start - 1:count - 1], axis=0, out=self._tails[start:count])
+            self._tails[start:count] += self._tails[start - 1]
+            self._tails_valid = count
+
+        return self._tails[:count]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Bytes held by the array buffers.
+        """
+        return self._buffer.nbytes + self._polar.nbytes + self._tails.nbytes
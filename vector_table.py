@@ -0,0 +1,318 @@
+"""
+VectorSim vector table - Virtualized Treeview that lists vector stores without one widget row per vector
+"""
+import tkinter as tk
+from tkinter import ttk
+
+import numpy as np
+
+import units
+from profiling import profiled
+from vector_store import VectorStore
+
+
+class VectorTable(ttk.Frame):
+    """
+    Table of vectors grouped into collapsible sections, each backed by a VectorStore.
+
+    Only the rows that fit on screen exist in the Treeview. They are reused while scrolling and their numbers are
+    formatted from the store columns when they come into view, so listing, sorting and selecting a hundred thousand
+    vectors costs about as much as listing a screenful. Selection is kept by vector name, so it survives scrolling,
+    sorting and collapsing sections.
+    """
+    COLUMNS: dict[str, str] = {"name": "Name", "x": "X", "y": "Y", "rm": "R", "r_theta": "\u03B8"}
+
+    def __init__(self, master: tk.Misc, page_size: int = 20) -> None:
+
+        super().__init__(master)
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self.tree = ttk.Treeview(master=self, columns=tuple(self.COLUMNS), show="tree headings", selectmode="none")
+        self.tree.grid(column=0, row=0, sticky="nsew")
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.scrollbar.grid(column=1, row=0, sticky="ns")
+
+        self.tree.column("#0", width=70, anchor="w")
+        self.tree.column("name", width=50, anchor="w")
+        for column, text in self.COLUMNS.items():
+            if column != "name":
+                self.tree.column(column, width=70, anchor="e")
+            self.tree.heading(column, text=text, command=lambda column=column: self.sort_by(column))
+
+        self.sections: dict[str, tuple[str, VectorStore]] = {}
+        self.open_sections: dict[str, bool] = {}
+        self.orders: dict[str, np.ndarray | None] = {}
+        self.angle_unit = "deg"
+        self.sort_column: str | None = None
+        self.sort_descending = False
+        self.selected: set[str] = set()
+        self.anchor: int | None = None
+        self.offset = 0
+        self.page_size = page_size
+        self.pool: list[str] = []
+        self.update_headings()
+
+        self.tree.bind("<ButtonPress-1>", self.on_click)
+        self.tree.bind("<Configure>", lambda event: self.after_idle(self.measure))
+        self.tree.bind("<MouseWheel>", lambda event: self.scroll(-3 if event.delta > 0 else 3))
+        self.tree.bind("<Button-4>", lambda event: self.scroll(-3))
+        self.tree.bind("<Button-5>", lambda event: self.scroll(3))
+        self.tree.bind("<Prior>", lambda event: self.scroll(-self.page_size))
+        self.tree.bind("<Next>", lambda event: self.scroll(self.page_size))
+        self.tree.bind("<Home>", lambda event: self.scroll(-self.total_rows()))
+        self.tree.bind("<End>", lambda event: self.scroll(self.total_rows()))
+        self.tree.bind("<Control-a>", lambda event: self.select_all())
+        return
+
+    def add_section(self, category: str, text: str, store: VectorStore) -> None:
+        """
+        Lists a vector store under a collapsible heading row.
+        """
+        self.sections[category] = (text, store)
+        self.open_sections[category] = True
+        self.orders[category] = None
+        self.render()
+        return
+
+    @profiled("table")
+    def refresh(self) -> None:
+        """
+        Re-reads the vector stores after they changed and redraws the visible rows.
+        """
+        for category in self.orders:
+            self.orders[category] = None
+
+        if self.selected:
+            self.selected = {name for name in self.selected if any(name in store for _, store in self.sections.values())}
+
+        self.render()
+        return
+
+    def selection(self) -> set[str]:
+        """
+        Names of the selected vectors.
+        """
+        return set(self.selected)
+
+    def select_all(self) -> str:
+
+        self.selected = {name for _, store in self.sections.values() for name in store}
+        self.render()
+        return "break"
+
+    def layout(self) -> list[tuple[str, int, int]]:
+        """
+        Virtual row of each section heading and the number of vector rows listed under it.
+        """
+        rows = []
+        start = 0
+        for category, (_, store) in self.sections.items():
+            count = len(store) if self.open_sections[category] else 0
+            rows.append((category, start, count))
+            start += count + 1
+        return rows
+
+    def total_rows(self) -> int:
+        return sum(count + 1 for _, _, count in self.layout())
+
+    def order(self, category: str) -> np.ndarray | None:
+        """
+        Store rows of a section in the current sort order, or None while unsorted.
+        """
+        store = self.sections[category][1]
+
+        if self.sort_column is None:
+            return None
+
+        if self.orders[category] is None or len(self.orders[category]) != len(store):
+
+            keys = {
+                "name": lambda: np.array(store.names, dtype=str),
+                "x": lambda: store.x,
+                "y": lambda: store.y,
+                "rm": lambda: store.magnitudes,
+                "r_theta": lambda: units.from_degrees(store.angles, self.angle_unit)
+            }
+            order = np.argsort(keys[self.sort_column](), kind="stable")
+            self.orders[category] = order[::-1] if self.sort_descending else order
+
+        return self.orders[category]
+
+    def locate(self, index: int) -> tuple[str, int | None]:
+        """
+        Section and store row shown at a virtual row, with None as the row of a section heading.
+        """
+        for category, start, count in self.layout():
+
+            if index == start:
+                return category, None
+
+            if start < index <= start + count:
+                order = self.order(category)
+                position = index - start - 1
+                return category, position if order is None else int(order[position])
+
+        raise IndexError(index)
+
+    def names_between(self, first: int, last: int) -> list[str]:
+        """
+        Names of the vector rows from one virtual row to another, both included.
+        """
+        first, last = min(first, last), max(first, last)
+        names = []
+
+        for category, start, count in self.layout():
+
+            begin, end = max(first, start + 1) - start - 1, min(last, start + count) - start
+
+            if begin < end:
+                store = self.sections[category][1]
+                order = self.order(category)
+                rows = np.arange(begin, end) if order is None else order[begin:end]
+                names.extend(store.names[row] for row in rows.tolist())
+
+        return names
+
+    def render(self) -> None:
+        """
+        Fills the pooled Treeview rows with the vectors in view.
+        """
+        total = self.total_rows()
+        self.offset = max(0, min(self.offset, total - self.page_size))
+
+        while len(self.pool) < self.page_size:
+            self.pool.append(self.tree.insert("", "end"))
+
+        selected_rows = []
+
+        for i, item in enumerate(self.pool):
+
+            index = self.offset + i
+
+            if i >= self.page_size or index >= total:
+                self.tree.detach(item)
+                continue
+
+            self.tree.move(item, "", i)
+            category, row = self.locate(index)
+            text, store = self.sections[category]
+
+            if row is None:
+                marker = "\u25BE" if self.open_sections[category] else "\u25B8"
+                self.tree.item(item, text=f"{marker} {text} ({len(store)})", values=("", "", "", "", ""))
+                continue
+
+            name = store.names[row]
+            x, y = store.xy[row]
+            angle = units.from_degrees(store.angles[row], self.angle_unit)
+            self.tree.item(item, text="", values=(name, f"{x: .6f}", f"{y: .6f}", f"{store.magnitudes[row]: .6f}", f"{angle: .6f}"))
+
+            if name in self.selected:
+                selected_rows.append(item)
+
+        self.tree.selection_set(selected_rows)
+
+        if total:
+            self.scrollbar.set(self.offset / total, min(self.offset + self.page_size, total) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+        return
+
+    def measure(self) -> None:
+        """
+        Resizes the row pool to the number of rows that fit in the Treeview.
+        """
+        if not self.pool or not self.tree.bbox(self.pool[0]):
+            return
+
+        _, top, _, height = self.tree.bbox(self.pool[0])
+        page_size = max(1, (self.tree.winfo_height() - top) // max(height, 1))
+
+        if page_size != self.page_size:
+            self.page_size = page_size
+            self.render()
+
+        return
+
+    def scroll(self, rows: int) -> str:
+
+        self.offset += rows
+        self.render()
+        return "break"
+
+    def yview(self, *args: str) -> None:
+        """
+        Scrollbar command.
+        """
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * self.total_rows())
+        elif args[0] == "scroll":
+            self.offset += int(args[1]) * (self.page_size if args[2] == "pages" else 1)
+
+        self.render()
+        return
+
+    def sort_by(self, column: str) -> None:
+        """
+        Sorts every section by a column, toggling between ascending and descending order on repeated clicks.
+        """
+        self.sort_descending = not self.sort_descending if column == self.sort_column else False
+        self.sort_column = column
+        self.update_headings()
+        self.refresh()
+        return
+
+    def set_angle_unit(self, unit: str) -> None:
+        """
+        Shows the angles converted from degrees counterclockwise from +X to another angle unit.
+        """
+        self.angle_unit = unit
+        self.update_headings()
+        self.refresh()
+        return
+
+    def update_headings(self) -> None:
+        """
+        Labels the angle column with its unit and the sorted column with the sort direction.
+        """
+        for name, text in self.COLUMNS.items():
+            unit = f" ({self.angle_unit})" if name == "r_theta" else ""
+            marker = (" \u25BC" if self.sort_descending else " \u25B2") if name == self.sort_column else ""
+            self.tree.heading(name, text=text + unit + marker)
+
+        return
+
+    def on_click(self, event: tk.Event) -> str:
+        """
+        Toggles sections and selects rows, extending the selection with Shift and toggling single rows with Control.
+        """
+        item = self.tree.identify_row(event.y)
+
+        if item not in self.pool:
+            return "break"
+
+        index = self.offset + self.pool.index(item)
+        category, row = self.locate(index)
+
+        if row is None:
+            self.open_sections[category] = not self.open_sections[category]
+            self.anchor = None
+            self.render()
+            return "break"
+
+        name = self.sections[category][1].names[row]
+
+        if event.state & 0x0001 and self.anchor is not None:
+            self.selected = set(self.names_between(self.anchor, index))
+        elif event.state & 0x0004:
+            self.selected ^= {name}
+            self.anchor = index
+        else:
+            self.selected = {name}
+            self.anchor = index
+
+        self.tree.focus_set()
+        self.render()
+        return "break"